@@ -10,6 +10,7 @@ from app.core.database import get_db
 from app.models.user import User
 from app.models.account import ConnectedAccount
 from app.api.v1.endpoints.auth import get_current_user
+from app.services.account_index import account_index
 from app.schemas.account import AccountCreate, AccountResponse, AccountListResponse
 
 router = APIRouter()
@@ -125,6 +126,9 @@ async def create_account(
             detail=f"Platform {account_data.platform} integration not yet implemented.",
         )
     
+    # Make the account visible to the ingest endpoints
+    account_index.add(account)
+    
     return AccountResponse(
         id=account.id,
         userId=account.user_id,
@@ -195,6 +199,7 @@ async def delete_account(
     
     account.is_active = False
     db.commit()
+    account_index.remove(account.id)
     
     return None
 
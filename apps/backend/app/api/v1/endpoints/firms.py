@@ -4,9 +4,12 @@ Prop firm information endpoints.
 Provides information about supported firms and their rules.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from rules_engine.interface import AccountSnapshot
+from app.api.v1.endpoints.auth import get_current_user
+from app.models.user import User
 from app.schemas.firm import FirmInfo, FirmListResponse, AccountTypeInfo, AccountTypeListResponse
-from app.services.rule_loader import RuleLoaderService
+from app.services.engine_registry import engine_registry
 
 router = APIRouter()
 
@@ -21,8 +24,7 @@ async def list_firms():
     - Supported account types
     - Rules summary
     """
-    rule_loader = RuleLoaderService()
-    supported_firms = rule_loader.get_supported_firms()
+    supported_firms = engine_registry.get_supported_firms()
     
     firms = []
     
@@ -141,6 +143,57 @@ async def list_account_types():
     return AccountTypeListResponse(account_types=account_types)
 
 
+@router.post("/compare")
+async def compare_firms(snapshot: AccountSnapshot, version: str = "1.0"):
+    """
+    Evaluate one account snapshot under every firm and account type.
+
+    Lets a trader see how their current account would fare under each
+    firm's rules. Rules shared between firms are evaluated once.
+
+    Returns:
+        Risk level, max allowed risk and rule states per "firm/account_type"
+    """
+    comparison = await engine_registry.get_comparison(version)
+    results = comparison.evaluate(snapshot)
+
+    return {
+        "accountId": snapshot.account_id,
+        "results": {
+            label: {
+                "riskLevel": result.overall_risk_level,
+                "maxAllowedRisk": {
+                    name: float(value) for name, value in result.max_allowed_risk.items()
+                },
+                "ruleStates": {
+                    name: {
+                        "status": state.status,
+                        "remainingBuffer": float(state.remaining_buffer),
+                        "bufferPercent": float(state.buffer_percent),
+                    }
+                    for name, state in result.rule_states.items()
+                },
+            }
+            for label, result in results.items()
+        },
+    }
+
+
+@router.post("/rules/reload")
+async def reload_rules(
+    version: str = "1.0",
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Reload every rule set and rebuild the shared rule engines.
+
+    Call after rule sets are edited or re-versioned; otherwise engines
+    built from the old rules stay cached for the life of the process.
+    """
+    engines = await engine_registry.reload(version)
+    return {"success": True, "engines": engines}
+
+
 @router.get("/{firm_id}/rules")
 async def get_firm_rules(firm_id: str, account_type: str = "eval"):
     """
@@ -153,10 +206,8 @@ async def get_firm_rules(firm_id: str, account_type: str = "eval"):
     Returns:
         Detailed rule set
     """
-    rule_loader = RuleLoaderService()
-    
     try:
-        rules = await rule_loader.get_rules(firm_id, account_type)
+        rules = await engine_registry.get_rules(firm_id, account_type)
         
         # Convert to dict for response
         rules_dict = {}
@@ -8,6 +8,9 @@ from typing import List
 import uuid
 from decimal import Decimal
 
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.simulation import PnlDistribution
+
 from app.core.database import get_db
 from app.models.user import User
 from app.models.account import ConnectedAccount
@@ -22,8 +25,14 @@ from app.schemas.group import (
     GroupRiskEvaluation,
     RuleStateSummary,
     GroupMember,
+    RiskOfRuinRequest,
+    AccountRiskOfRuin,
+    GroupRiskOfRuin,
 )
 from app.services.account_tracker import account_tracker
+from app.services.engine_registry import engine_registry
+from app.services.risk_simulator import risk_simulator
+from app.core.config import settings
 
 router = APIRouter()
 
@@ -529,3 +538,92 @@ async def get_group_risk(
     evaluation.timestamp = group.updated_at.isoformat() if group.updated_at else group.created_at.isoformat()
 
     return evaluation
+
+
+@router.post("/{group_id}/risk-of-ruin", response_model=GroupRiskOfRuin)
+async def get_group_risk_of_ruin(
+    group_id: str,
+    request: RiskOfRuinRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Simulate the probability of each account in the group breaching a
+    loss rule before reaching its profit target.
+
+    Accounts start from their latest stored snapshot; accounts without one
+    are skipped.
+    """
+    group = (
+        db.query(AccountGroup)
+        .filter(AccountGroup.id == group_id, AccountGroup.user_id == current_user.id)
+        .first()
+    )
+
+    if not group:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Group not found"
+        )
+
+    distribution = PnlDistribution(
+        per=request.per,
+        mean=request.meanPnl,
+        std=request.stdPnl,
+        trades_per_day=request.tradesPerDay,
+    )
+
+    jobs = []
+    accounts = []
+    for account in group.accounts:
+        latest_snapshot = (
+            db.query(AccountStateSnapshot)
+            .filter(AccountStateSnapshot.account_id == account.id)
+            .order_by(AccountStateSnapshot.timestamp.desc())
+            .first()
+        )
+        if not latest_snapshot:
+            continue
+
+        snapshot = AccountSnapshot(
+            account_id=account.id,
+            timestamp=latest_snapshot.timestamp,
+            equity=Decimal(str(latest_snapshot.equity)),
+            balance=Decimal(str(latest_snapshot.balance)),
+            realized_pnl=Decimal(str(latest_snapshot.realized_pnl or 0)),
+            unrealized_pnl=Decimal(str(latest_snapshot.unrealized_pnl or 0)),
+            high_water_mark=Decimal(str(latest_snapshot.high_water_mark)),
+            daily_pnl=Decimal(str(latest_snapshot.daily_pnl or 0)),
+            starting_balance=Decimal(str(account.account_size)) / Decimal("100"),
+            open_positions=[
+                PositionSnapshot(**pos) for pos in latest_snapshot.open_positions or []
+            ],
+        )
+        engine = await engine_registry.get_engine(
+            account.firm, account.account_type, account.rule_set_version
+        )
+        jobs.append((engine, snapshot, distribution))
+        accounts.append(account)
+
+    paths = request.paths or settings.RISK_OF_RUIN_PATHS
+    results = await risk_simulator.simulate(
+        jobs, paths=paths, horizon_days=request.horizonDays, seed=request.seed
+    )
+
+    return GroupRiskOfRuin(
+        groupId=group.id,
+        paths=paths,
+        horizonDays=request.horizonDays,
+        accounts=[
+            AccountRiskOfRuin(
+                accountId=account.id,
+                accountName=account.account_name,
+                ruinProbability=result.ruin_probability,
+                targetProbability=result.target_probability,
+                unresolvedProbability=result.unresolved_probability,
+                breachProbabilities=result.breach_probabilities,
+                meanDaysToRuin=result.mean_days_to_ruin,
+                meanDaysToTarget=result.mean_days_to_target,
+            )
+            for account, result in zip(accounts, results)
+        ],
+    )
@@ -4,34 +4,76 @@ NinjaTrader Add-On endpoint for receiving account data.
 This endpoint receives data from the NinjaTrader Add-On and processes it.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Header
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from typing import Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from decimal import Decimal
 import logging
 
 from app.core.database import get_db
 from app.models.account import ConnectedAccount
+from app.schemas.ninjatrader import (
+    AccountUpdateMessage,
+    InvalidAccountUpdate,
+    describe_error,
+    parse_account_update,
+    parse_account_updates,
+)
+from app.services.account_index import IndexedAccount, account_index
 from app.services.account_tracker import account_tracker
-from rules_engine.interface import AccountSnapshot, PositionSnapshot
-from rules_engine.engine import RuleEngine
-from app.services.rule_loader import RuleLoaderService
+from rules_engine.interface import AccountSnapshot, RuleEvaluationResult
+from rules_engine.cache import EvaluationCache
+from rules_engine.instruments import violation_prices
+from app.services.engine_registry import engine_registry
+from app.services.mae_tracker import mae_tracker
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# The add-on posts every 300 ms even when nothing changed; reuse the last
+# evaluation per account while its snapshot fingerprint is unchanged.
+evaluation_cache = EvaluationCache()
+
+
+def _evaluation_response(engine, snapshot: AccountSnapshot, result: RuleEvaluationResult) -> dict:
+    """Risk level, rule states and death lines returned to the add-on."""
+    return {
+        "riskLevel": result.overall_risk_level,
+        "ruleStates": {
+            name: {
+                "status": state.status,
+                "remainingBuffer": float(state.remaining_buffer),
+                "bufferPercent": float(state.buffer_percent),
+            }
+            for name, state in result.rule_states.items()
+        },
+        # Price per position at which each rule would be violated, so the
+        # add-on can draw it on the chart between updates. The add-on's daily
+        # PnL is realized (from fills), so there is no daily loss limit line.
+        "deathLines": [
+            {
+                "symbol": level.symbol,
+                "quantity": level.quantity,
+                "prices": {name: float(price) for name, price in level.prices.items()},
+                "ticks": level.ticks,
+            }
+            for level in violation_prices(engine, snapshot)
+        ],
+    }
+
 
 @router.post("/account-update")
 async def receive_ninjatrader_account_update(
-    data: dict,
+    request: Request,
     authorization: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     """
     Receive account update from NinjaTrader Add-On.
     
-    Matches AccountUpdateMessage schema from add-on.
+    Matches AccountUpdateMessage schema from add-on; the body is validated
+    straight from the raw bytes (see app.schemas.ninjatrader).
     
     This endpoint:
     1. Receives AccountUpdateMessage from NinjaTrader
@@ -42,121 +84,66 @@ async def receive_ninjatrader_account_update(
     6. Pushes updates via WebSocket
     
     Backend is source of truth for HWM and daily PnL history.
+    
+    An unregistered account gets 404 with Retry-After; repeats within that
+    time are answered from the account index's negative cache.
     """
     try:
-        # Extract account ID
-        account_id = data.get("accountId")
-        if not account_id:
+        # Parse the AccountUpdateMessage
+        try:
+            message = parse_account_update(await request.body())
+        except ValidationError as e:
+            logger.error(f"Error parsing AccountUpdateMessage: {describe_error(e)}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Missing accountId",
+                detail=f"Error parsing account data: {describe_error(e)}",
             )
+        account_id = message.account_id
 
         logger.info(f"Received data from NinjaTrader account: {account_id}")
 
-        # Find connected account
-        # Try exact match first
-        connected_account = db.query(ConnectedAccount).filter(
-            ConnectedAccount.account_id == account_id,
-            ConnectedAccount.platform == "ninjatrader",
-            ConnectedAccount.is_active == True,
-        ).first()
+        # Find connected account (in-memory index, case-insensitive)
+        connected_account = account_index.get("ninjatrader", account_id)
 
-        # If not found, try case-insensitive match
         if not connected_account:
-            connected_account = db.query(ConnectedAccount).filter(
-                ConnectedAccount.account_id.ilike(account_id),
-                ConnectedAccount.platform == "ninjatrader",
-                ConnectedAccount.is_active == True,
-            ).first()
+            # Recently reported unknown: answer without logging again
+            retry_after = account_index.retry_after("ninjatrader", account_id)
+            if retry_after is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Account '{account_id}' not found. Retry after {retry_after}s",
+                    headers={"Retry-After": str(retry_after)},
+                )
 
-        if not connected_account:
             # Log available accounts for debugging
-            available_accounts = db.query(ConnectedAccount).filter(
-                ConnectedAccount.platform == "ninjatrader",
-                ConnectedAccount.is_active == True,
-            ).all()
-            available_ids = [acc.account_id for acc in available_accounts]
+            available_ids = account_index.account_ids("ninjatrader")
+            retry_after = account_index.mark_unknown("ninjatrader", account_id)
             
             logger.warning(f"Account '{account_id}' not found. Available: {available_ids}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Account '{account_id}' not found. Available accounts: {available_ids}",
+                headers={"Retry-After": str(retry_after)},
             )
 
         logger.info(f"Found connected account: {connected_account.id} ({connected_account.account_name})")
 
         # Convert to AccountSnapshot
-        try:
-            timestamp_str = data.get("timestamp", "")
-            if timestamp_str.endswith("Z"):
-                timestamp_str = timestamp_str.replace("Z", "+00:00")
-            
-            # Parse timestamp (can be Unix milliseconds or ISO string)
-            timestamp_value = data.get("timestamp", 0)
-            if isinstance(timestamp_value, (int, float)):
-                # Unix timestamp in milliseconds
-                timestamp = datetime.utcfromtimestamp(timestamp_value / 1000.0)
-            else:
-                # ISO string
-                timestamp_str = str(timestamp_value)
-                if timestamp_str.endswith("Z"):
-                    timestamp_str = timestamp_str.replace("Z", "+00:00")
-                timestamp = datetime.fromisoformat(timestamp_str)
-            
-            # Convert daily PnL history from add-on
-            daily_pnl_history = {}
-            if "dailyPnlHistory" in data and data["dailyPnlHistory"]:
-                daily_pnl_history = {
-                    str(k): Decimal(str(v))
-                    for k, v in data["dailyPnlHistory"].items()
-                }
-            
-            snapshot = AccountSnapshot(
-                account_id=connected_account.id,  # Use internal ID
-                timestamp=timestamp,
-                equity=Decimal(str(data.get("equity", 0))),
-                balance=Decimal(str(data.get("balance", data.get("equity", 0)))),
-                realized_pnl=Decimal(str(data.get("realizedPnl", data.get("realizedPnL", 0)))),
-                unrealized_pnl=Decimal(str(data.get("unrealizedPnl", data.get("unrealizedPnL", 0)))),
-                # HWM will be updated by backend (source of truth)
-                high_water_mark=Decimal(str(data.get("highWaterMark", data.get("equity", 0)))),
-                daily_pnl=Decimal(str(data.get("dailyPnl", data.get("dailyPnL", 0)))),
-                starting_balance=Decimal(str(connected_account.account_size)) / Decimal("100"),
-                open_positions=[
-                    PositionSnapshot(
-                        symbol=pos.get("symbol", "UNKNOWN"),
-                        quantity=int(pos.get("quantity", 0)),
-                        avg_price=Decimal(str(pos.get("avgPrice", 0))),
-                        current_price=Decimal(str(pos.get("currentPrice", pos.get("avgPrice", 0)))),
-                        unrealized_pnl=Decimal(str(pos.get("unrealizedPnl", pos.get("unrealizedPnL", 0)))),
-                        opened_at=datetime.fromtimestamp(
-                            pos.get("openedAt", int(datetime.utcnow().timestamp() * 1000)) / 1000.0
-                        ) if isinstance(pos.get("openedAt"), (int, float)) else datetime.fromisoformat(
-                            pos.get("openedAt", datetime.utcnow().isoformat()).replace("Z", "+00:00")
-                        ),
-                        peak_unrealized_loss=Decimal(str(pos.get("peakUnrealizedLoss", 0))),
-                    )
-                    for pos in data.get("openPositions", [])
-                ],
-                daily_pnl_history=daily_pnl_history,
-            )
-        except Exception as e:
-            logger.error(f"Error converting to AccountSnapshot: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Error parsing account data: {str(e)}",
-            )
+        snapshot = message.to_snapshot(
+            connected_account.id,  # Use internal ID
+            Decimal(connected_account.account_size) / Decimal("100"),
+        )
+
+        # Fill in server-tracked peak unrealized loss per position (MAE)
+        snapshot = mae_tracker.apply(snapshot)
 
         # Load rules and evaluate
-        rule_loader = RuleLoaderService()
-        rules = await rule_loader.get_rules(
+        engine = await engine_registry.get_engine(
             connected_account.firm,
             connected_account.account_type,
             connected_account.rule_set_version,
         )
-        engine = RuleEngine(rules)
-        result = engine.evaluate(snapshot)
+        result = evaluation_cache.evaluate(engine, snapshot)
 
         logger.info(f"Rule evaluation complete. Risk level: {result.overall_risk_level}")
 
@@ -167,21 +154,11 @@ async def receive_ninjatrader_account_update(
             db, 
             snapshot=snapshot, 
             result=result,
-            daily_pnl_history=daily_pnl_history
+            daily_pnl_history=snapshot.daily_pnl_history,
+            account=connected_account,
         )
 
-        return {
-            "success": True,
-            "riskLevel": result.overall_risk_level,
-            "ruleStates": {
-                name: {
-                    "status": state.status,
-                    "remainingBuffer": float(state.remaining_buffer),
-                    "bufferPercent": float(state.buffer_percent),
-                }
-                for name, state in result.rule_states.items()
-            },
-        }
+        return {"success": True, **_evaluation_response(engine, snapshot, result)}
 
     except HTTPException:
         raise
@@ -193,10 +170,120 @@ async def receive_ninjatrader_account_update(
         )
 
 
+async def process_account_updates(
+    messages: Sequence[Union[AccountUpdateMessage, InvalidAccountUpdate]], db: Session
+) -> List[dict]:
+    """
+    Resolve, evaluate and store AccountUpdateMessages of many accounts.
+
+    Accounts are resolved from the account index, snapshots sharing a rule
+    set are evaluated together, and every snapshot and audit row is stored
+    in one transaction. Returns one result per message, in order; a message
+    for an unknown account or that failed validation gets an error entry and
+    does not fail the others. Unknown accounts' entries carry retryAfter
+    (seconds).
+
+    Used by the batch endpoint and the WebSocket ingest channel.
+    """
+    results: List[dict] = [{} for _ in messages]
+    groups: Dict[Tuple[str, str, Optional[str]], List[Tuple[int, IndexedAccount, AccountSnapshot]]] = {}
+    for index, message in enumerate(messages):
+        account_id = message.account_id
+        if isinstance(message, InvalidAccountUpdate):
+            results[index] = {
+                "accountId": account_id,
+                "success": False,
+                "error": f"Error parsing account data: {message.error}",
+            }
+            continue
+        connected_account = account_index.get("ninjatrader", account_id)
+        if connected_account is None:
+            retry_after = account_index.retry_after("ninjatrader", account_id)
+            if retry_after is None:
+                logger.warning(f"Account '{account_id}' not found")
+                retry_after = account_index.mark_unknown("ninjatrader", account_id)
+            results[index] = {
+                "accountId": account_id,
+                "success": False,
+                "error": f"Account '{account_id}' not found",
+                "retryAfter": retry_after,
+            }
+            continue
+        snapshot = message.to_snapshot(
+            connected_account.id, Decimal(connected_account.account_size) / Decimal("100")
+        )
+
+        # Fill in server-tracked peak unrealized loss per position (MAE)
+        snapshot = mae_tracker.apply(snapshot)
+        key = (connected_account.firm, connected_account.account_type, connected_account.rule_set_version)
+        groups.setdefault(key, []).append((index, connected_account, snapshot))
+
+    # Evaluate each rule set's snapshots together
+    evaluated = []
+    for (firm, account_type, rule_set_version), members in groups.items():
+        engine = await engine_registry.get_engine(firm, account_type, rule_set_version)
+        group_results = evaluation_cache.evaluate_many(engine, [snapshot for _, _, snapshot in members])
+        for (index, connected_account, snapshot), result in zip(members, group_results):
+            evaluated.append((index, engine, connected_account, snapshot, result))
+
+    # Store snapshots in one transaction (backend tracks HWM and daily PnL history)
+    await account_tracker.update_account_states(
+        db, [(connected_account, snapshot, result) for _, _, connected_account, snapshot, result in evaluated]
+    )
+
+    for index, engine, connected_account, snapshot, result in evaluated:
+        results[index] = {
+            "accountId": messages[index].account_id,
+            "success": True,
+            **_evaluation_response(engine, snapshot, result),
+        }
+    return results
+
+
+@router.post("/account-updates")
+async def receive_ninjatrader_account_updates(
+    request: Request,
+    authorization: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Receive updates of many accounts from one NinjaTrader Add-On in one request.
+
+    Takes an array of AccountUpdateMessage, as posted one at a time to
+    /account-update, and returns one result per message (see
+    process_account_updates).
+    """
+    try:
+        messages = parse_account_updates(await request.body())
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Expected an array of AccountUpdateMessage: {describe_error(e)}",
+        )
+
+    try:
+        results = await process_account_updates(messages, db)
+        processed = sum(1 for result in results if result["success"])
+        logger.info(f"Processed {processed}/{len(messages)} NinjaTrader account updates")
+        return {"success": True, "results": results}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error processing account batch: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error processing account data: {str(e)}",
+        )
+
 @router.get("/health")
 async def health_check():
     """Health check for NinjaTrader endpoint."""
-    return {"status": "ok", "service": "ninjatrader-endpoint"}
+    return {
+        "status": "ok",
+        "service": "ninjatrader-endpoint",
+        "evaluationCache": evaluation_cache.stats(),
+        "engines": engine_registry.size,
+    }
 
 
 @router.get("/debug/accounts")
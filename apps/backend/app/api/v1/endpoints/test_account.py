@@ -16,8 +16,7 @@ from app.models.account import ConnectedAccount
 from app.api.v1.endpoints.auth import get_current_user
 from app.services.account_tracker import account_tracker
 from rules_engine.interface import AccountSnapshot, PositionSnapshot
-from rules_engine.engine import RuleEngine
-from app.services.rule_loader import RuleLoaderService
+from app.services.engine_registry import engine_registry
 
 router = APIRouter()
 
@@ -52,8 +51,8 @@ async def simulate_account_data(
         )
     
     # Load rules
-    rule_loader = RuleLoaderService()
-    rules = await rule_loader.get_rules(account.firm, account.account_type, account.rule_set_version)
+    engine = await engine_registry.get_engine(account.firm, account.account_type, account.rule_set_version)
+    rules = engine.rules
     
     # Calculate scenario values
     starting_balance = Decimal(account.account_size) / Decimal("100")
@@ -128,7 +127,6 @@ async def simulate_account_data(
     )
     
     # Evaluate rules
-    engine = RuleEngine(rules)
     result = engine.evaluate(snapshot)
     
     # Update account state
@@ -3,13 +3,19 @@ WebSocket endpoints for real-time updates.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from pydantic import ValidationError
 from typing import Dict, Set
 import json
 import asyncio
+import logging
 
+from app.api.v1.endpoints.ninjatrader import process_account_updates
+from app.core.database import SessionLocal
+from app.schemas.ninjatrader import describe_error, parse_account_updates
 from app.services.account_tracker import AccountTrackerService
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # WebSocket connection manager
 class ConnectionManager:
@@ -77,6 +83,48 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+@router.websocket("/ninjatrader/ingest")
+async def ninjatrader_ingest_endpoint(websocket: WebSocket):
+    """
+    Persistent ingest channel for the NinjaTrader Add-On.
+
+    The add-on keeps this socket open and sends each AccountUpdateMessage
+    (or an array of them) as a text frame instead of one HTTP request per
+    300 ms tick. Every update is answered on the same socket with an
+    "account_update_ack" carrying the /ninjatrader/account-update response
+    fields, or success=False with an error (and retryAfter for unknown
+    accounts). A frame that cannot be parsed or processed gets an "error"
+    frame and the connection stays open. One database session serves the
+    whole connection and is rolled back after a failed frame.
+    """
+    await websocket.accept()
+    db = SessionLocal()
+    try:
+        while True:
+            data = await websocket.receive_text()
+            # A bad frame is answered with an error frame; the socket stays open
+            try:
+                messages = parse_account_updates(data)
+                results = await process_account_updates(messages, db)
+            except ValidationError as e:
+                await websocket.send_json({"type": "error", "error": describe_error(e)})
+                continue
+            except Exception as e:
+                # Roll back so the next frame does not run on a failed transaction
+                db.rollback()
+                logger.error(f"Error processing streamed account data: {e}", exc_info=True)
+                await websocket.send_json(
+                    {"type": "error", "error": f"Error processing account data: {str(e)}"}
+                )
+                continue
+            for result in results:
+                await websocket.send_json({"type": "account_update_ack", **result})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        db.close()
+
+
 @router.websocket("/{account_id}")
 async def websocket_endpoint(websocket: WebSocket, account_id: str):
     """WebSocket endpoint for real-time account updates."""
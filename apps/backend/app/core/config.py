@@ -34,6 +34,19 @@ class Settings(BaseSettings):
     TRADOVATE_AUTH_URL: str = "https://www.tradovate.com/auth/accesstokenrequest"  # Auth endpoint
     TRADOVATE_WS_URL: str = "wss://www.tradovate.com/ws"  # WebSocket (if available)
 
+    # Risk-of-ruin simulation
+    RISK_OF_RUIN_PATHS: int = 10_000
+
+    # Per-position MAE tracking (empty path disables checkpointing)
+    MAE_CHECKPOINT_PATH: str = "./mae_state.json"
+    MAE_CHECKPOINT_SECONDS: float = 30.0
+
+    # How long add-ons posting for an unregistered account are told to back off
+    UNKNOWN_ACCOUNT_RETRY_SECONDS: int = 30
+
+    # Per-rule timing counters on shared engines (see /health/rule-timings)
+    RULE_PROFILING: bool = False
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -2,10 +2,19 @@
 Account group schemas.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from typing import List, Literal, Optional, Dict, Any
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
 
+from app.core.config import settings
+
+# Risk-of-ruin request limits. One account's simulation draws
+# paths * horizonDays * tradesPerDay float64 outcomes.
+MAX_RISK_OF_RUIN_PATHS = 100_000
+MAX_RISK_OF_RUIN_HORIZON_DAYS = 252  # one trading year
+MAX_RISK_OF_RUIN_TRADES_PER_DAY = 100
+MAX_RISK_OF_RUIN_DRAWS = 50_000_000  # 400 MB of float64 per account
+
 
 class GroupCreate(BaseModel):
     """Schema for creating an account group."""
@@ -78,3 +87,47 @@ class GroupRiskEvaluation(BaseModel):
     weakestAccountName: str
     ruleStates: Dict[str, RuleStateSummary]
     timestamp: str
+
+
+class RiskOfRuinRequest(BaseModel):
+    """Schema for a group risk-of-ruin simulation request."""
+
+    per: Literal["day", "trade"] = "day"
+    meanPnl: float = Field(allow_inf_nan=False)
+    stdPnl: float = Field(ge=0, allow_inf_nan=False)
+    tradesPerDay: int = Field(1, ge=1, le=MAX_RISK_OF_RUIN_TRADES_PER_DAY)
+    horizonDays: int = Field(20, ge=1, le=MAX_RISK_OF_RUIN_HORIZON_DAYS)
+    paths: Optional[int] = Field(None, ge=1, le=MAX_RISK_OF_RUIN_PATHS)  # Defaults to settings
+    seed: Optional[int] = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def _check_size(self):
+        paths = self.paths or settings.RISK_OF_RUIN_PATHS
+        steps = self.horizonDays * (self.tradesPerDay if self.per == "trade" else 1)
+        if paths * steps > MAX_RISK_OF_RUIN_DRAWS:
+            raise ValueError(
+                f"paths * horizonDays * tradesPerDay must not exceed {MAX_RISK_OF_RUIN_DRAWS}"
+            )
+        return self
+
+
+class AccountRiskOfRuin(BaseModel):
+    """Simulated outcome probabilities for one account."""
+
+    accountId: str
+    accountName: str
+    ruinProbability: float
+    targetProbability: float
+    unresolvedProbability: float
+    breachProbabilities: Dict[str, float]
+    meanDaysToRuin: Optional[float]
+    meanDaysToTarget: Optional[float]
+
+
+class GroupRiskOfRuin(BaseModel):
+    """Risk-of-ruin simulation results for every account in a group."""
+
+    groupId: str
+    paths: int
+    horizonDays: int
+    accounts: List[AccountRiskOfRuin]
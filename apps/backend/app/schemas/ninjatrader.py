@@ -0,0 +1,198 @@
+"""
+NinjaTrader Add-On message schemas.
+
+Mirror AccountUpdateMessage.cs. Messages are validated straight from the
+raw request or WebSocket bytes (pydantic-core's JSON parser), with amounts
+decoded to Decimal and dates to datetime in the same pass, then turned into
+engine snapshots without validating them a second time.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Union
+
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
+
+from rules_engine.history import DailyPnlHistory
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+
+
+class PositionMessage(BaseModel):
+    """Open position (PositionMessage in the add-on)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    symbol: str = "UNKNOWN"
+    quantity: int = 0  # Positive = long, negative = short
+    avg_price: Decimal = Field(
+        default=Decimal("0"), validation_alias=AliasChoices("avgPrice", "avg_price")
+    )
+    current_price: Optional[Decimal] = Field(
+        default=None, validation_alias=AliasChoices("currentPrice", "current_price")
+    )  # Defaults to avg_price
+    unrealized_pnl: Decimal = Field(
+        default=Decimal("0"), validation_alias=AliasChoices("unrealizedPnl", "unrealizedPnL", "unrealized_pnl")
+    )
+    opened_at: Optional[datetime] = Field(
+        default=None, validation_alias=AliasChoices("openedAt", "opened_at")
+    )  # Defaults to now
+    peak_unrealized_loss: Decimal = Field(
+        default=Decimal("0"), validation_alias=AliasChoices("peakUnrealizedLoss", "peak_unrealized_loss")
+    )
+
+    @field_validator("opened_at", mode="before")
+    @classmethod
+    def _opened_at(cls, value):
+        # Unix milliseconds (local time, as the add-on has always been read)
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value / 1000.0)
+        if isinstance(value, str) and value.endswith("Z"):
+            return value[:-1] + "+00:00"
+        return value
+
+    def to_snapshot(self) -> PositionSnapshot:
+        return PositionSnapshot.model_construct(
+            symbol=self.symbol,
+            quantity=self.quantity,
+            avg_price=self.avg_price,
+            current_price=self.avg_price if self.current_price is None else self.current_price,
+            unrealized_pnl=self.unrealized_pnl,
+            opened_at=self.opened_at if self.opened_at is not None else datetime.utcnow(),
+            peak_unrealized_loss=self.peak_unrealized_loss,
+        )
+
+
+class AccountUpdateMessage(BaseModel):
+    """Account update posted by the add-on every 300 ms (AccountUpdateMessage.cs)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    account_id: str = Field(min_length=1, validation_alias=AliasChoices("accountId", "account_id"))
+    timestamp: datetime
+    equity: Decimal = Decimal("0")
+    balance: Optional[Decimal] = None  # Defaults to equity
+    realized_pnl: Decimal = Field(
+        default=Decimal("0"), validation_alias=AliasChoices("realizedPnl", "realizedPnL", "realized_pnl")
+    )
+    unrealized_pnl: Decimal = Field(
+        default=Decimal("0"), validation_alias=AliasChoices("unrealizedPnl", "unrealizedPnL", "unrealized_pnl")
+    )
+    # HWM will be updated by backend (source of truth); defaults to equity
+    high_water_mark: Optional[Decimal] = Field(
+        default=None, validation_alias=AliasChoices("highWaterMark", "high_water_mark")
+    )
+    daily_pnl: Decimal = Field(
+        default=Decimal("0"), validation_alias=AliasChoices("dailyPnl", "dailyPnL", "daily_pnl")
+    )
+    # Reported by the add-on; the backend uses the connected account's size
+    starting_balance: Optional[Decimal] = Field(
+        default=None, validation_alias=AliasChoices("startingBalance", "starting_balance")
+    )
+    open_positions: List[PositionMessage] = Field(
+        default_factory=list, validation_alias=AliasChoices("openPositions", "open_positions")
+    )
+    # Decoded straight to date ordinals and cents
+    daily_pnl_history: Optional[DailyPnlHistory] = Field(
+        default=None, validation_alias=AliasChoices("dailyPnlHistory", "daily_pnl_history")
+    )
+
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def _timestamp(cls, value):
+        # Unix milliseconds, read as naive UTC
+        if isinstance(value, (int, float)):
+            return datetime.utcfromtimestamp(value / 1000.0)
+        if isinstance(value, str) and value.endswith("Z"):
+            return value[:-1] + "+00:00"
+        return value
+
+    def to_snapshot(self, account_id: str, starting_balance: Decimal) -> AccountSnapshot:
+        """Engine snapshot under the connected account's internal ID and starting balance."""
+        return AccountSnapshot.model_construct(
+            account_id=account_id,
+            timestamp=self.timestamp,
+            equity=self.equity,
+            balance=self.equity if self.balance is None else self.balance,
+            realized_pnl=self.realized_pnl,
+            unrealized_pnl=self.unrealized_pnl,
+            high_water_mark=self.equity if self.high_water_mark is None else self.high_water_mark,
+            daily_pnl=self.daily_pnl,
+            starting_balance=starting_balance,
+            open_positions=[position.to_snapshot() for position in self.open_positions],
+            daily_pnl_history=self.daily_pnl_history or None,
+        )
+
+
+class InvalidAccountUpdate(BaseModel):
+    """An element of a batch that failed validation."""
+
+    account_id: Optional[str] = None
+    error: str
+
+
+_account_updates_adapter = TypeAdapter(List[AccountUpdateMessage])
+_raw_updates_adapter = TypeAdapter(Union[List[Any], dict])
+
+
+def parse_account_update(raw: Union[bytes, str]) -> AccountUpdateMessage:
+    """
+    Validate one message from raw JSON.
+
+    Raises:
+        ValidationError: If the JSON or the message is invalid
+    """
+    return AccountUpdateMessage.model_validate_json(raw)
+
+
+def parse_account_updates(
+    raw: Union[bytes, str],
+) -> List[Union[AccountUpdateMessage, InvalidAccountUpdate]]:
+    """
+    Validate one message or an array of messages from raw JSON.
+
+    Invalid elements (including ones that are not objects) become
+    InvalidAccountUpdate entries instead of failing the rest of the batch.
+
+    Raises:
+        ValidationError: If raw is not a JSON object or array of objects
+    """
+    try:
+        if raw.lstrip()[:1] in (b"[", "["):
+            return list(_account_updates_adapter.validate_json(raw))
+        return [AccountUpdateMessage.model_validate_json(raw)]
+    except ValidationError:
+        pass
+
+    # Slow path: validate element by element
+    messages = _raw_updates_adapter.validate_json(raw)
+    if isinstance(messages, dict):
+        messages = [messages]
+    parsed: List[Union[AccountUpdateMessage, InvalidAccountUpdate]] = []
+    for message in messages:
+        try:
+            parsed.append(AccountUpdateMessage.model_validate(message))
+        except (ValidationError, ValueError, TypeError, ArithmeticError) as e:
+            # Anything a field validator lets escape fails only this element
+            account_id = message.get("accountId") if isinstance(message, dict) else None
+            parsed.append(
+                InvalidAccountUpdate(
+                    account_id=account_id if isinstance(account_id, str) else None,
+                    error=describe_error(e) if isinstance(e, ValidationError) else str(e),
+                )
+            )
+    return parsed
+
+
+def describe_error(error: ValidationError) -> str:
+    """Short, one-line description of a validation error."""
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
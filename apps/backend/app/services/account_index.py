@@ -0,0 +1,166 @@
+"""
+In-memory index of active connected accounts.
+
+Every add-on update names its account by the platform's account ID, and
+resolving it with queries (exact match, then case-insensitive) cost two
+round trips per 300 ms tick. The index maps (platform, normalized
+account_id) to the few account fields the ingest path needs. It is built
+at startup and kept current by the account endpoints when accounts are
+created, deleted or deactivated.
+
+Account IDs that are not registered are remembered for a short time, so an
+add-on pointed at the wrong account is answered with a back-off delay in
+O(1) instead of being looked up and logged on every tick. Registering a
+matching account clears the entry.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.account import ConnectedAccount
+
+logger = logging.getLogger(__name__)
+
+IndexKey = Tuple[str, str]
+
+# Unknown account IDs remembered at most (expired ones are pruned first)
+MAX_UNKNOWN_ACCOUNTS = 10_000
+
+
+class IndexedAccount(BaseModel):
+    """The fields of a ConnectedAccount used to ingest and evaluate its updates."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: str
+    user_id: str
+    platform: str
+    account_id: str
+    account_name: str
+    firm: str
+    account_type: str
+    account_size: int  # cents
+    rule_set_version: str
+    is_active: bool = True
+
+    @classmethod
+    def from_account(cls, account: ConnectedAccount) -> "IndexedAccount":
+        return cls(
+            id=account.id,
+            user_id=account.user_id,
+            platform=account.platform,
+            account_id=account.account_id,
+            account_name=account.account_name,
+            firm=account.firm,
+            account_type=account.account_type,
+            account_size=account.account_size,
+            rule_set_version=account.rule_set_version,
+            is_active=account.is_active,
+        )
+
+
+class AccountIndexService:
+    """Active accounts keyed by (platform, normalized account_id)."""
+
+    def __init__(self, unknown_ttl: int = settings.UNKNOWN_ACCOUNT_RETRY_SECONDS):
+        self.unknown_ttl = unknown_ttl
+        self._accounts: Dict[IndexKey, IndexedAccount] = {}
+        self._keys_by_id: Dict[str, IndexKey] = {}
+        # Unknown (platform, account_id) -> time.monotonic() when it expires
+        self._unknown: Dict[IndexKey, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(platform: str, account_id: str) -> IndexKey:
+        return (platform.lower(), account_id.strip().lower())
+
+    def load(self, db: Session):
+        """Rebuild the index from all active accounts."""
+        accounts = db.query(ConnectedAccount).filter(ConnectedAccount.is_active == True).all()
+        with self._lock:
+            self._accounts.clear()
+            self._keys_by_id.clear()
+            self._unknown.clear()
+            for account in accounts:
+                self._put(IndexedAccount.from_account(account))
+        logger.info(f"Indexed {len(accounts)} active accounts")
+
+    def add(self, account: ConnectedAccount) -> Optional[IndexedAccount]:
+        """Index a created or updated account (inactive accounts are removed)."""
+        if not account.is_active:
+            self.remove(account.id)
+            return None
+        indexed = IndexedAccount.from_account(account)
+        with self._lock:
+            self._put(indexed)
+        return indexed
+
+    def remove(self, id: str):
+        """Drop an account (deleted or deactivated) by its internal ID."""
+        with self._lock:
+            key = self._keys_by_id.pop(id, None)
+            if key is not None:
+                self._accounts.pop(key, None)
+
+    def get(self, platform: str, account_id: str) -> Optional[IndexedAccount]:
+        """Look up an active account by platform account ID (case-insensitive)."""
+        return self._accounts.get(self._key(platform, account_id))
+
+    def retry_after(self, platform: str, account_id: str) -> Optional[int]:
+        """Seconds left to back off if the account ID was recently found unknown."""
+        key = self._key(platform, account_id)
+        expires = self._unknown.get(key)
+        if expires is None:
+            return None
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            self._unknown.pop(key, None)
+            return None
+        return math.ceil(remaining)
+
+    def mark_unknown(self, platform: str, account_id: str) -> int:
+        """Remember an unregistered account ID; returns the back-off in seconds."""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._unknown) >= MAX_UNKNOWN_ACCOUNTS:
+                self._unknown = {key: expires for key, expires in self._unknown.items() if expires > now}
+                if len(self._unknown) >= MAX_UNKNOWN_ACCOUNTS:
+                    self._unknown.clear()
+            self._unknown[self._key(platform, account_id)] = now + self.unknown_ttl
+        return self.unknown_ttl
+
+    def account_ids(self, platform: str) -> List[str]:
+        """Platform account IDs of all indexed accounts on a platform."""
+        platform = platform.lower()
+        return [account.account_id for (p, _), account in self._accounts.items() if p == platform]
+
+    def _put(self, indexed: IndexedAccount):
+        key = self._key(indexed.platform, indexed.account_id)
+        existing = self._accounts.get(key)
+        if existing is not None and existing.id != indexed.id:
+            # Same account ID in two user accounts; the latest registration wins
+            logger.warning(
+                f"Account ID '{indexed.account_id}' on {indexed.platform} is connected more than once"
+            )
+            self._keys_by_id.pop(existing.id, None)
+        previous_key = self._keys_by_id.get(indexed.id)
+        if previous_key is not None and previous_key != key:
+            self._accounts.pop(previous_key, None)
+        self._accounts[key] = indexed
+        self._keys_by_id[indexed.id] = key
+        self._unknown.pop(key, None)
+
+    @property
+    def size(self) -> int:
+        return len(self._accounts)
+
+
+# Global instance
+account_index = AccountIndexService()
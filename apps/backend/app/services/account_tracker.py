@@ -6,9 +6,10 @@ import asyncio
 import uuid
 import logging
 import json
-from typing import Dict, Optional, Any
+from typing import Dict, Mapping, Optional, Any, Sequence, Tuple, Union
 from decimal import Decimal
 from datetime import datetime
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -16,9 +17,10 @@ from app.models.account import ConnectedAccount
 from app.models.account_state import AccountStateSnapshot
 from app.services.tradovate_client import TradovateClient
 from app.core.security import decrypt_api_token
-from app.services.rule_loader import RuleLoaderService
+from app.services.account_index import IndexedAccount
+from app.services.engine_registry import engine_registry
 from app.services.tradovate_auth import TradovateAuthService
-from rules_engine.engine import RuleEngine
+from app.services.mae_tracker import mae_tracker
 from rules_engine.interface import AccountSnapshot, RuleEvaluationResult, PositionSnapshot
 
 logger = logging.getLogger(__name__)
@@ -48,7 +50,6 @@ class AccountTrackerService:
 
     def __init__(self):
         self.tracking_tasks: Dict[str, asyncio.Task] = {}
-        self.rule_loader = RuleLoaderService()
         self.auth_service = TradovateAuthService()
 
     async def start_tracking(self, account_id: str, db: Session):
@@ -73,6 +74,7 @@ class AccountTrackerService:
         if account_id in self.tracking_tasks:
             self.tracking_tasks[account_id].cancel()
             del self.tracking_tasks[account_id]
+        mae_tracker.forget(account_id)
 
     async def _track_account_loop(self, account_id: str, db: Session):
         """Background loop for tracking an account."""
@@ -132,7 +134,8 @@ class AccountTrackerService:
         self, account_id: str, db: Session, 
         snapshot: Optional[AccountSnapshot] = None,
         result: Optional[RuleEvaluationResult] = None,
-        daily_pnl_history: Optional[Dict[str, Decimal]] = None
+        daily_pnl_history: Optional[Mapping[str, Decimal]] = None,
+        account: Optional[Union[ConnectedAccount, IndexedAccount]] = None,
     ):
         """
         Update account state and calculate rule compliance.
@@ -143,10 +146,12 @@ class AccountTrackerService:
         - Starting balance (from account metadata)
         
         Can be called with pre-computed snapshot (from NinjaTrader) or fetch from platform.
+        The account is loaded unless given (e.g. from the account index).
         """
-        account = db.query(ConnectedAccount).filter(
-            ConnectedAccount.id == account_id
-        ).first()
+        if account is None:
+            account = db.query(ConnectedAccount).filter(
+                ConnectedAccount.id == account_id
+            ).first()
         
         if not account or not account.is_active:
             await self.stop_tracking(account_id)
@@ -213,9 +218,11 @@ class AccountTrackerService:
                 daily_pnl_history=daily_pnl_history,
             )
             
+            # Tradovate does not report peak unrealized loss; track it here
+            engine_state = mae_tracker.apply(engine_state)
+            
             # Load rule set and evaluate
-            rules = await self.rule_loader.get_rules(account.firm, account.account_type, account.rule_set_version)
-            rule_engine = RuleEngine(rules)
+            rule_engine = await engine_registry.get_engine(account.firm, account.account_type, account.rule_set_version)
             result = rule_engine.evaluate(engine_state)
             rule_states = result.rule_states
         
@@ -227,16 +234,93 @@ class AccountTrackerService:
             .first()
         )
         previous_rule_states = previous_snapshot.rule_states if previous_snapshot else {}
-        
+
+        # Save snapshot with backend-tracked HWM
+        snapshot_db = self._snapshot_row(account_id, engine_state, rule_states)
+        db.add(snapshot_db)
+        db.commit()
+
+        self._log_audit_events(db, account, engine_state, snapshot_db, rule_states, previous_rule_states)
+        await self._send_updates(db, account_id, engine_state, rule_states)
+
+    async def update_account_states(
+        self,
+        db: Session,
+        updates: Sequence[Tuple[Union[ConnectedAccount, IndexedAccount], AccountSnapshot, RuleEvaluationResult]],
+    ):
+        """
+        Store pre-evaluated snapshots of many accounts (NinjaTrader batch ingest).
+
+        Same as _update_account_state with a snapshot for each account, but
+        previous snapshots are loaded with one query and all rows (snapshots
+        and audit logs) are written in one transaction. Each snapshot's
+        high_water_mark is replaced with the backend-tracked value.
+        """
+        if not updates:
+            return
+        account_ids = [account.id for account, _, _ in updates]
+
+        # Latest stored snapshot per account, in one query
+        latest = (
+            db.query(
+                AccountStateSnapshot.account_id,
+                func.max(AccountStateSnapshot.timestamp).label("timestamp"),
+            )
+            .filter(AccountStateSnapshot.account_id.in_(account_ids))
+            .group_by(AccountStateSnapshot.account_id)
+            .subquery()
+        )
+        previous_snapshots = {
+            row.account_id: row
+            for row in db.query(AccountStateSnapshot).join(
+                latest,
+                and_(
+                    AccountStateSnapshot.account_id == latest.c.account_id,
+                    AccountStateSnapshot.timestamp == latest.c.timestamp,
+                ),
+            )
+        }
+
+        stored = []
+        for account, snapshot, result in updates:
+            previous = previous_snapshots.get(account.id)
+            if previous is not None:
+                current_hwm = Decimal(str(previous.high_water_mark))
+            else:
+                current_hwm = Decimal(str(account.account_size)) / Decimal("100")
+            snapshot.high_water_mark = max(current_hwm, snapshot.equity)
+            if not snapshot.daily_pnl_history:
+                snapshot.daily_pnl_history = self._get_daily_pnl_history(account.id, db)
+
+            snapshot_db = self._snapshot_row(account.id, snapshot, result.rule_states)
+            db.add(snapshot_db)
+            self._log_audit_events(
+                db,
+                account,
+                snapshot,
+                snapshot_db,
+                result.rule_states,
+                previous.rule_states if previous is not None else {},
+                commit=False,
+            )
+            stored.append((account.id, snapshot, result.rule_states))
+        db.commit()
+
+        for account_id, snapshot, rule_states in stored:
+            await self._send_updates(db, account_id, snapshot, rule_states)
+
+    def _snapshot_row(
+        self, account_id: str, engine_state: AccountSnapshot, rule_states: Mapping[str, Any]
+    ) -> AccountStateSnapshot:
+        """Build the stored snapshot row (rule states and positions as JSON)."""
         # Convert rule states and positions to dict, then convert Decimals to float for JSON serialization
         rule_states_dict = {k: v.dict() for k, v in rule_states.items()}
         rule_states_dict = convert_decimals_to_float(rule_states_dict)
-        
+
         open_positions_list = [pos.dict() for pos in engine_state.open_positions]
         open_positions_list = convert_decimals_to_float(open_positions_list)
-        
-        # Save snapshot with backend-tracked HWM
-        snapshot_db = AccountStateSnapshot(
+
+        return AccountStateSnapshot(
             id=str(uuid.uuid4()),
             account_id=account_id,
             timestamp=engine_state.timestamp,
@@ -249,20 +333,29 @@ class AccountTrackerService:
             open_positions=open_positions_list,
             rule_states=rule_states_dict,
         )
-        db.add(snapshot_db)
-        db.commit()
-        
-        # Audit logging: Log warnings, violations, and state changes
+
+    def _log_audit_events(
+        self,
+        db: Session,
+        account: Union[ConnectedAccount, IndexedAccount],
+        engine_state: AccountSnapshot,
+        snapshot_db: AccountStateSnapshot,
+        rule_states: Mapping[str, Any],
+        previous_rule_states: Mapping[str, Any],
+        commit: bool = True,
+    ):
+        """Audit logging: Log warnings, violations, and state changes."""
         from app.services.audit_logger import audit_logger
         
         # Log HWM update if it changed
         if engine_state.equity > Decimal(str(snapshot_db.high_water_mark)):
-            logger.info(f"HWM updated for account {account_id}: {float(engine_state.high_water_mark)}")
+            logger.info(f"HWM updated for account {account.id}: {float(engine_state.high_water_mark)}")
             audit_logger.log_account_update(
                 db,
                 account,
                 f"High-water mark updated to ${float(engine_state.high_water_mark):.2f}",
                 {"new_hwm": float(engine_state.high_water_mark), "equity": float(engine_state.equity)},
+                commit=commit,
             )
         
         # Log rule state changes, warnings, and violations
@@ -294,6 +387,7 @@ class AccountTrackerService:
                     "bufferPercent": buffer_percent,
                     "warnings": warnings,
                 },
+                commit=commit,
             )
             
             # Log state change if status changed
@@ -311,6 +405,7 @@ class AccountTrackerService:
                         "remainingBuffer": remaining_buffer,
                         "bufferPercent": buffer_percent,
                     },
+                    commit=commit,
                 )
             
             # Log warnings (caution/critical)
@@ -330,6 +425,7 @@ class AccountTrackerService:
                         "bufferPercent": buffer_percent,
                         "warnings": warnings,
                     },
+                    commit=commit,
                 )
             
             # Log violations
@@ -348,8 +444,17 @@ class AccountTrackerService:
                         "bufferPercent": buffer_percent,
                         "warnings": warnings,
                     },
+                    commit=commit,
                 )
-        
+
+    async def _send_updates(
+        self,
+        db: Session,
+        account_id: str,
+        engine_state: AccountSnapshot,
+        rule_states: Mapping[str, Any],
+    ):
+        """Push the account update, and updates of groups containing it, over WebSocket."""
         # Send WebSocket update
         manager = get_websocket_manager()
         await manager.send_to_account(
@@ -12,7 +12,12 @@ from app.models.account import ConnectedAccount
 
 
 class AuditLoggerService:
-    """Service for logging audit events."""
+    """
+    Service for logging audit events.
+
+    Each method commits by default; pass commit=False to add the log to
+    the caller's transaction instead (batched account updates).
+    """
 
     @staticmethod
     def log_warning(
@@ -23,6 +28,7 @@ class AuditLoggerService:
         current_status: str,
         message: str,
         event_data: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ):
         """Log a rule warning (caution/critical status)."""
         log = AuditLog(
@@ -38,7 +44,8 @@ class AuditLoggerService:
             timestamp=datetime.utcnow(),
         )
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
 
     @staticmethod
     def log_violation(
@@ -48,6 +55,7 @@ class AuditLoggerService:
         previous_status: Optional[str],
         message: str,
         event_data: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ):
         """Log a rule violation."""
         log = AuditLog(
@@ -63,7 +71,8 @@ class AuditLoggerService:
             timestamp=datetime.utcnow(),
         )
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
 
     @staticmethod
     def log_state_change(
@@ -74,6 +83,7 @@ class AuditLoggerService:
         current_status: str,
         message: str,
         event_data: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ):
         """Log an account state change."""
         log = AuditLog(
@@ -89,7 +99,8 @@ class AuditLoggerService:
             timestamp=datetime.utcnow(),
         )
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
 
     @staticmethod
     def log_rule_evaluation(
@@ -98,6 +109,7 @@ class AuditLoggerService:
         rule_name: str,
         status: str,
         event_data: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ):
         """Log a rule evaluation."""
         log = AuditLog(
@@ -112,7 +124,8 @@ class AuditLoggerService:
             timestamp=datetime.utcnow(),
         )
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
 
     @staticmethod
     def log_account_update(
@@ -120,6 +133,7 @@ class AuditLoggerService:
         account: ConnectedAccount,
         message: str,
         event_data: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ):
         """Log an account data update."""
         log = AuditLog(
@@ -132,7 +146,8 @@ class AuditLoggerService:
             timestamp=datetime.utcnow(),
         )
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
 
     @staticmethod
     def log_group_update(
@@ -141,6 +156,7 @@ class AuditLoggerService:
         user_id: str,
         message: str,
         event_data: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ):
         """Log a group risk update."""
         log = AuditLog(
@@ -153,7 +169,8 @@ class AuditLoggerService:
             timestamp=datetime.utcnow(),
         )
         db.add(log)
-        db.commit()
+        if commit:
+            db.commit()
 
 
 # Global instance
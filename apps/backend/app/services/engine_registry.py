@@ -0,0 +1,184 @@
+"""
+Process-wide registry of rule engines.
+
+Rule sets only change when a firm publishes a new version, but account
+updates arrive every 300 ms. The registry loads each (firm, account_type,
+rule_set_version) once and hands out the same ready-to-use RuleEngine to
+every request for it. Engines are stored by the content hash of their
+rules, so versions or account types with identical rules share one engine.
+
+When rule sets change, reload() (POST /firms/rules/reload) drops every
+engine and loads the rule sets again.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+from rules_engine.compare import MultiFirmEvaluator
+from rules_engine.engine import RuleEngine
+from rules_engine.models import FirmRules
+from rules_engine.plan import clear_plan_cache, rules_hash
+from rules_engine.profiling import MethodTiming, RuleProfiler
+from rules_engine.results import CompactRuleEngine
+
+from app.core.config import settings
+from app.services.rule_loader import RuleLoaderService
+
+logger = logging.getLogger(__name__)
+
+EngineKey = Tuple[str, str, str]
+
+
+class EngineRegistryService:
+    """Shared cache of RuleEngines keyed by (firm, account_type, rule_set_version)."""
+
+    def __init__(self, profiling: bool = settings.RULE_PROFILING):
+        self.rule_loader = RuleLoaderService()
+        # One profiler shared by every engine, so timings cover all firms
+        self.profiler: Optional[RuleProfiler] = RuleProfiler() if profiling else None
+        self._engines: Dict[EngineKey, RuleEngine] = {}
+        # rules_hash() -> engine, shared by every key whose rules are identical
+        self._engines_by_hash: Dict[str, RuleEngine] = {}
+        self._comparisons: Dict[str, MultiFirmEvaluator] = {}
+
+    @staticmethod
+    def _key(firm: str, account_type: str, version: str) -> EngineKey:
+        return (firm.lower(), account_type, version)
+
+    async def get_engine(
+        self, firm: str, account_type: str, version: str = "1.0"
+    ) -> RuleEngine:
+        """
+        Get the shared engine for a firm/account type/version.
+
+        Engines are shared between requests and must not be mutated; to
+        change rules, update the rule loader and call reload() or
+        invalidate().
+
+        Raises:
+            ValueError: If firm is not supported
+        """
+        key = self._key(firm, account_type, version)
+        engine = self._engines.get(key)
+        if engine is None:
+            rules = await self.rule_loader.get_rules(firm, account_type, version)
+            digest = rules_hash(rules)
+            engine = self._engines_by_hash.get(digest)
+            if engine is None:
+                # Results are materialized from compact records without re-validation
+                engine = CompactRuleEngine(rules)
+                if self.profiler is not None:
+                    engine.enable_profiling(self.profiler)
+                self._engines_by_hash[digest] = engine
+            self._engines[key] = engine
+        return engine
+
+    async def get_rules(
+        self, firm: str, account_type: str, version: str = "1.0"
+    ) -> FirmRules:
+        """Get the rule set behind the shared engine (read-only)."""
+        engine = await self.get_engine(firm, account_type, version)
+        return engine.rules
+
+    def get_supported_firms(self) -> list:
+        """Get list of supported prop firms."""
+        return self.rule_loader.get_supported_firms()
+
+    def get_supported_account_types(self) -> list:
+        """Get list of supported account types."""
+        return self.rule_loader.get_supported_account_types()
+
+    async def warm(self, version: str = "1.0") -> int:
+        """
+        Build engines for every supported firm and account type.
+
+        Called at startup so the first account update does not pay for rule
+        loading and compilation. Returns the number of engines held.
+        """
+        for firm in self.get_supported_firms():
+            for account_type in self.get_supported_account_types():
+                await self.get_engine(firm, account_type, version)
+        logger.info(f"Engine registry warmed with {self.size} engines")
+        return self.size
+
+    async def get_comparison(self, version: str = "1.0") -> MultiFirmEvaluator:
+        """
+        Get an evaluator over every supported firm and account type.
+
+        Results are labelled "firm/account_type"; rules shared between rule
+        sets are computed once per snapshot.
+        """
+        comparison = self._comparisons.get(version)
+        if comparison is None:
+            engines = {}
+            for firm in self.get_supported_firms():
+                for account_type in self.get_supported_account_types():
+                    engines[f"{firm}/{account_type}"] = await self.get_engine(
+                        firm, account_type, version
+                    )
+            comparison = MultiFirmEvaluator(engines)
+            self._comparisons[version] = comparison
+        return comparison
+
+    def invalidate(
+        self,
+        firm: Optional[str] = None,
+        account_type: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> int:
+        """
+        Drop engines whose rules changed.
+
+        Any argument left as None matches all values, so invalidate() with no
+        arguments drops everything. Returns the number of engines dropped.
+        """
+        dropped = [
+            key
+            for key in self._engines
+            if (firm is None or key[0] == firm.lower())
+            and (account_type is None or key[1] == account_type)
+            and (version is None or key[2] == version)
+        ]
+        for key in dropped:
+            del self._engines[key]
+        if dropped:
+            self._comparisons.clear()
+            live = {id(engine) for engine in self._engines.values()}
+            self._engines_by_hash = {
+                digest: engine
+                for digest, engine in self._engines_by_hash.items()
+                if id(engine) in live
+            }
+
+        # The loader keeps its own cache of FirmRules; reload from scratch.
+        self.rule_loader = RuleLoaderService()
+        if firm is None and account_type is None and version is None:
+            clear_plan_cache()
+        logger.info(f"Engine registry invalidated {len(dropped)} engines")
+        return len(dropped)
+
+    async def reload(self, version: str = "1.0") -> int:
+        """
+        Drop every engine and load all rule sets again.
+
+        For rule set changes (edited or re-versioned rules); accounts pick
+        up the new engines on their next update. Returns the number of
+        engines held afterwards.
+        """
+        self.invalidate()
+        return await self.warm(version)
+
+    def rule_timings(self) -> Optional[Dict[str, MethodTiming]]:
+        """Per-method timings across all engines, or None if profiling is off."""
+        if self.profiler is None:
+            return None
+        return self.profiler.snapshot()
+
+    @property
+    def size(self) -> int:
+        """Number of (firm, account_type, version) keys currently held."""
+        return len(self._engines)
+
+
+# Global instance
+engine_registry = EngineRegistryService()
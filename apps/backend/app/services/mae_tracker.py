@@ -0,0 +1,97 @@
+"""
+Server-side per-position MAE tracking.
+
+Keeps the worst unrealized loss of every open position in memory, so the
+MAE rule works for platforms that do not report peak_unrealized_loss
+(Tradovate) and does not lose the peak when updates are coalesced or
+dropped. State is checkpointed to a JSON file periodically and restored on
+startup, so a restart does not reset open positions' peaks.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Optional
+
+from rules_engine.interface import AccountSnapshot
+from rules_engine.peaks import PeakLossTracker
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MAETrackerService:
+    """Tracks peak unrealized loss per (account, symbol, opened_at)."""
+
+    def __init__(
+        self,
+        checkpoint_path: str = settings.MAE_CHECKPOINT_PATH,
+        checkpoint_interval: float = settings.MAE_CHECKPOINT_SECONDS,
+    ):
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.tracker = PeakLossTracker()
+        self._checkpointed_version = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def apply(self, snapshot: AccountSnapshot) -> AccountSnapshot:
+        """Record the snapshot and return it with tracked peak losses filled in."""
+        return self.tracker.update(snapshot)
+
+    def forget(self, account_id: str):
+        """Drop an account's positions (account stopped or deleted)."""
+        self.tracker.forget(account_id)
+
+    def restore(self):
+        """Load the last checkpoint, if there is one."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as file:
+                self.tracker.load(json.load(file))
+            self._checkpointed_version = self.tracker.version
+            logger.info(f"Restored MAE state for {len(self.tracker)} open positions")
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not restore MAE checkpoint {self.checkpoint_path}: {e}")
+
+    def checkpoint(self):
+        """Write the state to the checkpoint file if it changed since the last write."""
+        version = self.tracker.version
+        if not self.checkpoint_path or version == self._checkpointed_version:
+            return
+        rows = self.tracker.dump()
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(rows, file)
+        os.replace(temp_path, self.checkpoint_path)
+        self._checkpointed_version = version
+
+    async def _checkpoint_loop(self):
+        while True:
+            await asyncio.sleep(self.checkpoint_interval)
+            try:
+                self.checkpoint()
+            except OSError as e:
+                logger.error(f"MAE checkpoint failed: {e}")
+
+    def start(self):
+        """Restore the last checkpoint and start periodic checkpointing."""
+        self.restore()
+        if self._task is None and self.checkpoint_interval > 0:
+            self._task = asyncio.create_task(self._checkpoint_loop())
+
+    def stop(self):
+        """Stop periodic checkpointing and write a final checkpoint."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        try:
+            self.checkpoint()
+        except OSError as e:
+            logger.error(f"MAE checkpoint failed: {e}")
+
+
+# Global instance
+mae_tracker = MAETrackerService()
@@ -0,0 +1,64 @@
+"""
+Risk-of-ruin simulation for connected accounts.
+
+Simulations are CPU-bound NumPy work. They run on a process pool that is
+created on first use and shared by all requests, and are awaited from a
+worker thread so the event loop keeps serving account updates.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot
+from rules_engine.simulation import PnlDistribution, RiskOfRuinResult, simulate_accounts
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RiskSimulatorService:
+    """Runs Monte Carlo risk-of-ruin simulations on a shared process pool."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            logger.info(f"Risk simulator pool started with {self.max_workers} workers")
+        return self._executor
+
+    async def simulate(
+        self,
+        jobs: Sequence[Tuple[RuleEngine, AccountSnapshot, PnlDistribution]],
+        paths: int = settings.RISK_OF_RUIN_PATHS,
+        horizon_days: int = 20,
+        seed: Optional[int] = None,
+    ) -> List[RiskOfRuinResult]:
+        """Simulate every account, spreading each one's paths over the pool."""
+        return await run_in_threadpool(
+            simulate_accounts,
+            jobs,
+            paths=paths,
+            horizon_days=horizon_days,
+            seed=seed,
+            executor=self.executor,
+            chunks=self.max_workers,
+        )
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+# Global instance
+risk_simulator = RiskSimulatorService()
@@ -8,7 +8,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.database import SessionLocal
 from app.api.v1.api import api_router
+from app.services.account_index import account_index
+from app.services.engine_registry import engine_registry
+from app.services.risk_simulator import risk_simulator
+from app.services.mae_tracker import mae_tracker
 
 app = FastAPI(
     title="Payout King API",
@@ -29,6 +34,40 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.on_event("startup")
+async def warm_engine_registry():
+    """Load and compile all rule sets before the first account update."""
+    await engine_registry.warm()
+
+
+@app.on_event("startup")
+async def load_account_index():
+    """Index active accounts so ingest resolves them without queries."""
+    db = SessionLocal()
+    try:
+        account_index.load(db)
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+async def start_mae_tracker():
+    """Restore per-position MAE state and start checkpointing it."""
+    mae_tracker.start()
+
+
+@app.on_event("shutdown")
+async def stop_risk_simulator():
+    """Stop the risk-of-ruin worker processes."""
+    risk_simulator.shutdown()
+
+
+@app.on_event("shutdown")
+async def stop_mae_tracker():
+    """Write a final checkpoint of per-position MAE state."""
+    mae_tracker.stop()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -42,5 +81,27 @@ async def health():
         "status": "healthy",
         "service": "payout-king-api",
         "version": "0.1.0",
+        "engines": engine_registry.size,
+        "indexedAccounts": account_index.size,
+    }
+
+
+@app.get("/health/rule-timings")
+async def rule_timings():
+    """Per-rule call counts and latencies (requires RULE_PROFILING)."""
+    timings = engine_registry.rule_timings()
+    if timings is None:
+        return {"enabled": False, "timings": {}}
+    return {
+        "enabled": True,
+        "timings": {
+            name: {
+                "calls": timing.calls,
+                "totalMs": round(timing.total_ms, 3),
+                "meanMs": round(timing.mean_ms, 4),
+                "maxMs": round(timing.max_ms, 3),
+            }
+            for name, timing in timings.items()
+        },
     }
 
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the rules engine.
+
+Measures evaluate() for every firm profile produced by RuleLoaderService,
+each _calculate_* method on its own, and how evaluate() scales with the
+number of open positions and the size of daily_pnl_history. Results are
+written as JSON; --compare flags cases slower than a stored baseline.
+
+Usage:
+    python scripts/benchmark_rules_engine.py --output baseline.json
+    python scripts/benchmark_rules_engine.py --compare baseline.json [--threshold 0.15]
+    python scripts/benchmark_rules_engine.py --filter scaling --quick
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Dict, List, Tuple
+
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    OverallMaxLossRule,
+    MaxPositionSizeRule,
+    MAERule,
+    ConsistencyRule,
+    TradingHoursRule,
+    MinimumTradingDaysRule,
+    ProfitTargetRule,
+)
+
+from app.services.rule_loader import RuleLoaderService
+
+POSITION_COUNTS = (0, 1, 10, 100)
+HISTORY_SIZES = (0, 30, 250, 1000)
+
+Case = Tuple[str, Callable[[], object]]
+
+
+def all_rules() -> FirmRules:
+    """Every rule enabled, so each calculator can be measured."""
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True, max_drawdown_percent=Decimal("5"), include_unrealized_pnl=True
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True, max_loss_amount=Decimal("1000"), reset_time="17:00"
+        ),
+        overall_max_loss=OverallMaxLossRule(enabled=True, max_loss_amount=Decimal("2500")),
+        max_position_size=MaxPositionSizeRule(enabled=True, max_contracts=10),
+        mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("2")),
+        consistency_rule=ConsistencyRule(enabled=True, max_single_day_percent=Decimal("30")),
+        trading_hours=TradingHoursRule(enabled=True, forced_close_time="16:59"),
+        minimum_trading_days=MinimumTradingDaysRule(enabled=True, min_days=7),
+        profit_target=ProfitTargetRule(enabled=True, target_amount=Decimal("3000")),
+    )
+
+
+def make_snapshot(positions: int = 2, history_days: int = 20) -> AccountSnapshot:
+    """A mid-session $50k account with the given number of positions and history days."""
+    now = datetime(2026, 1, 6, 15, 30, tzinfo=timezone.utc)
+    first_day = date(2026, 1, 6) - timedelta(days=history_days)
+    return AccountSnapshot(
+        account_id="bench",
+        timestamp=now,
+        equity=Decimal("50840.25"),
+        balance=Decimal("51000"),
+        realized_pnl=Decimal("1000"),
+        unrealized_pnl=Decimal("-159.75"),
+        high_water_mark=Decimal("51250"),
+        daily_pnl=Decimal("-410.50"),
+        starting_balance=Decimal("50000"),
+        daily_pnl_history={
+            (first_day + timedelta(days=i)).isoformat(): Decimal((i * 37) % 400 - 120)
+            for i in range(history_days)
+        },
+        open_positions=[
+            PositionSnapshot(
+                symbol="ES" if i % 2 == 0 else "NQ",
+                quantity=1 if i % 3 else -1,
+                avg_price=Decimal("5000.25"),
+                current_price=Decimal("4998.75"),
+                unrealized_pnl=Decimal("-75"),
+                opened_at=now - timedelta(minutes=5 + i),
+                peak_unrealized_loss=Decimal(-100 - i),
+            )
+            for i in range(positions)
+        ],
+    )
+
+
+def firm_cases() -> List[Case]:
+    loader = RuleLoaderService()
+    snapshot = make_snapshot()
+    cases = []
+    for firm in loader.get_supported_firms():
+        for account_type in loader.get_supported_account_types():
+            rules = asyncio.run(loader.get_rules(firm, account_type))
+            engine = RuleEngine(rules)
+            cases.append((f"evaluate/{firm}/{account_type}", lambda e=engine: e.evaluate(snapshot)))
+    return cases
+
+
+def calculator_cases() -> List[Case]:
+    engine = RuleEngine(all_rules())
+    snapshot = make_snapshot()
+    return [
+        (f"calculate/{compiled.name}", lambda m=getattr(engine, compiled.method): m(snapshot))
+        for compiled in engine.plan.rules
+    ]
+
+
+def scaling_cases() -> List[Case]:
+    engine = RuleEngine(all_rules())
+    cases = []
+    for count in POSITION_COUNTS:
+        snapshot = make_snapshot(positions=count)
+        cases.append((f"scaling/positions/{count}", lambda s=snapshot: engine.evaluate(s)))
+    for size in HISTORY_SIZES:
+        snapshot = make_snapshot(history_days=size)
+        cases.append((f"scaling/history/{size}", lambda s=snapshot: engine.evaluate(s)))
+    return cases
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    """Per-call time in microseconds, best and median of repeat runs."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    runs = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "loops": number,
+        "best_us": round(min(runs), 3),
+        "median_us": round(statistics.median(runs), 3),
+    }
+
+
+def run(filter_text: str, repeat: int, min_time: float) -> Dict:
+    results = {}
+    for name, func in firm_cases() + calculator_cases() + scaling_cases():
+        if filter_text and filter_text not in name:
+            continue
+        results[name] = measure(func, repeat, min_time)
+        print(f"{name:<40} {results[name]['median_us']:>12.2f} us", file=sys.stderr)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Names of cases whose median is more than threshold slower than baseline."""
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = result["median_us"] / reference["median_us"] if reference["median_us"] else 1.0
+        result["baseline_median_us"] = reference["median_us"]
+        result["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the rules engine")
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Allowed slowdown ratio (default 0.15)"
+    )
+    parser.add_argument("--filter", default="", help="Only run cases containing this text")
+    parser.add_argument("--quick", action="store_true", help="Fewer, shorter runs")
+    args = parser.parse_args()
+
+    repeat, min_time = (3, 0.05) if args.quick else (7, 0.2)
+    current = run(args.filter, repeat, min_time)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(current, baseline, args.threshold)
+        current["regressions"] = regressions
+        for name in regressions:
+            result = current["results"][name]
+            print(
+                f"REGRESSION {name}: {result['median_us']:.2f} us vs "
+                f"{result['baseline_median_us']:.2f} us (x{result['ratio']})",
+                file=sys.stderr,
+            )
+
+    output = json.dumps(current, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
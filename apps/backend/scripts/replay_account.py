@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Replay stored snapshots of an account through its rule engine.
+
+Used to audit a disputed violation: re-runs every stored account state
+snapshot (or an NDJSON recording) in timestamp order and prints each rule
+status transition plus throughput.
+
+Usage:
+    python scripts/replay_account.py <account_id> [--since 2026-01-01] [--until 2026-02-01]
+    python scripts/replay_account.py <account_id> --ndjson recording.ndjson
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from rules_engine.replay import ReplayRunner, read_ndjson, snapshot_from_row
+
+from app.core.database import SessionLocal
+from app.models.account import ConnectedAccount
+from app.models.account_state import AccountStateSnapshot
+from app.services.engine_registry import engine_registry
+
+
+def _rows(db, account_id, since, until, batch_size=5000):
+    """Stream snapshot rows in timestamp order without loading them all."""
+    query = (
+        db.query(AccountStateSnapshot)
+        .filter(AccountStateSnapshot.account_id == account_id)
+        .order_by(AccountStateSnapshot.timestamp)
+    )
+    if since:
+        query = query.filter(AccountStateSnapshot.timestamp >= since)
+    if until:
+        query = query.filter(AccountStateSnapshot.timestamp < until)
+    for row in query.yield_per(batch_size):
+        yield {
+            "account_id": row.account_id,
+            "timestamp": row.timestamp,
+            "equity": row.equity,
+            "balance": row.balance,
+            "realized_pnl": row.realized_pnl,
+            "unrealized_pnl": row.unrealized_pnl,
+            "high_water_mark": row.high_water_mark,
+            "daily_pnl": row.daily_pnl,
+            "open_positions": row.open_positions,
+        }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("account_id", help="Internal connected account ID")
+    parser.add_argument("--since", type=datetime.fromisoformat)
+    parser.add_argument("--until", type=datetime.fromisoformat)
+    parser.add_argument("--ndjson", help="Replay an NDJSON recording instead of the database")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        account = db.query(ConnectedAccount).filter(ConnectedAccount.id == args.account_id).first()
+        if not account:
+            raise SystemExit(f"Account {args.account_id} not found")
+
+        engine = await engine_registry.get_engine(
+            account.firm, account.account_type, account.rule_set_version
+        )
+        if args.ndjson:
+            snapshots = read_ndjson(args.ndjson)
+        else:
+            starting_balance = Decimal(str(account.account_size)) / Decimal("100")
+            snapshots = (
+                snapshot_from_row(row, starting_balance)
+                for row in _rows(db, account.id, args.since, args.until)
+            )
+
+        runner = ReplayRunner(engine)
+        for transition in runner.run(snapshots):
+            previous = transition.previous.value if transition.previous else "-"
+            print(
+                f"{transition.timestamp.isoformat()}  {transition.rule_name:<22} "
+                f"{previous:>9} -> {transition.current.value:<9} "
+                f"buffer={transition.remaining_buffer}"
+            )
+
+        stats = runner.stats
+        print("=" * 60)
+        print(f"Snapshots:   {stats.snapshots}")
+        print(f"Transitions: {stats.transitions}")
+        if stats.out_of_order:
+            print(f"Out of order: {len(stats.out_of_order)} snapshots older than an earlier one")
+        print(f"Replayed:    {stats.replayed_seconds:.0f} s of recorded time")
+        print(f"Elapsed:     {stats.elapsed_seconds:.3f} s ({stats.snapshots_per_second:,.0f} snapshots/s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
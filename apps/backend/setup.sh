@@ -11,9 +11,9 @@ source venv/bin/activate
 pip install --upgrade pip
 pip install -r requirements.txt
 
-# Install rules-engine package
+# Install rules-engine package (with NumPy for simulations and sweeps)
 cd ../../packages/rules-engine
-pip install -e .
+pip install -e ".[numpy]"
 cd ../../apps/backend
 
 # Create .env file if it doesn't exist
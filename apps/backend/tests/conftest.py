@@ -0,0 +1,45 @@
+"""
+Shared fixtures for backend tests.
+
+The app runs against an in-memory SQLite database; startup hooks are not
+run, so the account index starts empty.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import main
+from app.api.v1.endpoints import websocket
+from app.core.database import Base, get_db
+from app.services.account_index import account_index
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def client(session_factory, monkeypatch):
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[get_db] = override_get_db
+    monkeypatch.setattr(websocket, "SessionLocal", session_factory)
+    db = session_factory()
+    account_index.load(db)
+    db.close()
+    yield TestClient(main.app)
+    main.app.dependency_overrides.pop(get_db, None)
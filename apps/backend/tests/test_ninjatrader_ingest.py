@@ -0,0 +1,77 @@
+"""
+Tests for NinjaTrader add-on ingest (batch endpoint and WebSocket channel).
+
+An element with bad daily PnL history must fail on its own, as an error
+entry, without failing the request or closing the socket.
+"""
+
+import json
+
+import pytest
+
+from app.schemas.ninjatrader import (
+    AccountUpdateMessage,
+    InvalidAccountUpdate,
+    parse_account_updates,
+)
+
+
+BAD_HISTORIES = [
+    {"2026-01-05": "abc"},
+    {"2026-01-05": None},
+]
+
+
+def _update(account_id: str, **fields) -> dict:
+    return {
+        "accountId": account_id,
+        "timestamp": "2026-01-05T14:00:00Z",
+        "equity": "50000",
+        "balance": "50000",
+        **fields,
+    }
+
+
+@pytest.mark.parametrize("history", BAD_HISTORIES)
+def test_parse_turns_bad_history_into_invalid_entry(history):
+    raw = json.dumps([_update("BAD", dailyPnlHistory=history), _update("GOOD"), 42])
+
+    parsed = parse_account_updates(raw)
+
+    assert isinstance(parsed[0], InvalidAccountUpdate)
+    assert parsed[0].account_id == "BAD"
+    assert "dailyPnlHistory" in parsed[0].error or "daily_pnl_history" in parsed[0].error
+    assert isinstance(parsed[1], AccountUpdateMessage)
+    assert isinstance(parsed[2], InvalidAccountUpdate)
+    assert parsed[2].account_id is None
+
+
+@pytest.mark.parametrize("history", BAD_HISTORIES)
+def test_batch_endpoint_reports_bad_history_per_element(client, history):
+    body = [_update("BAD", dailyPnlHistory=history), _update("UNKNOWN")]
+
+    response = client.post("/api/v1/ninjatrader/account-updates", content=json.dumps(body))
+
+    assert response.status_code == 200
+    bad, unknown = response.json()["results"]
+    assert bad["accountId"] == "BAD"
+    assert bad["success"] is False
+    assert bad["error"].startswith("Error parsing account data")
+    assert unknown["accountId"] == "UNKNOWN"
+    assert unknown["success"] is False
+    assert "retryAfter" in unknown
+
+
+@pytest.mark.parametrize("history", BAD_HISTORIES)
+def test_ingest_socket_acks_bad_history_and_stays_open(client, history):
+    with client.websocket_connect("/api/v1/ws/ninjatrader/ingest") as ws:
+        ws.send_text(json.dumps(_update("BAD", dailyPnlHistory=history)))
+        ack = ws.receive_json()
+        assert ack["type"] == "account_update_ack"
+        assert ack["accountId"] == "BAD"
+        assert ack["success"] is False
+
+        ws.send_text(json.dumps([_update("BAD", dailyPnlHistory=history), _update("UNKNOWN")]))
+        acks = [ws.receive_json(), ws.receive_json()]
+        assert [a["accountId"] for a in acks] == ["BAD", "UNKNOWN"]
+        assert all(a["type"] == "account_update_ack" for a in acks)
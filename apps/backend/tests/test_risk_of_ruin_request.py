@@ -0,0 +1,37 @@
+"""
+Tests for risk-of-ruin request validation.
+
+Out-of-range simulation parameters must be rejected by the schema (422)
+instead of failing inside the simulator.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.group import RiskOfRuinRequest
+
+
+def test_defaults_are_valid():
+    request = RiskOfRuinRequest(meanPnl=50, stdPnl=200)
+
+    assert request.per == "day"
+    assert request.horizonDays == 20
+    assert request.paths is None
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"per": "week"},
+        {"stdPnl": -1},
+        {"horizonDays": 0},
+        {"horizonDays": 10_000},
+        {"paths": -1},
+        {"paths": 10_000_000},
+        {"tradesPerDay": 0},
+        {"per": "trade", "tradesPerDay": 100, "horizonDays": 252, "paths": 100_000},
+    ],
+)
+def test_out_of_range_parameters_are_rejected(fields):
+    with pytest.raises(ValidationError):
+        RiskOfRuinRequest(**{"meanPnl": 50, "stdPnl": 200, **fields})
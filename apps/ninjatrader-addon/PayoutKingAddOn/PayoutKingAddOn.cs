@@ -10,9 +10,12 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Net.Http;
+using System.Net.WebSockets;
 using System.Text;
+using System.Threading;
 using System.Threading.Tasks;
 using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
 using NinjaTrader.Cbi;
 using NinjaTrader.NinjaScript;
 #endregion
@@ -29,6 +32,10 @@ namespace NinjaTrader.NinjaScript.AddOns
         private Account account;
         private Dictionary<string, double> dailyPnLByDate = new Dictionary<string, double>(); // Date string -> daily PnL
         private Dictionary<string, double> peakLosses = new Dictionary<string, double>(); // Position key -> peak loss
+        private DateTime backoffUntil = DateTime.MinValue; // Set from Retry-After (e.g. account not registered)
+        private ClientWebSocket ingestSocket; // Persistent ingest channel; HTTP is the fallback
+        private readonly SemaphoreSlim ingestLock = new SemaphoreSlim(1, 1); // Timer ticks can overlap
+        private DateTime reconnectAfter = DateTime.MinValue;
 
         protected override void OnStateChange()
         {
@@ -85,6 +92,12 @@ namespace NinjaTrader.NinjaScript.AddOns
                     updateTimer.Dispose();
                 }
 
+                if (ingestSocket != null)
+                {
+                    ingestSocket.Abort();
+                    ingestSocket.Dispose();
+                }
+
                 if (httpClient != null)
                 {
                     httpClient.Dispose();
@@ -138,6 +151,10 @@ namespace NinjaTrader.NinjaScript.AddOns
             if (account == null || string.IsNullOrEmpty(backendUrl))
                 return;
 
+            // Backend asked us to wait (account not registered yet)
+            if (DateTime.UtcNow < backoffUntil)
+                return;
+
             try
             {
                 // Collect account data - matches AccountUpdateMessage schema exactly
@@ -158,6 +175,11 @@ namespace NinjaTrader.NinjaScript.AddOns
 
                 // Send to backend - matches AccountSnapshot interface
                 string json = JsonConvert.SerializeObject(accountUpdate);
+
+                // Prefer the open WebSocket; acks arrive in ReceiveAcks
+                if (await TrySendOverWebSocket(json))
+                    return;
+
                 var content = new StringContent(json, Encoding.UTF8, "application/json");
 
                 if (!string.IsNullOrEmpty(apiKey))
@@ -178,6 +200,13 @@ namespace NinjaTrader.NinjaScript.AddOns
                     string errorBody = await response.Content.ReadAsStringAsync();
                     Print($"⚠️  Backend error: {response.StatusCode}");
                     Print($"   Response: {errorBody}");
+
+                    var retryAfter = response.Headers.RetryAfter;
+                    if (retryAfter != null && retryAfter.Delta.HasValue)
+                    {
+                        backoffUntil = DateTime.UtcNow + retryAfter.Delta.Value;
+                        Print($"   Retrying in {retryAfter.Delta.Value.TotalSeconds:0}s");
+                    }
                 }
             }
             catch (Exception ex)
@@ -187,6 +216,88 @@ namespace NinjaTrader.NinjaScript.AddOns
             }
         }
 
+        private async Task<bool> TrySendOverWebSocket(string json)
+        {
+            if (!await ingestLock.WaitAsync(0))
+                return true; // Previous tick still sending; skip this one
+
+            try
+            {
+                if (ingestSocket == null || ingestSocket.State != WebSocketState.Open)
+                {
+                    if (DateTime.UtcNow < reconnectAfter)
+                        return false;
+
+                    if (ingestSocket != null)
+                        ingestSocket.Dispose();
+                    ingestSocket = new ClientWebSocket();
+                    if (!string.IsNullOrEmpty(apiKey))
+                        ingestSocket.Options.SetRequestHeader("Authorization", $"Bearer {apiKey}");
+
+                    string wsUrl = backendUrl.Replace("https://", "wss://").Replace("http://", "ws://");
+                    await ingestSocket.ConnectAsync(new Uri($"{wsUrl}/api/v1/ws/ninjatrader/ingest"), CancellationToken.None);
+                    Print("✅ Streaming account data over WebSocket");
+                    var socket = ingestSocket;
+                    _ = Task.Run(() => ReceiveAcks(socket));
+                }
+
+                byte[] bytes = Encoding.UTF8.GetBytes(json);
+                await ingestSocket.SendAsync(new ArraySegment<byte>(bytes), WebSocketMessageType.Text, true, CancellationToken.None);
+                return true;
+            }
+            catch (Exception ex)
+            {
+                // Use HTTP for a while before trying to reconnect
+                Print($"⚠️  WebSocket unavailable, using HTTP: {ex.Message}");
+                reconnectAfter = DateTime.UtcNow.AddSeconds(30);
+                return false;
+            }
+            finally
+            {
+                ingestLock.Release();
+            }
+        }
+
+        private async Task ReceiveAcks(ClientWebSocket socket)
+        {
+            var buffer = new byte[64 * 1024];
+            var message = new StringBuilder();
+
+            try
+            {
+                while (socket.State == WebSocketState.Open)
+                {
+                    var result = await socket.ReceiveAsync(new ArraySegment<byte>(buffer), CancellationToken.None);
+                    if (result.MessageType == WebSocketMessageType.Close)
+                        break;
+
+                    message.Append(Encoding.UTF8.GetString(buffer, 0, result.Count));
+                    if (!result.EndOfMessage)
+                        continue;
+
+                    var ack = JObject.Parse(message.ToString());
+                    message.Clear();
+
+                    // Only errors are printed (acks arrive every 300ms)
+                    if (ack.Value<bool?>("success") == false || ack.Value<string>("type") == "error")
+                    {
+                        Print($"⚠️  Backend error: {ack.Value<string>("error")}");
+
+                        int? retryAfter = ack.Value<int?>("retryAfter");
+                        if (retryAfter.HasValue)
+                        {
+                            backoffUntil = DateTime.UtcNow.AddSeconds(retryAfter.Value);
+                            Print($"   Retrying in {retryAfter.Value}s");
+                        }
+                    }
+                }
+            }
+            catch (Exception ex)
+            {
+                Print($"⚠️  WebSocket closed: {ex.Message}");
+            }
+        }
+
         private double GetHighWaterMark()
         {
             // TODO: Load from persistent storage
@@ -4,7 +4,19 @@ Payout King Rules Engine
 Core rule calculation logic for prop-firm compliance tracking.
 """
 
+from .aggregates import DailyPnlAggregate
+from .compare import MultiFirmEvaluator
 from .engine import RuleEngine
+from .fixed_point import FixedPointRuleEngine
+from .history import DailyPnlHistory
+from .peaks import PeakLossTracker
+from .profiling import RuleProfiler
+from .registry import RuleSpec, register_rule
+from .incremental import IncrementalEvaluator
+from .instruments import InstrumentSpec, get_instrument, violation_prices
+from .plan import RulePlan, compile_rules
+from .replay import ReplayRunner
+from .results import CompactEvaluationResult, CompactRuleEngine
 from .interface import AccountSnapshot, RuleEvaluationResult, PositionSnapshot
 from .models import (
     FirmRules,
@@ -15,6 +27,23 @@ from .models import (
 
 __all__ = [
     "RuleEngine",
+    "FixedPointRuleEngine",
+    "IncrementalEvaluator",
+    "InstrumentSpec",
+    "get_instrument",
+    "violation_prices",
+    "DailyPnlAggregate",
+    "DailyPnlHistory",
+    "PeakLossTracker",
+    "RuleProfiler",
+    "RuleSpec",
+    "register_rule",
+    "MultiFirmEvaluator",
+    "CompactRuleEngine",
+    "CompactEvaluationResult",
+    "ReplayRunner",
+    "RulePlan",
+    "compile_rules",
     "AccountSnapshot",  # FROZEN INPUT INTERFACE
     "RuleEvaluationResult",  # FROZEN OUTPUT INTERFACE
     "PositionSnapshot",
@@ -0,0 +1,101 @@
+"""
+Streaming aggregates over an account's daily PnL history.
+
+The consistency and minimum-trading-days rules only need three numbers from
+the history: the largest day, the number of qualifying days and (for
+reporting) the running total. DailyPnlAggregate keeps them up to date as
+days are recorded, so a tick that only changes today's PnL costs O(1)
+instead of a pass over months of history.
+"""
+
+from decimal import Decimal
+from typing import Dict, Mapping, Optional
+
+
+class DailyPnlAggregate:
+    """
+    Running total, largest day and qualifying-day counts for one account.
+
+    Record days with set_day(). Updating the most recently recorded day
+    (today, on a live stream) is O(1); revising an older day is O(1) unless
+    that day is the largest one, which triggers one rescan.
+
+    version increases on every change, so callers can cheaply tell whether
+    anything moved since they last looked.
+    """
+
+    def __init__(self, history: Optional[Mapping[str, Decimal]] = None):
+        self.version = 0
+        self.total = Decimal("0")
+        self._days: Dict[str, Decimal] = {}
+        # The largest day is tracked as max(largest of settled days, hot day)
+        # where the hot day is the one last written.
+        self._hot_date: Optional[str] = None
+        self._settled_max: Optional[Decimal] = None
+        self._qualifying: Dict[Decimal, int] = {}
+        if history:
+            for date, pnl in history.items():
+                self.set_day(date, pnl)
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    @property
+    def days(self) -> Mapping[str, Decimal]:
+        """The recorded history (read-only view)."""
+        return self._days
+
+    @property
+    def max_day(self) -> Optional[Decimal]:
+        """Largest single-day PnL, or None if no days are recorded."""
+        if self._hot_date is None:
+            return self._settled_max
+        hot = self._days[self._hot_date]
+        if self._settled_max is None or hot > self._settled_max:
+            return hot
+        return self._settled_max
+
+    def qualifying_days(self, min_profit_per_day: Decimal) -> int:
+        """
+        Number of days with PnL >= min_profit_per_day.
+
+        The first call for a threshold scans the history once; the count is
+        then maintained on every set_day().
+        """
+        count = self._qualifying.get(min_profit_per_day)
+        if count is None:
+            count = sum(1 for pnl in self._days.values() if pnl >= min_profit_per_day)
+            self._qualifying[min_profit_per_day] = count
+        return count
+
+    def set_day(self, date: str, pnl: Decimal) -> None:
+        """Record (or revise) the realized PnL of one date (YYYY-MM-DD)."""
+        old = self._days.get(date)
+        if old is not None and old == pnl:
+            return
+
+        if date != self._hot_date:
+            self._settle_hot_day()
+            if old is not None and old == self._settled_max:
+                # The largest settled day becomes the hot day: rescan the rest
+                self._settled_max = max(
+                    (value for day, value in self._days.items() if day != date),
+                    default=None,
+                )
+            self._hot_date = date
+
+        self._days[date] = pnl
+        self.total += pnl - (old if old is not None else Decimal("0"))
+        for threshold in self._qualifying:
+            self._qualifying[threshold] += (pnl >= threshold) - (
+                old is not None and old >= threshold
+            )
+        self.version += 1
+
+    def _settle_hot_day(self) -> None:
+        if self._hot_date is None:
+            return
+        hot = self._days[self._hot_date]
+        if self._settled_max is None or hot > self._settled_max:
+            self._settled_max = hot
+        self._hot_date = None
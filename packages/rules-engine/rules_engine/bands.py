@@ -0,0 +1,160 @@
+"""
+Threshold bands for status classification.
+
+Every rule maps one measure (loss used, buffer percent, contracts held,
+seconds to the close, ...) onto a status with an if/elif chain of
+thresholds. ThresholdBands is that chain compiled once per rule plan into
+sorted cut points, so classification is a single bisect on a scalar or
+np.searchsorted on an array, whatever the number of tiers.
+
+The same bands drive the Decimal engine (classify), the fixed-point engine
+(band_index, ratio_band_indices on ints) and the vectorized price sweep
+(band_indices, ratio_band_indices on arrays), so the paths cannot drift.
+"""
+
+from bisect import bisect_left, bisect_right
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .models import RuleStatus
+
+Tier = Tuple[RuleStatus, Any]
+
+
+class ThresholdBands:
+    """
+    Statuses for consecutive ranges of a measure.
+
+    cuts are ascending; a value v falls in band i where i is the number of
+    cuts below v. upper_inclusive=True puts a value equal to a cut in the
+    band above it (the chain tested v >= cut), False in the band below it
+    (the chain tested v > cut or v <= cut).
+    """
+
+    __slots__ = ("cuts", "statuses", "upper_inclusive", "_bisect", "_integer_cuts")
+
+    def __init__(
+        self, cuts: Sequence[Any], statuses: Sequence[RuleStatus], upper_inclusive: bool
+    ):
+        if len(statuses) != len(cuts) + 1:
+            raise ValueError("ThresholdBands needs exactly one more status than cuts")
+        if any(low > high for low, high in zip(cuts, cuts[1:])):
+            raise ValueError("ThresholdBands cuts must be ascending")
+        self.cuts = tuple(cuts)
+        self.statuses = tuple(statuses)
+        self.upper_inclusive = upper_inclusive
+        self._bisect = bisect_right if upper_inclusive else bisect_left
+        self._integer_cuts: Dict[int, Tuple[int, ...]] = {}
+
+    @classmethod
+    def rising(
+        cls, tiers: Sequence[Tier], otherwise: RuleStatus, inclusive: bool = True
+    ) -> "ThresholdBands":
+        """
+        Bands for a chain where larger values are checked first:
+
+            if v >= cut_1: tier_1 elif v >= cut_2: tier_2 ... else otherwise
+
+        tiers are (status, cut) in the chain's order; inclusive=False for >.
+        A cut above an earlier one can never match and becomes an empty band.
+        """
+        cuts: List[Any] = []
+        for _, cut in tiers:
+            cuts.append(cut if not cuts else min(cut, cuts[-1]))
+        statuses = [otherwise] + [status for status, _ in reversed(tiers)]
+        return cls(cuts[::-1], statuses, upper_inclusive=inclusive)
+
+    @classmethod
+    def falling(
+        cls, tiers: Sequence[Tier], otherwise: RuleStatus, inclusive: bool = True
+    ) -> "ThresholdBands":
+        """
+        Bands for a chain where smaller values are checked first:
+
+            if v <= cut_1: tier_1 elif v <= cut_2: tier_2 ... else otherwise
+
+        tiers are (status, cut) in the chain's order; inclusive=False for <.
+        """
+        cuts: List[Any] = []
+        for _, cut in tiers:
+            cuts.append(cut if not cuts else max(cut, cuts[-1]))
+        statuses = [status for status, _ in tiers] + [otherwise]
+        return cls(cuts, statuses, upper_inclusive=not inclusive)
+
+    def classify(self, value: Any) -> RuleStatus:
+        """Status of one value."""
+        return self.statuses[self._bisect(self.cuts, value)]
+
+    def classify_many(self, values: Sequence[Any]) -> List[RuleStatus]:
+        """Statuses of many values."""
+        cuts, statuses, bisect = self.cuts, self.statuses, self._bisect
+        return [statuses[bisect(cuts, value)] for value in values]
+
+    def integer_cuts(self, scale: int = 1) -> Tuple[int, ...]:
+        """
+        Cuts for an integer measure in units of 1/scale (e.g. scale=100 for cents).
+
+        Rounded so that integer values land in the same band as they would
+        against the exact Decimal cuts. Computed once per scale.
+        """
+        cuts = self._integer_cuts.get(scale)
+        if cuts is None:
+            rounding = ROUND_CEILING if self.upper_inclusive else ROUND_FLOOR
+            cuts = tuple(
+                int((Decimal(cut) * scale).to_integral_value(rounding=rounding))
+                for cut in self.cuts
+            )
+            self._integer_cuts[scale] = cuts
+        return cuts
+
+    def band_index(self, value: int, scale: int = 1) -> int:
+        """Band index (into statuses) of an integer measure in units of 1/scale."""
+        return self._bisect(self.integer_cuts(scale), value)
+
+    def ratio_band_indices(self, part: Any, whole: int, scale: int = 100) -> Any:
+        """
+        Band index of the percentage part / whole * 100, compared exactly.
+
+        For bands over a percentage when the measure is a ratio of integers
+        (buffer left over the allowance, ...). part is an int or an integer
+        NumPy array, whole a positive int; no division is done. Cuts are
+        read in 1/scale percent (basis points by default) and must be whole
+        multiples of that unit to be exact.
+        """
+        scaled = part * (100 * scale)
+        if self.upper_inclusive:
+            return sum(scaled >= whole * cut for cut in self.integer_cuts(scale))
+        return sum(scaled > whole * cut for cut in self.integer_cuts(scale))
+
+    def band_indices(self, values: Any, scale: int = 1) -> Any:
+        """
+        Band index of every element of an integer NumPy array (units of 1/scale).
+
+        Index into statuses; classification is one np.searchsorted call.
+        Requires NumPy (the "numpy" extra).
+        """
+        import numpy as np
+
+        side = "right" if self.upper_inclusive else "left"
+        return np.searchsorted(
+            np.array(self.integer_cuts(scale), dtype=np.int64), values, side=side
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ThresholdBands):
+            return NotImplemented
+        return (self.cuts, self.statuses, self.upper_inclusive) == (
+            other.cuts,
+            other.statuses,
+            other.upper_inclusive,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.cuts, self.statuses, self.upper_inclusive))
+
+    def __repr__(self) -> str:
+        return (
+            f"ThresholdBands(cuts={self.cuts!r}, statuses="
+            f"{[status.value for status in self.statuses]!r}, "
+            f"upper_inclusive={self.upper_inclusive})"
+        )
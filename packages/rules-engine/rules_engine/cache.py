@@ -0,0 +1,118 @@
+"""
+Memoization of evaluations for repeated identical snapshots.
+
+Platform add-ons post the full account state on a fixed interval even when
+nothing changed (flat accounts, outside market hours). EvaluationCache keeps
+the last result per account together with a fingerprint of the snapshot
+fields the rule plan reads, and returns that result again while the
+fingerprint is unchanged.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .engine import RuleEngine
+from .incremental import _read_field
+from .interface import AccountSnapshot, RuleEvaluationResult
+
+
+def snapshot_fingerprint(
+    engine: RuleEngine, snapshot: AccountSnapshot
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Fingerprint of everything an evaluation under engine depends on.
+
+    Returns None when the plan has rules with undeclared inputs, in which
+    case the snapshot cannot be safely memoized.
+    """
+    reads = engine.plan.reads
+    if reads is None:
+        return None
+    return (type(engine), engine.plan.key) + tuple(
+        _read_field(snapshot, field) for field in reads
+    )
+
+
+class EvaluationCache:
+    """
+    Per-account memo of the last evaluation.
+
+    evaluate() returns the previous RuleEvaluationResult for the account,
+    re-stamped with the new snapshot's timestamp, when the fingerprint
+    matches; otherwise it calls engine.evaluate() and remembers the result.
+    Only the latest snapshot per account is kept, so memory is bounded by
+    the number of accounts.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[Tuple[Any, ...], RuleEvaluationResult]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def evaluate(
+        self, engine: RuleEngine, snapshot: AccountSnapshot
+    ) -> RuleEvaluationResult:
+        """Evaluate snapshot under engine, reusing the last result if unchanged."""
+        fingerprint = snapshot_fingerprint(engine, snapshot)
+        if fingerprint is not None:
+            entry = self._entries.get(snapshot.account_id)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                result = entry[1]
+                if result.timestamp != snapshot.timestamp:
+                    result = result.model_copy(update={"timestamp": snapshot.timestamp})
+                return result
+
+        self.misses += 1
+        result = engine.evaluate(snapshot)
+        if fingerprint is not None:
+            self._entries[snapshot.account_id] = (fingerprint, result)
+        return result
+
+    def evaluate_many(
+        self, engine: RuleEngine, snapshots: Sequence[AccountSnapshot]
+    ) -> List[RuleEvaluationResult]:
+        """
+        Evaluate snapshots of different accounts under one engine.
+
+        Unchanged accounts are served from the cache; the rest are evaluated
+        together with engine.evaluate_many(). Results are in input order.
+        """
+        results: List[Optional[RuleEvaluationResult]] = [None] * len(snapshots)
+        fingerprints = {}
+        pending = []
+        for index, snapshot in enumerate(snapshots):
+            fingerprint = snapshot_fingerprint(engine, snapshot)
+            if fingerprint is not None:
+                entry = self._entries.get(snapshot.account_id)
+                if entry is not None and entry[0] == fingerprint:
+                    self.hits += 1
+                    result = entry[1]
+                    if result.timestamp != snapshot.timestamp:
+                        result = result.model_copy(update={"timestamp": snapshot.timestamp})
+                    results[index] = result
+                    continue
+            fingerprints[index] = fingerprint
+            pending.append(index)
+
+        if pending:
+            self.misses += len(pending)
+            evaluated = engine.evaluate_many([snapshots[index] for index in pending])
+            for index, result in zip(pending, evaluated):
+                results[index] = result
+                if fingerprints[index] is not None:
+                    self._entries[snapshots[index].account_id] = (fingerprints[index], result)
+        return results
+
+    def invalidate(self, account_id: Optional[str] = None) -> None:
+        """Forget one account's entry, or all entries."""
+        if account_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(account_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and number of accounts cached."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
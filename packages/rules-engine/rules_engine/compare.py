@@ -0,0 +1,85 @@
+"""
+Evaluation of one snapshot under several rule sets.
+
+Firms share a lot of rules: the same trading-hours cut-off, the same 5%
+trailing drawdown, the same profit target for every account type.
+MultiFirmEvaluator evaluates a snapshot under many engines in one pass,
+computing each distinct rule configuration once and handing the resulting
+RuleState to every rule set that contains it.
+"""
+
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from .engine import RuleEngine
+from .interface import AccountSnapshot, RuleEvaluationResult
+from .models import RuleState
+from .plan import RulePlan
+
+# (engine class, rule name, rule configuration)
+RuleKey = Tuple[type, str, str]
+
+# plan.key -> rule name -> serialized rule configuration
+_rule_configs: Dict[str, Dict[str, str]] = {}
+
+
+def _plan_rule_configs(plan: RulePlan) -> Dict[str, str]:
+    configs = _rule_configs.get(plan.key)
+    if configs is None:
+        configs = {
+            compiled.name: compiled.rule.model_dump_json() for compiled in plan.rules
+        }
+        _rule_configs[plan.key] = configs
+    return configs
+
+
+class MultiFirmEvaluator:
+    """
+    Evaluates a snapshot under a fixed set of labelled engines.
+
+    Rule states are keyed by engine class, rule name and rule configuration,
+    so two rule sets with an identical rule share one computation. Results
+    are identical to calling evaluate() on each engine.
+    """
+
+    def __init__(self, engines: Mapping[str, RuleEngine]):
+        self.engines = dict(engines)
+        self.computed = 0
+        self.shared = 0
+        self._plans: List[Tuple[str, RuleEngine, List[Tuple[str, RuleKey, Callable]]]] = []
+        for label, engine in self.engines.items():
+            configs = _plan_rule_configs(engine.plan)
+            evaluators = [
+                (rule_name, (type(engine), rule_name, configs[rule_name]), calculate)
+                for rule_name, calculate in engine._evaluators
+            ]
+            self._plans.append((label, engine, evaluators))
+
+    @property
+    def distinct_rules(self) -> int:
+        """Number of distinct rule configurations across all engines."""
+        return len({key for _, _, evaluators in self._plans for _, key, _ in evaluators})
+
+    def evaluate(self, snapshot: AccountSnapshot) -> Dict[str, RuleEvaluationResult]:
+        """Evaluate the snapshot under every engine, by label."""
+        computed: Dict[RuleKey, Optional[RuleState]] = {}
+        results = {}
+        for label, engine, evaluators in self._plans:
+            rule_states = {}
+            for rule_name, key, calculate in evaluators:
+                if key in computed:
+                    state = computed[key]
+                    self.shared += 1
+                else:
+                    state = computed[key] = calculate(snapshot)
+                    self.computed += 1
+                if state is not None:
+                    rule_states[rule_name] = state
+            results[label] = engine._make_result(snapshot, rule_states)
+        return results
+
+
+def evaluate_across(
+    engines: Mapping[str, RuleEngine], snapshot: AccountSnapshot
+) -> Dict[str, RuleEvaluationResult]:
+    """Evaluate one snapshot under every labelled engine in a single pass."""
+    return MultiFirmEvaluator(engines).evaluate(snapshot)
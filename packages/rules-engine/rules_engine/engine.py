@@ -3,8 +3,11 @@ Core rule engine that calculates rule states and distances to violation.
 """
 
 from decimal import Decimal
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence
 
+from .aggregates import DailyPnlAggregate
+from .history import DailyPnlHistory
 from .models import (
     DistanceMetric,
     FirmRules,
@@ -15,6 +18,9 @@ from .models import (
     RuleType,
 )
 from .interface import AccountSnapshot, RuleEvaluationResult
+from .plan import CompiledRule, compile_rules
+from .profiling import RuleProfiler, profiled_method_names
+from .sessions import to_epoch_seconds
 
 
 class RuleEngine:
@@ -24,9 +30,101 @@ class RuleEngine:
     This is the core intellectual property of Payout King.
     """
 
+    # Classes the calculators build rule states with (see results.CompactRuleEngine)
+    rule_state_class = RuleState
+    distance_class = DistanceMetric
+
+    # Set by enable_profiling()
+    profiler: Optional[RuleProfiler] = None
+
     def __init__(self, rules: FirmRules):
         self.rules = rules
 
+    @property
+    def rules(self) -> FirmRules:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: FirmRules) -> None:
+        """
+        Set the rules and compile them into a plan.
+
+        Plans are shared between engines with identical rules. Mutating a
+        FirmRules after assignment does not affect the plan; reassign
+        engine.rules instead.
+        """
+        self._rules = rules
+        self.plan = compile_rules(rules)
+        self._evaluators = [
+            (compiled.name, self._rule_evaluator(compiled))
+            for compiled in self.plan.rules
+        ]
+
+    def _rule_evaluator(
+        self, compiled: CompiledRule, required: bool = True
+    ) -> Callable[[AccountSnapshot], Optional[RuleState]]:
+        """
+        Callable evaluating one compiled rule on a snapshot.
+
+        Built-in rules call their _calculate_* method, plugin rules their
+        registered evaluator. With required=True, a rule whose required
+        inputs are missing returns its placeholder state (computed once per
+        engine) or None without being evaluated.
+        """
+        if compiled.method is not None:
+            calculate = getattr(self, compiled.method)
+        else:
+            calculate = partial(compiled.evaluator, self, compiled)
+            if self.profiler is not None:
+                calculate = self.profiler.wrap(compiled.name, calculate)
+        if not required or not compiled.requires:
+            return calculate
+
+        requires = compiled.requires
+        placeholder = compiled.placeholder
+        missing = []
+
+        def evaluate_if_present(account_state: AccountSnapshot, *args, **kwargs):
+            for field in requires:
+                if not getattr(account_state, field):
+                    if placeholder is None:
+                        return None
+                    if not missing:
+                        missing.append(placeholder(self, compiled))
+                    return missing[0]
+            return calculate(account_state, *args, **kwargs)
+
+        return evaluate_if_present
+
+    def enable_profiling(self, profiler: Optional[RuleProfiler] = None) -> RuleProfiler:
+        """
+        Record per-method call counts and latencies on this engine.
+
+        Every _calculate_* method, get_max_allowed_risk and
+        _calculate_overall_risk_level is timed, whichever path calls it
+        (evaluate, evaluate_many, incremental or multi-firm evaluation).
+        Pass a shared profiler to aggregate several engines.
+
+        Returns the profiler; read it with profiler.snapshot().
+        """
+        if self.profiler is not None:
+            self.disable_profiling()
+        profiler = profiler if profiler is not None else RuleProfiler()
+        for name in profiled_method_names(type(self)):
+            setattr(self, name, profiler.wrap(name, getattr(self, name)))
+        self.profiler = profiler
+        self.rules = self._rules
+        return profiler
+
+    def disable_profiling(self) -> None:
+        """Remove the timing wrappers installed by enable_profiling()."""
+        if self.profiler is None:
+            return
+        for name in profiled_method_names(type(self)):
+            self.__dict__.pop(name, None)
+        self.profiler = None
+        self.rules = self._rules
+
     def evaluate(self, snapshot: AccountSnapshot) -> RuleEvaluationResult:
         """
         FROZEN INTERFACE METHOD
@@ -41,9 +139,15 @@ class RuleEngine:
             RuleEvaluationResult with all rule states and risk metrics
         """
         rule_states = self.calculate_all_rule_states(snapshot)
+        return self._make_result(snapshot, rule_states)
+
+    def _make_result(
+        self, snapshot: AccountSnapshot, rule_states: Dict[str, RuleState]
+    ) -> RuleEvaluationResult:
+        """Assemble the evaluation result for a snapshot from its rule states."""
         max_allowed_risk = self.get_max_allowed_risk(snapshot, rule_states)
         overall_risk_level = self._calculate_overall_risk_level(rule_states)
-        
+
         return RuleEvaluationResult(
             account_id=snapshot.account_id,
             timestamp=snapshot.timestamp,
@@ -52,56 +156,73 @@ class RuleEngine:
             overall_risk_level=overall_risk_level,
         )
 
+    def evaluate_many(
+        self, snapshots: Sequence[AccountSnapshot]
+    ) -> List[RuleEvaluationResult]:
+        """
+        Evaluate rules against many account snapshots in one call.
+
+        Rules are evaluated column-wise: each enabled rule runs once over the
+        whole batch with its configuration and constants resolved a single
+        time, instead of once per account.
+
+        Args:
+            snapshots: AccountSnapshots to evaluate (all under this engine's rules)
+
+        Returns:
+            RuleEvaluationResults in the same order as the input snapshots.
+            Each result is identical to what evaluate() returns for that snapshot.
+        """
+        snapshots = list(snapshots)
+        rule_state_columns = self.calculate_all_rule_states_many(snapshots)
+
+        results = []
+        for index, snapshot in enumerate(snapshots):
+            rule_states = {
+                rule_name: states[index]
+                for rule_name, states in rule_state_columns.items()
+                if states[index] is not None
+            }
+            results.append(self._make_result(snapshot, rule_states))
+        return results
+
+    def calculate_all_rule_states_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> Dict[str, List[RuleState]]:
+        """
+        Calculate the state of all enabled rules for a batch of accounts.
+
+        Returns a dictionary mapping rule names to a list of states, one per
+        account, in input order. Rule order matches calculate_all_rule_states.
+        A state is None where a rule without placeholder lacks its inputs.
+        """
+        rule_states = {}
+        for compiled in self.plan.rules:
+            if compiled.batch_method is not None:
+                rule_states[compiled.name] = getattr(self, compiled.batch_method)(
+                    account_states
+                )
+            else:
+                calculate = self._rule_evaluator(compiled)
+                rule_states[compiled.name] = [
+                    calculate(state) for state in account_states
+                ]
+        return rule_states
+
     def calculate_all_rule_states(
         self, account_state: AccountSnapshot
     ) -> Dict[str, RuleState]:
         """
         Calculate the state of all enabled rules.
 
-        Returns a dictionary mapping rule names to their states.
+        Returns a dictionary mapping rule names to their states. Rules
+        missing a required input and without placeholder are left out.
         """
         rule_states = {}
-
-        if self.rules.trailing_drawdown and self.rules.trailing_drawdown.enabled:
-            rule_states["trailing_drawdown"] = self._calculate_trailing_drawdown(
-                account_state
-            )
-
-        if self.rules.daily_loss_limit and self.rules.daily_loss_limit.enabled:
-            rule_states["daily_loss_limit"] = self._calculate_daily_loss_limit(
-                account_state
-            )
-
-        if self.rules.overall_max_loss and self.rules.overall_max_loss.enabled:
-            rule_states["overall_max_loss"] = self._calculate_overall_max_loss(
-                account_state
-            )
-
-        if self.rules.max_position_size and self.rules.max_position_size.enabled:
-            rule_states["max_position_size"] = self._calculate_max_position_size(
-                account_state
-            )
-
-        if self.rules.mae_rule and self.rules.mae_rule.enabled:
-            rule_states["mae"] = self._calculate_mae(account_state)
-
-        if self.rules.consistency_rule and self.rules.consistency_rule.enabled:
-            rule_states["consistency"] = self._calculate_consistency(
-                account_state, 
-                daily_pnl_history=account_state.daily_pnl_history
-            )
-
-        if self.rules.trading_hours and self.rules.trading_hours.enabled:
-            rule_states["trading_hours"] = self._calculate_trading_hours(account_state)
-
-        if self.rules.minimum_trading_days and self.rules.minimum_trading_days.enabled:
-            rule_states["minimum_trading_days"] = self._calculate_minimum_trading_days(
-                account_state
-            )
-
-        if self.rules.profit_target and self.rules.profit_target.enabled:
-            rule_states["profit_target"] = self._calculate_profit_target(account_state)
-
+        for rule_name, calculate in self._evaluators:
+            state = calculate(account_state)
+            if state is not None:
+                rule_states[rule_name] = state
         return rule_states
 
     def _calculate_overall_risk_level(
@@ -126,6 +247,16 @@ class RuleEngine:
         """
         Calculate trailing drawdown state.
 
+        See _calculate_trailing_drawdown_many for the calculation.
+        """
+        return self._calculate_trailing_drawdown_many([account_state])[0]
+
+    def _calculate_trailing_drawdown_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """
+        Calculate trailing drawdown state for a batch of accounts.
+
         Trailing drawdown is calculated from the high-water mark.
         If include_unrealized_pnl is True, we use equity. Otherwise, use balance.
         
@@ -135,85 +266,93 @@ class RuleEngine:
         - CRITICAL: Within 5% of threshold
         - VIOLATED: At or below threshold
         """
-        rule = self.rules.trailing_drawdown
-        assert rule is not None
-
-        # Use equity if unrealized PnL is included, otherwise use balance
-        current_value = (
-            account_state.equity
-            if rule.include_unrealized_pnl
-            else account_state.balance
-        )
-
-        # Calculate maximum allowed drawdown threshold
-        max_drawdown_threshold = (
-            account_state.high_water_mark * Decimal(str(rule.max_drawdown_percent)) / Decimal("100")
-        )
-        min_allowed_value = account_state.high_water_mark - max_drawdown_threshold
+        compiled = self.plan.get("trailing_drawdown")
+        assert compiled is not None
+        rule = compiled.rule
 
-        # Remaining buffer is how much more we can lose before violation
-        # Formula: distance_to_violation = current_equity - (high_water_mark * 0.95)
-        remaining_buffer = current_value - min_allowed_value
+        max_drawdown_percent = compiled.max_drawdown_percent
+        bands = compiled.bands
+        recovery_path = compiled.recovery_path
 
-        # Calculate status levels per specification
-        # SAFE: current_equity > (high_water_mark * 0.95) + (threshold * 0.20)
-        # CAUTION: within 20% of threshold
-        # CRITICAL: within 5% of threshold
-        safe_threshold = min_allowed_value + (max_drawdown_threshold * Decimal("0.20"))
-        caution_threshold = min_allowed_value + (max_drawdown_threshold * Decimal("0.20"))
-        critical_threshold = min_allowed_value + (max_drawdown_threshold * Decimal("0.05"))
-
-        # Determine status
-        if remaining_buffer <= 0:
-            status = RuleStatus.VIOLATED
-        elif current_value <= critical_threshold:
-            status = RuleStatus.CRITICAL
-        elif current_value <= caution_threshold:
-            status = RuleStatus.CAUTION
+        # Use equity if unrealized PnL is included, otherwise use balance
+        if rule.include_unrealized_pnl:
+            current_values = [state.equity for state in account_states]
         else:
-            status = RuleStatus.SAFE
+            current_values = [state.balance for state in account_states]
 
-        # Buffer as percentage of max_drawdown_threshold (0-100)
-        buffer_percent = (
-            (remaining_buffer / max_drawdown_threshold) * Decimal("100")
-            if max_drawdown_threshold > 0
-            else Decimal("100")
-        )
+        # Calculate maximum allowed drawdown threshold
+        max_drawdown_thresholds = [
+            state.high_water_mark * max_drawdown_percent / Decimal("100")
+            for state in account_states
+        ]
+        min_allowed_values = [
+            state.high_water_mark - max_drawdown_threshold
+            for state, max_drawdown_threshold in zip(
+                account_states, max_drawdown_thresholds
+            )
+        ]
+
+        rule_states = []
+        for current_value, max_drawdown_threshold, min_allowed_value in zip(
+            current_values, max_drawdown_thresholds, min_allowed_values
+        ):
+            # Remaining buffer is how much more we can lose before violation
+            # Formula: distance_to_violation = current_equity - (high_water_mark * 0.95)
+            remaining_buffer = current_value - min_allowed_value
+
+            # Buffer as percentage of max_drawdown_threshold (0-100)
+            buffer_percent = (
+                (remaining_buffer / max_drawdown_threshold) * Decimal("100")
+                if max_drawdown_threshold > 0
+                else Decimal("100")
+            )
 
-        # Distance to violation
-        distance = DistanceMetric(
-            dollars=remaining_buffer,
-            percent=buffer_percent,
-        )
+            # Determine status per specification
+            # CAUTION: within 20% of threshold
+            # CRITICAL: within 5% of threshold
+            if remaining_buffer <= 0:
+                status = RuleStatus.VIOLATED
+            else:
+                status = bands.classify(buffer_percent)
 
-        warnings = []
-        if status == RuleStatus.VIOLATED:
-            warnings.append(
-                f"Trailing drawdown VIOLATED: Account has breached drawdown limit"
-            )
-        elif status == RuleStatus.CRITICAL:
-            warnings.append(
-                f"Trailing drawdown critical: ${remaining_buffer:.2f} remaining (within 5% of threshold)"
+            # Distance to violation
+            distance = self.distance_class(
+                dollars=remaining_buffer,
+                percent=buffer_percent,
             )
-        elif status == RuleStatus.CAUTION:
-            warnings.append(
-                f"Trailing drawdown caution: ${remaining_buffer:.2f} remaining (within 20% of threshold)"
+
+            warnings = []
+            if status == RuleStatus.VIOLATED:
+                warnings.append(
+                    f"Trailing drawdown VIOLATED: Account has breached drawdown limit"
+                )
+            elif status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"Trailing drawdown critical: ${remaining_buffer:.2f} remaining (within 5% of threshold)"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"Trailing drawdown caution: ${remaining_buffer:.2f} remaining (within 20% of threshold)"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="trailing_drawdown",
+                    current_value=current_value,
+                    threshold=min_allowed_value,
+                    remaining_buffer=remaining_buffer,
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=distance,
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path=recovery_path,
+                )
             )
 
-        return RuleState(
-            rule_name="trailing_drawdown",
-            current_value=current_value,
-            threshold=min_allowed_value,
-            remaining_buffer=remaining_buffer,
-            buffer_percent=buffer_percent,
-            status=status,
-            distance_to_violation=distance,
-            warnings=warnings,
-            recoverable=rule.recoverable,
-            severity=rule.severity,
-            rule_type=rule.rule_type,
-            recovery_path=None if rule.recoverable == RuleRecoverability.NON_RECOVERABLE else "Cannot recover - account fails immediately",
-        )
+        return rule_states
 
     def _calculate_daily_loss_limit(
         self, account_state: AccountSnapshot
@@ -221,6 +360,16 @@ class RuleEngine:
         """
         Calculate daily loss limit state.
 
+        See _calculate_daily_loss_limit_many for the calculation.
+        """
+        return self._calculate_daily_loss_limit_many([account_state])[0]
+
+    def _calculate_daily_loss_limit_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """
+        Calculate daily loss limit state for a batch of accounts.
+
         Daily loss is tracked from the start of the trading day.
         Only realized PnL counts (unrealized PnL excluded).
         
@@ -230,78 +379,78 @@ class RuleEngine:
         - CRITICAL: (daily_loss_limit * 0.95) <= daily_loss < daily_loss_limit
         - VIOLATED: daily_loss >= daily_loss_limit
         """
-        rule = self.rules.daily_loss_limit
-        assert rule is not None
+        compiled = self.plan.get("daily_loss_limit")
+        assert compiled is not None
+        rule = compiled.rule
+
+        max_loss_decimal = compiled.max_loss
+        recovery_path = compiled.recovery_path
 
         # Daily loss = -daily_realized_pnl (only realized PnL counts, unrealized excluded)
         # daily_pnl in account_state should already be daily realized PnL
-        daily_loss = -account_state.daily_pnl if account_state.daily_pnl < 0 else Decimal("0")
-
-        # Remaining buffer is how much more we can lose today
-        # Formula: distance_to_violation = daily_loss_limit - daily_loss
-        max_loss_decimal = Decimal(str(rule.max_loss_amount))
-        remaining_buffer = max_loss_decimal - daily_loss
+        daily_losses = [
+            -state.daily_pnl if state.daily_pnl < 0 else Decimal("0")
+            for state in account_states
+        ]
+
+        statuses = compiled.bands.classify_many(daily_losses)
+
+        rule_states = []
+        for daily_loss, status in zip(daily_losses, statuses):
+            # Remaining buffer is how much more we can lose today
+            # Formula: distance_to_violation = daily_loss_limit - daily_loss
+            remaining_buffer = max_loss_decimal - daily_loss
+
+            # Buffer as percentage of limit remaining
+            buffer_percent = (
+                (remaining_buffer / max_loss_decimal) * Decimal("100")
+                if max_loss_decimal > 0
+                else Decimal("0")
+            )
 
-        # Buffer as percentage of limit remaining
-        buffer_percent = (
-            (remaining_buffer / max_loss_decimal) * Decimal("100")
-            if max_loss_decimal > 0
-            else Decimal("0")
-        )
+            # Status is by percentage of limit used (compiled.bands)
+            # SAFE: loss < 80% of limit
+            # CAUTION: 80% <= loss < 95%
+            # CRITICAL: 95% <= loss < 100%
+            # VIOLATED: loss >= 100%
 
-        # Determine status based on percentage of limit used
-        # SAFE: loss < 80% of limit
-        # CAUTION: 80% <= loss < 95%
-        # CRITICAL: 95% <= loss < 100%
-        # VIOLATED: loss >= 100%
-        if daily_loss >= max_loss_decimal:
-            status = RuleStatus.VIOLATED
-        elif daily_loss >= (max_loss_decimal * Decimal("0.95")):
-            status = RuleStatus.CRITICAL
-        elif daily_loss >= (max_loss_decimal * Decimal("0.80")):
-            status = RuleStatus.CAUTION
-        else:
-            status = RuleStatus.SAFE
-
-        distance = DistanceMetric(
-            dollars=remaining_buffer,
-            percent=buffer_percent,
-        )
-
-        warnings = []
-        if status == RuleStatus.VIOLATED:
-            warnings.append(
-                f"Daily loss limit VIOLATED: ${daily_loss:.2f} loss exceeds limit of ${max_loss_decimal:.2f}"
+            distance = self.distance_class(
+                dollars=remaining_buffer,
+                percent=buffer_percent,
             )
-        elif status == RuleStatus.CRITICAL:
-            warnings.append(
-                f"Daily loss limit critical: ${remaining_buffer:.2f} remaining (95%+ of limit used)"
-            )
-        elif status == RuleStatus.CAUTION:
-            warnings.append(
-                f"Daily loss limit caution: ${remaining_buffer:.2f} remaining (80%+ of limit used)"
+
+            warnings = []
+            if status == RuleStatus.VIOLATED:
+                warnings.append(
+                    f"Daily loss limit VIOLATED: ${daily_loss:.2f} loss exceeds limit of ${max_loss_decimal:.2f}"
+                )
+            elif status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"Daily loss limit critical: ${remaining_buffer:.2f} remaining (95%+ of limit used)"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"Daily loss limit caution: ${remaining_buffer:.2f} remaining (80%+ of limit used)"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="daily_loss_limit",
+                    current_value=daily_loss,
+                    threshold=rule.max_loss_amount,
+                    remaining_buffer=remaining_buffer,
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=distance,
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path=recovery_path,
+                )
             )
 
-        recovery_path = None
-        if rule.recoverable == RuleRecoverability.RECOVERABLE:
-            recovery_path = f"Trading disabled until next session (resets at {rule.reset_time}). Account does not fail unless repeated abuse."
-        elif rule.recoverable == RuleRecoverability.NON_RECOVERABLE:
-            recovery_path = "Cannot recover - account fails immediately"
-        
-        return RuleState(
-            rule_name="daily_loss_limit",
-            current_value=daily_loss,
-            threshold=rule.max_loss_amount,
-            remaining_buffer=remaining_buffer,
-            buffer_percent=buffer_percent,
-            status=status,
-            distance_to_violation=distance,
-            warnings=warnings,
-            recoverable=rule.recoverable,
-            severity=rule.severity,
-            rule_type=rule.rule_type,
-            recovery_path=recovery_path,
-        )
+        return rule_states
 
     def _calculate_overall_max_loss(
         self, account_state: AccountSnapshot
@@ -309,8 +458,9 @@ class RuleEngine:
         """
         Calculate overall maximum loss state.
         """
-        rule = self.rules.overall_max_loss
-        assert rule is not None
+        compiled = self.plan.get("overall_max_loss")
+        assert compiled is not None
+        rule = compiled.rule
 
         # Calculate total loss from starting balance or absolute
         if rule.from_starting_balance:
@@ -331,14 +481,10 @@ class RuleEngine:
         # Determine status
         if remaining_buffer <= 0:
             status = RuleStatus.VIOLATED
-        elif buffer_percent <= Decimal("10"):
-            status = RuleStatus.CRITICAL
-        elif buffer_percent <= Decimal("30"):
-            status = RuleStatus.CAUTION
         else:
-            status = RuleStatus.SAFE
+            status = compiled.bands.classify(buffer_percent)
 
-        distance = DistanceMetric(
+        distance = self.distance_class(
             dollars=remaining_buffer,
             percent=buffer_percent,
         )
@@ -353,7 +499,7 @@ class RuleEngine:
                 f"Overall max loss caution: ${remaining_buffer:.2f} remaining"
             )
 
-        return RuleState(
+        return self.rule_state_class(
             rule_name="overall_max_loss",
             current_value=total_loss,
             threshold=rule.max_loss_amount,
@@ -369,6 +515,16 @@ class RuleEngine:
     ) -> RuleState:
         """
         Calculate maximum position size state.
+
+        See _calculate_max_position_size_many for the calculation.
+        """
+        return self._calculate_max_position_size_many([account_state])[0]
+
+    def _calculate_max_position_size_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """
+        Calculate maximum position size state for a batch of accounts.
         
         Status levels per specification:
         - SAFE: current_position_size <= (max_position_size * 0.80) - Less than 80% of limit
@@ -376,71 +532,78 @@ class RuleEngine:
         - CRITICAL: (max_position_size * 0.95) < current_position_size < max_position_size
         - VIOLATED: current_position_size > max_position_size
         """
-        rule = self.rules.max_position_size
-        assert rule is not None
+        compiled = self.plan.get("max_position_size")
+        assert compiled is not None
+        rule = compiled.rule
+
+        max_contracts_decimal = compiled.max_contracts
+        recovery_path = compiled.recovery_path
 
         # Calculate current total position size (sum of absolute quantities)
         # This is gross position size across all instruments
-        current_position_size = sum(abs(pos.quantity) for pos in account_state.open_positions)
-
-        # Remaining buffer: how many more contracts can be opened
-        # Formula: distance_to_violation = max_position_size - current_position_size
-        remaining_buffer = rule.max_contracts - current_position_size
-
-        # Buffer as percentage of limit remaining
-        buffer_percent = (
-            (remaining_buffer / rule.max_contracts) * Decimal("100")
-            if rule.max_contracts > 0
-            else Decimal("0")
-        )
-
-        # Determine status based on percentage of limit used
-        # SAFE: position <= 80% of limit
-        # CAUTION: 80% < position <= 95%
-        # CRITICAL: 95% < position < 100%
-        # VIOLATED: position >= 100%
-        if current_position_size > rule.max_contracts:
-            status = RuleStatus.VIOLATED
-        elif current_position_size > (rule.max_contracts * Decimal("0.95")):
-            status = RuleStatus.CRITICAL
-        elif current_position_size > (rule.max_contracts * Decimal("0.80")):
-            status = RuleStatus.CAUTION
-        else:
-            status = RuleStatus.SAFE
+        position_sizes = [
+            sum(abs(pos.quantity) for pos in state.open_positions)
+            for state in account_states
+        ]
+
+        statuses = compiled.bands.classify_many(position_sizes)
+
+        rule_states = []
+        for current_position_size, status in zip(position_sizes, statuses):
+            # Remaining buffer: how many more contracts can be opened
+            # Formula: distance_to_violation = max_position_size - current_position_size
+            remaining_buffer = rule.max_contracts - current_position_size
+
+            # Buffer as percentage of limit remaining
+            buffer_percent = (
+                (Decimal(remaining_buffer) / max_contracts_decimal) * Decimal("100")
+                if rule.max_contracts > 0
+                else Decimal("0")
+            )
 
-        distance = DistanceMetric(
-            contracts=int(remaining_buffer) if remaining_buffer >= 0 else 0,
-            percent=buffer_percent,
-        )
+            # Status is by percentage of limit used (compiled.bands)
+            # SAFE: position <= 80% of limit
+            # CAUTION: 80% < position <= 95%
+            # CRITICAL: 95% < position < 100%
+            # VIOLATED: position >= 100%
 
-        warnings = []
-        if status == RuleStatus.VIOLATED:
-            warnings.append(
-                f"Max position size VIOLATED: {current_position_size} contracts exceeds limit of {rule.max_contracts}"
-            )
-        elif status == RuleStatus.CRITICAL:
-            warnings.append(
-                f"Max position size critical: {int(remaining_buffer)} contracts remaining (95%+ of limit used)"
+            distance = self.distance_class(
+                contracts=int(remaining_buffer) if remaining_buffer >= 0 else 0,
+                percent=buffer_percent,
             )
-        elif status == RuleStatus.CAUTION:
-            warnings.append(
-                f"Max position size caution: {int(remaining_buffer)} contracts remaining (80%+ of limit used)"
+
+            warnings = []
+            if status == RuleStatus.VIOLATED:
+                warnings.append(
+                    f"Max position size VIOLATED: {current_position_size} contracts exceeds limit of {rule.max_contracts}"
+                )
+            elif status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"Max position size critical: {int(remaining_buffer)} contracts remaining (95%+ of limit used)"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"Max position size caution: {int(remaining_buffer)} contracts remaining (80%+ of limit used)"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="max_position_size",
+                    current_value=Decimal(current_position_size),
+                    threshold=max_contracts_decimal,
+                    remaining_buffer=Decimal(remaining_buffer),
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=distance,
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path=recovery_path,
+                )
             )
 
-        return RuleState(
-            rule_name="max_position_size",
-            current_value=Decimal(current_position_size),
-            threshold=Decimal(rule.max_contracts),
-            remaining_buffer=Decimal(remaining_buffer),
-            buffer_percent=buffer_percent,
-            status=status,
-            distance_to_violation=distance,
-            warnings=warnings,
-            recoverable=rule.recoverable,
-            severity=rule.severity,
-            rule_type=rule.rule_type,
-            recovery_path="Cannot recover - account fails immediately" if rule.recoverable == RuleRecoverability.NON_RECOVERABLE else None,
-        )
+        return rule_states
 
     def get_max_allowed_risk(
         self, account_state: AccountSnapshot, rule_states: Dict[str, RuleState]
@@ -478,84 +641,124 @@ class RuleEngine:
     def _calculate_mae(self, account_state: AccountSnapshot) -> RuleState:
         """
         Calculate Maximum Adverse Excursion (MAE) rule state.
+
+        See _calculate_mae_many for the calculation.
+        """
+        return self._calculate_mae_many([account_state])[0]
+
+    def _calculate_mae_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """
+        Calculate Maximum Adverse Excursion (MAE) rule state for a batch of accounts.
         
         MAE tracks peak unrealized loss on any trade, even if trade later recovers.
         Uses peak_unrealized_loss from positions.
         """
-        rule = self.rules.mae_rule
-        assert rule is not None
+        compiled = self.plan.get("mae")
+        assert compiled is not None
+        rule = compiled.rule
+
+        threshold_fraction = compiled.threshold_fraction
+        bands = compiled.bands
 
         # Find maximum peak unrealized loss across all positions
-        max_mae = Decimal("0")
-        for pos in account_state.open_positions:
-            if pos.peak_unrealized_loss < max_mae:
-                max_mae = pos.peak_unrealized_loss
-
-        # Calculate MAE as percentage of account
-        mae_percent = (
-            (abs(max_mae) / account_state.starting_balance) * Decimal("100")
-            if account_state.starting_balance > 0
-            else Decimal("0")
-        )
+        max_maes = [
+            min(
+                (pos.peak_unrealized_loss for pos in state.open_positions),
+                default=Decimal("0"),
+            )
+            for state in account_states
+        ]
+
+        rule_states = []
+        for account_state, max_mae in zip(account_states, max_maes):
+            if max_mae > 0:
+                max_mae = Decimal("0")
+
+            # Calculate MAE as percentage of account
+            mae_percent = (
+                (abs(max_mae) / account_state.starting_balance) * Decimal("100")
+                if account_state.starting_balance > 0
+                else Decimal("0")
+            )
 
-        # Calculate threshold
-        threshold_percent = rule.max_adverse_excursion_percent
-        threshold_amount = (
-            account_state.starting_balance * threshold_percent / Decimal("100")
-        )
+            # Calculate threshold
+            threshold_amount = account_state.starting_balance * threshold_fraction
 
-        # Remaining buffer
-        remaining_buffer = threshold_amount - abs(max_mae)
+            # Remaining buffer
+            remaining_buffer = threshold_amount - abs(max_mae)
 
-        # Buffer as percentage
-        buffer_percent = (
-            (remaining_buffer / threshold_amount) * Decimal("100")
-            if threshold_amount > 0
-            else Decimal("100")
-        )
-
-        # Determine status
-        if remaining_buffer <= 0:
-            status = RuleStatus.VIOLATED
-        elif buffer_percent <= Decimal("10"):
-            status = RuleStatus.CRITICAL
-        elif buffer_percent <= Decimal("30"):
-            status = RuleStatus.CAUTION
-        else:
-            status = RuleStatus.SAFE
+            # Buffer as percentage
+            buffer_percent = (
+                (remaining_buffer / threshold_amount) * Decimal("100")
+                if threshold_amount > 0
+                else Decimal("100")
+            )
 
-        distance = DistanceMetric(
-            dollars=remaining_buffer,
-            percent=buffer_percent,
-        )
+            # Determine status
+            if remaining_buffer <= 0:
+                status = RuleStatus.VIOLATED
+            else:
+                status = bands.classify(buffer_percent)
 
-        warnings = []
-        if status == RuleStatus.CRITICAL:
-            warnings.append(
-                f"MAE critical: ${remaining_buffer:.2f} remaining before violation"
+            distance = self.distance_class(
+                dollars=remaining_buffer,
+                percent=buffer_percent,
             )
-        elif status == RuleStatus.CAUTION:
-            warnings.append(
-                f"MAE caution: ${remaining_buffer:.2f} remaining before violation"
+
+            warnings = []
+            if status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"MAE critical: ${remaining_buffer:.2f} remaining before violation"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"MAE caution: ${remaining_buffer:.2f} remaining before violation"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="mae",
+                    current_value=abs(max_mae),
+                    threshold=threshold_amount,
+                    remaining_buffer=remaining_buffer,
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=distance,
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path="Cannot recover - account fails immediately",
+                )
             )
 
-        return RuleState(
-            rule_name="mae",
-            current_value=abs(max_mae),
-            threshold=threshold_amount,
-            remaining_buffer=remaining_buffer,
-            buffer_percent=buffer_percent,
-            status=status,
-            distance_to_violation=distance,
-            warnings=warnings,
+        return rule_states
+
+    def _consistency_placeholder(self) -> RuleState:
+        """Consistency state when there is no daily PnL history to check."""
+        rule = self.plan.get("consistency").rule
+        return self.rule_state_class(
+            rule_name="consistency",
+            current_value=Decimal("0"),
+            threshold=rule.max_single_day_percent,
+            remaining_buffer=rule.max_single_day_percent,
+            buffer_percent=Decimal("100"),
+            status=RuleStatus.SAFE,  # Assume safe if we can't calculate
+            distance_to_violation=self.distance_class(percent=Decimal("100")),
+            warnings=["Daily PnL history required for consistency rule calculation"],
             recoverable=rule.recoverable,
             severity=rule.severity,
             rule_type=rule.rule_type,
-            recovery_path="Cannot recover - account fails immediately",
+            recovery_path=None,
         )
 
     def _calculate_consistency(
-        self, account_state: AccountSnapshot, daily_pnl_history: Optional[Dict[str, Decimal]] = None
+        self,
+        account_state: AccountSnapshot,
+        daily_pnl_history: Optional[Dict[str, Decimal]] = None,
+        aggregate: Optional[DailyPnlAggregate] = None,
     ) -> RuleState:
         """
         Calculate consistency rule state.
@@ -571,45 +774,44 @@ class RuleEngine:
         
         Note: This requires daily PnL history. If not provided, returns placeholder state.
         daily_pnl_history should be a dict mapping date strings (YYYY-MM-DD) to daily realized PnL.
+        If a DailyPnlAggregate is given it is used instead of scanning the history.
         """
-        rule = self.rules.consistency_rule
-        assert rule is not None
+        compiled = self.plan.get("consistency")
+        assert compiled is not None
+        rule = compiled.rule
+
+        if aggregate is not None:
+            daily_pnl_history = aggregate.days
+        elif daily_pnl_history is None:
+            daily_pnl_history = account_state.daily_pnl_history
 
         # Total realized PnL (net profit across all days)
         total_realized_pnl = account_state.realized_pnl
         
         # If no daily PnL history provided, return placeholder
         if daily_pnl_history is None or len(daily_pnl_history) == 0:
-            # Placeholder: cannot calculate without daily history
-            return RuleState(
-                rule_name="consistency",
-                current_value=Decimal("0"),
-                threshold=rule.max_single_day_percent,
-                remaining_buffer=rule.max_single_day_percent,
-                buffer_percent=Decimal("100"),
-                status=RuleStatus.SAFE,  # Assume safe if we can't calculate
-                distance_to_violation=DistanceMetric(percent=Decimal("100")),
-                warnings=["Daily PnL history required for consistency rule calculation"],
-                recoverable=rule.recoverable,
-                severity=rule.severity,
-                rule_type=rule.rule_type,
-                recovery_path=None,
-            )
+            return self._consistency_placeholder()
         
         # Find maximum single-day profit
-        max_single_day_profit = max(daily_pnl_history.values()) if daily_pnl_history.values() else Decimal("0")
+        if aggregate is not None:
+            max_single_day_profit = aggregate.max_day
+        elif isinstance(daily_pnl_history, DailyPnlHistory):
+            # Max over the cent array; no Decimal per day
+            max_single_day_profit = Decimal(max(daily_pnl_history.cents)).scaleb(-2)
+        else:
+            max_single_day_profit = max(daily_pnl_history.values())
         
         # Rule only applies when total profit is positive
         if total_realized_pnl <= 0:
             # No profit yet, rule doesn't apply
-            return RuleState(
+            return self.rule_state_class(
                 rule_name="consistency",
                 current_value=Decimal("0"),
                 threshold=rule.max_single_day_percent,
                 remaining_buffer=rule.max_single_day_percent,
                 buffer_percent=Decimal("100"),
                 status=RuleStatus.SAFE,  # Rule doesn't apply when total <= 0
-                distance_to_violation=DistanceMetric(percent=Decimal("100")),
+                distance_to_violation=self.distance_class(percent=Decimal("100")),
                 warnings=[],
                 recoverable=rule.recoverable,
                 severity=rule.severity,
@@ -621,7 +823,7 @@ class RuleEngine:
         largest_day_percent = (max_single_day_profit / total_realized_pnl) * Decimal("100")
         
         # Calculate max allowed single day (50% of total)
-        max_allowed_single_day = total_realized_pnl * (rule.max_single_day_percent / Decimal("100"))
+        max_allowed_single_day = total_realized_pnl * compiled.max_single_day_fraction
         
         # Distance to violation: how much more can the max day be before violation
         distance_to_violation = max_allowed_single_day - max_single_day_profit
@@ -631,14 +833,7 @@ class RuleEngine:
         # CAUTION: 40% < x <= 45%
         # CRITICAL: 45% < x <= 50%
         # VIOLATED: > 50%
-        if largest_day_percent > rule.max_single_day_percent:
-            status = RuleStatus.VIOLATED
-        elif largest_day_percent > Decimal("45"):
-            status = RuleStatus.CRITICAL
-        elif largest_day_percent > Decimal("40"):
-            status = RuleStatus.CAUTION
-        else:
-            status = RuleStatus.SAFE
+        status = compiled.bands.classify(largest_day_percent)
         
         # Buffer as percentage of threshold
         buffer_percent = (
@@ -647,7 +842,7 @@ class RuleEngine:
             else Decimal("0")
         )
 
-        distance = DistanceMetric(
+        distance = self.distance_class(
             dollars=distance_to_violation,
             percent=buffer_percent,
         )
@@ -666,11 +861,7 @@ class RuleEngine:
                 f"Consistency rule caution: {largest_day_percent:.1f}% of profit from single day"
             )
 
-        recovery_path = None
-        if rule.recoverable == RuleRecoverability.RECOVERABLE:
-            recovery_path = "Add more trading days or increase total profit to reduce single-day percentage"
-
-        return RuleState(
+        return self.rule_state_class(
             rule_name="consistency",
             current_value=largest_day_percent,
             threshold=rule.max_single_day_percent,
@@ -682,15 +873,18 @@ class RuleEngine:
             recoverable=rule.recoverable,
             severity=rule.severity,
             rule_type=rule.rule_type,
-            recovery_path=recovery_path,
+            recovery_path=compiled.recovery_path,
         )
 
     def _calculate_trading_hours(self, account_state: AccountSnapshot) -> RuleState:
         """
         Calculate trading hours rule state.
         
-        Checks if current time is before forced close time.
-        Positions must be closed by the deadline (e.g., 3:10 PM CT for Topstep).
+        Checks if the snapshot time is before the forced close time on its
+        local trading date. Positions must be closed by the deadline (e.g.,
+        3:10 PM CT for Topstep). Deadlines come from the shared session
+        calendar as UTC epochs, so this is integer arithmetic on the
+        snapshot timestamp and replays deterministically.
         
         Status levels per specification:
         - SAFE: current_time < (trading_day_end - 30 minutes) AND open_positions_count == 0
@@ -698,45 +892,31 @@ class RuleEngine:
         - CRITICAL: (trading_day_end - 10 minutes) <= current_time < trading_day_end AND open_positions_count > 0
         - VIOLATED: current_time >= trading_day_end AND open_positions_count > 0
         """
-        rule = self.rules.trading_hours
-        assert rule is not None
+        compiled = self.plan.get("trading_hours")
+        assert compiled is not None
+        rule = compiled.rule
 
-        from datetime import datetime
-        import pytz
-
-        # Get current time in rule's timezone
-        tz = pytz.timezone(rule.timezone)
-        now = datetime.now(tz)
-        
-        # Parse forced close time (e.g., "15:10" for 3:10 PM CT)
-        close_hour, close_minute = map(int, rule.forced_close_time.split(":"))
-        close_time = now.replace(hour=close_hour, minute=close_minute, second=0, microsecond=0)
+        # Snapshot time and forced close (e.g., "15:10" CT) as UTC epoch seconds
+        now = to_epoch_seconds(account_state.timestamp)
+        close_time = compiled.calendar.forced_close(now)
 
         # Check if we have open positions
         has_open_positions = len(account_state.open_positions) > 0
 
         # Calculate time until deadline
-        seconds_until_deadline = (close_time - now).total_seconds() if now < close_time else 0
+        seconds_until_deadline = close_time - now if now < close_time else 0
         minutes_until_deadline = seconds_until_deadline / 60
 
         # Determine status per specification
-        if has_open_positions and now >= close_time:
-            # At or after deadline with open positions = VIOLATED
-            status = RuleStatus.VIOLATED
-        elif has_open_positions and seconds_until_deadline <= 600:  # 10 minutes = 600 seconds
-            # Less than 10 minutes before deadline with open positions = CRITICAL
-            status = RuleStatus.CRITICAL
-        elif has_open_positions and seconds_until_deadline <= 1800:  # 30 minutes = 1800 seconds
-            # Between 10 and 30 minutes before deadline with open positions = CAUTION
-            status = RuleStatus.CAUTION
-        elif not has_open_positions:
-            # No open positions = SAFE (requirement satisfied)
-            status = RuleStatus.SAFE
+        if has_open_positions:
+            # VIOLATED at or after the deadline (0 seconds left), CRITICAL
+            # within 10 minutes, CAUTION within 30 minutes, else SAFE
+            status = compiled.bands.classify(seconds_until_deadline)
         else:
-            # More than 30 minutes before deadline = SAFE
+            # No open positions = SAFE (requirement satisfied)
             status = RuleStatus.SAFE
 
-        distance = DistanceMetric(
+        distance = self.distance_class(
             percent=Decimal(str((seconds_until_deadline / 3600) * 100)) if seconds_until_deadline > 0 else Decimal("0"),
         )
 
@@ -754,7 +934,7 @@ class RuleEngine:
                 f"Trading hours caution: {int(minutes_until_deadline)} minutes until forced close at {rule.forced_close_time}"
             )
 
-        return RuleState(
+        return self.rule_state_class(
             rule_name="trading_hours",
             current_value=Decimal(str(minutes_until_deadline)),
             threshold=Decimal("0"),  # Must close before this time
@@ -766,50 +946,72 @@ class RuleEngine:
             recoverable=rule.recoverable,
             severity=rule.severity,
             rule_type=rule.rule_type,
-            recovery_path="Cannot recover - account fails immediately" if rule.recoverable == RuleRecoverability.NON_RECOVERABLE else None,
+            recovery_path=compiled.recovery_path,
         )
 
-    def _calculate_minimum_trading_days(self, account_state: AccountSnapshot) -> RuleState:
+    def _minimum_trading_days_placeholder(self) -> RuleState:
+        """Minimum trading days state when there is no daily PnL history to count."""
+        rule = self.plan.get("minimum_trading_days").rule
+        return self.rule_state_class(
+            rule_name="minimum_trading_days",
+            current_value=Decimal("0"),
+            threshold=Decimal(str(rule.min_days)),
+            remaining_buffer=Decimal(str(rule.min_days)),
+            buffer_percent=Decimal("0"),
+            status=RuleStatus.CAUTION,
+            distance_to_violation=self.distance_class(percent=Decimal("0")),
+            warnings=["Daily PnL history required for minimum trading days calculation"],
+            recoverable=rule.recoverable,
+            severity=rule.severity,
+            rule_type=rule.rule_type,
+            recovery_path=None,
+        )
+
+    def _calculate_minimum_trading_days(
+        self,
+        account_state: AccountSnapshot,
+        aggregate: Optional[DailyPnlAggregate] = None,
+    ) -> RuleState:
         """
         Calculate minimum trading days rule state.
         
         Requires tracking daily PnL history to count trading days.
         A trading day is a day where at least one trade was closed.
+        If a DailyPnlAggregate is given it is used instead of scanning the history.
         """
-        rule = self.rules.minimum_trading_days
-        assert rule is not None
+        compiled = self.plan.get("minimum_trading_days")
+        assert compiled is not None
+        rule = compiled.rule
+        daily_pnl_history = (
+            aggregate.days if aggregate is not None else account_state.daily_pnl_history
+        )
 
         # Count trading days from daily PnL history
         # A trading day is a day where at least one trade was closed (daily PnL != 0)
         # OR where daily PnL meets minimum profit requirement
-        if account_state.daily_pnl_history is None or len(account_state.daily_pnl_history) == 0:
+        if daily_pnl_history is None or len(daily_pnl_history) == 0:
             # No history provided, return placeholder
-            return RuleState(
-                rule_name="minimum_trading_days",
-                current_value=Decimal("0"),
-                threshold=Decimal(str(rule.min_days)),
-                remaining_buffer=Decimal(str(rule.min_days)),
-                buffer_percent=Decimal("0"),
-                status=RuleStatus.CAUTION,
-                distance_to_violation=DistanceMetric(percent=Decimal("0")),
-                warnings=["Daily PnL history required for minimum trading days calculation"],
-                recoverable=rule.recoverable,
-                severity=rule.severity,
-                rule_type=rule.rule_type,
-                recovery_path=None,
-            )
+            return self._minimum_trading_days_placeholder()
         
         # Count days where daily PnL meets minimum requirement
         # For most firms, any day with closed trades counts (PnL != 0)
         # Some firms require minimum profit per day
-        trading_days_counted = 0
-        for date, daily_pnl in account_state.daily_pnl_history.items():
-            # Count as trading day if PnL meets minimum requirement
-            if daily_pnl >= rule.min_profit_per_day:
-                trading_days_counted += 1
+        if aggregate is not None:
+            trading_days_counted = aggregate.qualifying_days(rule.min_profit_per_day)
+        elif isinstance(daily_pnl_history, DailyPnlHistory):
+            min_profit_cents = rule.min_profit_per_day * 100
+            trading_days_counted = sum(
+                1 for cents in daily_pnl_history.cents if cents >= min_profit_cents
+            )
+        else:
+            trading_days_counted = 0
+            for date, daily_pnl in daily_pnl_history.items():
+                # Count as trading day if PnL meets minimum requirement
+                if daily_pnl >= rule.min_profit_per_day:
+                    trading_days_counted += 1
         
         remaining_days = Decimal(str(max(0, rule.min_days - trading_days_counted)))
-        min_days_decimal = Decimal(str(rule.min_days))
+        min_days_decimal = compiled.min_days
         buffer_percent = (
             (remaining_days / min_days_decimal) * Decimal("100")
             if min_days_decimal > 0
@@ -818,16 +1020,10 @@ class RuleEngine:
 
         # Determine status
         # SAFE: Requirement met (trading_days_counted >= min_days)
-        # CAUTION: Close to requirement (1-2 days remaining)
-        # CRITICAL: Far from requirement (many days remaining)
-        if remaining_days <= Decimal("0"):
-            status = RuleStatus.SAFE  # Requirement met
-        elif remaining_days <= Decimal("2"):
-            status = RuleStatus.CAUTION
-        else:
-            status = RuleStatus.CAUTION  # Still need more days
+        # CAUTION: Days still needed
+        status = compiled.bands.classify(remaining_days)
 
-        distance = DistanceMetric(
+        distance = self.distance_class(
             percent=buffer_percent,
         )
 
@@ -848,7 +1044,7 @@ class RuleEngine:
             else:
                 recovery_path = "Requirement met - no action needed"
 
-        return RuleState(
+        return self.rule_state_class(
             rule_name="minimum_trading_days",
             current_value=Decimal(str(trading_days_counted)),
             threshold=Decimal(str(rule.min_days)),
@@ -867,8 +1063,9 @@ class RuleEngine:
         """
         Calculate profit target rule state.
         """
-        rule = self.rules.profit_target
-        assert rule is not None
+        compiled = self.plan.get("profit_target")
+        assert compiled is not None
+        rule = compiled.rule
 
         current_profit = account_state.realized_pnl + account_state.unrealized_pnl
         remaining_to_target = rule.target_amount - current_profit
@@ -879,17 +1076,11 @@ class RuleEngine:
             else Decimal("100")
         )
 
-        # Determine status
-        if remaining_to_target <= 0:
-            status = RuleStatus.SAFE  # Target reached
-        elif buffer_percent >= Decimal("90"):
-            status = RuleStatus.SAFE
-        elif buffer_percent >= Decimal("70"):
-            status = RuleStatus.CAUTION
-        else:
-            status = RuleStatus.SAFE
+        # Determine status: CAUTION between 70% and 90% of the target,
+        # SAFE otherwise (a reached target is always >= 100%)
+        status = compiled.bands.classify(buffer_percent)
 
-        distance = DistanceMetric(
+        distance = self.distance_class(
             dollars=remaining_to_target,
             percent=buffer_percent,
         )
@@ -900,11 +1091,7 @@ class RuleEngine:
                 f"Profit target: ${remaining_to_target:.2f} remaining to reach ${rule.target_amount}"
             )
 
-        recovery_path = None
-        if rule.recoverable == RuleRecoverability.RECOVERABLE:
-            recovery_path = f"Continue trading to reach ${rule.target_amount} profit target"
-
-        return RuleState(
+        return self.rule_state_class(
             rule_name="profit_target",
             current_value=current_profit,
             threshold=rule.target_amount,
@@ -916,6 +1103,6 @@ class RuleEngine:
             recoverable=rule.recoverable,
             severity=rule.severity,
             rule_type=rule.rule_type,
-            recovery_path=recovery_path,
+            recovery_path=compiled.recovery_path,
         )
 
@@ -0,0 +1,613 @@
+"""
+Integer fixed-point evaluation mode for the rules engine.
+
+Money is carried as integer cents and percentages as basis points
+(1% = 100 bps), so rule math runs on Python ints instead of Decimal.
+Inputs are quantized to the cent on the way in and converted back to
+Decimal on the way out.
+
+Status decisions are made with exact integer comparisons against the
+compiled plan's ThresholdBands (the cuts the Decimal engine classifies
+with), so statuses are identical to the Decimal engine. Reported values match it to within one
+cent (money) and 0.01 (percentages).
+
+Usage:
+    engine = FixedPointRuleEngine(rules)  # drop-in for RuleEngine
+    result = engine.evaluate(snapshot)
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional, Sequence
+
+from .aggregates import DailyPnlAggregate
+from .bands import ThresholdBands
+from .engine import RuleEngine
+from .history import DailyPnlHistory
+from .interface import AccountSnapshot
+from .models import (
+    DistanceMetric,
+    RuleState,
+    RuleStatus,
+    RuleRecoverability,
+)
+
+# Basis points in a whole (100%)
+BPS = 10_000
+
+
+def to_cents(value: Decimal) -> int:
+    """Quantize a dollar amount to integer cents (half-up)."""
+    return int(value.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a Decimal dollar amount."""
+    return Decimal(cents).scaleb(-2)
+
+
+def to_bps(percent: Decimal) -> int:
+    """Quantize a percentage (e.g. 5 for 5%) to basis points (500)."""
+    return int(percent.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_bps(bps: int) -> Decimal:
+    """Convert basis points back to a Decimal percentage."""
+    return Decimal(bps).scaleb(-2)
+
+
+def round_div(numerator: int, denominator: int) -> int:
+    """Integer division rounded half-up. denominator must be positive."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+class FixedPointRuleEngine(RuleEngine):
+    """
+    RuleEngine that evaluates money rules on integer cents and basis points.
+
+    Opt-in replacement for RuleEngine on hot ingest paths. Trading hours has
+    no money math and is inherited unchanged, as are the placeholder states
+    returned when daily PnL history is missing.
+    """
+
+    def _calculate_trailing_drawdown_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """
+        Calculate trailing drawdown state for a batch of accounts.
+
+        Values scaled by BPS (cents * 10^4) keep the threshold exact:
+        hwm * drawdown_bps is the drawdown allowance in those units.
+        """
+        compiled = self.plan.get("trailing_drawdown")
+        assert compiled is not None
+        rule = compiled.rule
+
+        drawdown_bps = to_bps(compiled.max_drawdown_percent)
+        recovery_path = compiled.recovery_path
+
+        rule_states = []
+        for account_state in account_states:
+            current_cents = to_cents(
+                account_state.equity
+                if rule.include_unrealized_pnl
+                else account_state.balance
+            )
+            hwm_cents = to_cents(account_state.high_water_mark)
+
+            threshold_scaled = hwm_cents * drawdown_bps
+            min_allowed_scaled = hwm_cents * BPS - threshold_scaled
+            buffer_scaled = current_cents * BPS - min_allowed_scaled
+
+            if buffer_scaled <= 0:
+                status = RuleStatus.VIOLATED
+            else:
+                status = _percent_status(compiled.bands, buffer_scaled, threshold_scaled, BPS)
+
+            buffer_percent_bps = (
+                round_div(buffer_scaled * BPS, threshold_scaled)
+                if threshold_scaled > 0
+                else BPS
+            )
+            remaining_buffer = from_cents(round_div(buffer_scaled, BPS))
+            buffer_percent = from_bps(buffer_percent_bps)
+
+            warnings = []
+            if status == RuleStatus.VIOLATED:
+                warnings.append(
+                    f"Trailing drawdown VIOLATED: Account has breached drawdown limit"
+                )
+            elif status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"Trailing drawdown critical: ${remaining_buffer:.2f} remaining (within 5% of threshold)"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"Trailing drawdown caution: ${remaining_buffer:.2f} remaining (within 20% of threshold)"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="trailing_drawdown",
+                    current_value=from_cents(current_cents),
+                    threshold=from_cents(round_div(min_allowed_scaled, BPS)),
+                    remaining_buffer=remaining_buffer,
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=self.distance_class(
+                        dollars=remaining_buffer,
+                        percent=buffer_percent,
+                    ),
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path=recovery_path,
+                )
+            )
+
+        return rule_states
+
+    def _calculate_daily_loss_limit_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """Calculate daily loss limit state for a batch of accounts."""
+        compiled = self.plan.get("daily_loss_limit")
+        assert compiled is not None
+        rule = compiled.rule
+
+        max_loss_cents = to_cents(compiled.max_loss)
+        max_loss = from_cents(max_loss_cents)
+        bands = compiled.bands
+        recovery_path = compiled.recovery_path
+
+        rule_states = []
+        for account_state in account_states:
+            daily_loss_cents = max(0, -to_cents(account_state.daily_pnl))
+            remaining_cents = max_loss_cents - daily_loss_cents
+
+            # Loss bands in cents
+            status = bands.statuses[bands.band_index(daily_loss_cents, scale=100)]
+
+            daily_loss = from_cents(daily_loss_cents)
+            remaining_buffer = from_cents(remaining_cents)
+            buffer_percent = from_bps(
+                round_div(remaining_cents * BPS, max_loss_cents)
+                if max_loss_cents > 0
+                else 0
+            )
+
+            warnings = []
+            if status == RuleStatus.VIOLATED:
+                warnings.append(
+                    f"Daily loss limit VIOLATED: ${daily_loss:.2f} loss exceeds limit of ${max_loss:.2f}"
+                )
+            elif status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"Daily loss limit critical: ${remaining_buffer:.2f} remaining (95%+ of limit used)"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"Daily loss limit caution: ${remaining_buffer:.2f} remaining (80%+ of limit used)"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="daily_loss_limit",
+                    current_value=daily_loss,
+                    threshold=max_loss,
+                    remaining_buffer=remaining_buffer,
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=self.distance_class(
+                        dollars=remaining_buffer,
+                        percent=buffer_percent,
+                    ),
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path=recovery_path,
+                )
+            )
+
+        return rule_states
+
+    def _calculate_overall_max_loss(
+        self, account_state: AccountSnapshot
+    ) -> RuleState:
+        """Calculate overall maximum loss state."""
+        compiled = self.plan.get("overall_max_loss")
+        assert compiled is not None
+        rule = compiled.rule
+
+        max_loss_cents = to_cents(rule.max_loss_amount)
+        if rule.from_starting_balance:
+            total_loss_cents = to_cents(account_state.starting_balance) - to_cents(
+                account_state.equity
+            )
+        else:
+            total_loss_cents = max(0, -to_cents(account_state.realized_pnl))
+
+        remaining_cents = max_loss_cents - total_loss_cents
+        buffer_percent_bps = (
+            round_div(remaining_cents * BPS, max_loss_cents) if max_loss_cents > 0 else 0
+        )
+
+        if remaining_cents <= 0:
+            status = RuleStatus.VIOLATED
+        else:
+            status = _percent_status(
+                compiled.bands, remaining_cents, max_loss_cents, buffer_percent_bps
+            )
+
+        remaining_buffer = from_cents(remaining_cents)
+        buffer_percent = from_bps(buffer_percent_bps)
+
+        warnings = []
+        if status == RuleStatus.CRITICAL:
+            warnings.append(
+                f"Overall max loss critical: ${remaining_buffer:.2f} remaining"
+            )
+        elif status == RuleStatus.CAUTION:
+            warnings.append(
+                f"Overall max loss caution: ${remaining_buffer:.2f} remaining"
+            )
+
+        return self.rule_state_class(
+            rule_name="overall_max_loss",
+            current_value=from_cents(total_loss_cents),
+            threshold=from_cents(max_loss_cents),
+            remaining_buffer=remaining_buffer,
+            buffer_percent=buffer_percent,
+            status=status,
+            distance_to_violation=self.distance_class(
+                dollars=remaining_buffer,
+                percent=buffer_percent,
+            ),
+            warnings=warnings,
+        )
+
+    def _calculate_max_position_size_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """Calculate maximum position size state for a batch of accounts."""
+        compiled = self.plan.get("max_position_size")
+        assert compiled is not None
+        rule = compiled.rule
+
+        max_contracts = rule.max_contracts
+        bands = compiled.bands
+        recovery_path = compiled.recovery_path
+
+        rule_states = []
+        for account_state in account_states:
+            current_position_size = sum(
+                abs(pos.quantity) for pos in account_state.open_positions
+            )
+            remaining_buffer = max_contracts - current_position_size
+
+            status = bands.statuses[bands.band_index(current_position_size)]
+
+            buffer_percent = from_bps(
+                round_div(remaining_buffer * BPS, max_contracts)
+                if max_contracts > 0
+                else 0
+            )
+
+            warnings = []
+            if status == RuleStatus.VIOLATED:
+                warnings.append(
+                    f"Max position size VIOLATED: {current_position_size} contracts exceeds limit of {max_contracts}"
+                )
+            elif status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"Max position size critical: {remaining_buffer} contracts remaining (95%+ of limit used)"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"Max position size caution: {remaining_buffer} contracts remaining (80%+ of limit used)"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="max_position_size",
+                    current_value=Decimal(current_position_size),
+                    threshold=Decimal(max_contracts),
+                    remaining_buffer=Decimal(remaining_buffer),
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=self.distance_class(
+                        contracts=remaining_buffer if remaining_buffer >= 0 else 0,
+                        percent=buffer_percent,
+                    ),
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path=recovery_path,
+                )
+            )
+
+        return rule_states
+
+    def _calculate_mae_many(
+        self, account_states: Sequence[AccountSnapshot]
+    ) -> List[RuleState]:
+        """
+        Calculate MAE rule state for a batch of accounts.
+
+        starting_balance * mae_bps is the MAE allowance scaled by BPS.
+        """
+        compiled = self.plan.get("mae")
+        assert compiled is not None
+        rule = compiled.rule
+
+        mae_bps = to_bps(rule.max_adverse_excursion_percent)
+
+        rule_states = []
+        for account_state in account_states:
+            max_mae_cents = -min(
+                0,
+                min(
+                    (to_cents(pos.peak_unrealized_loss) for pos in account_state.open_positions),
+                    default=0,
+                ),
+            )
+            threshold_scaled = to_cents(account_state.starting_balance) * mae_bps
+            remaining_scaled = threshold_scaled - max_mae_cents * BPS
+            buffer_percent_bps = (
+                round_div(remaining_scaled * BPS, threshold_scaled)
+                if threshold_scaled > 0
+                else BPS
+            )
+
+            if remaining_scaled <= 0:
+                status = RuleStatus.VIOLATED
+            else:
+                status = _percent_status(
+                    compiled.bands, remaining_scaled, threshold_scaled, buffer_percent_bps
+                )
+
+            remaining_buffer = from_cents(round_div(remaining_scaled, BPS))
+            buffer_percent = from_bps(buffer_percent_bps)
+
+            warnings = []
+            if status == RuleStatus.CRITICAL:
+                warnings.append(
+                    f"MAE critical: ${remaining_buffer:.2f} remaining before violation"
+                )
+            elif status == RuleStatus.CAUTION:
+                warnings.append(
+                    f"MAE caution: ${remaining_buffer:.2f} remaining before violation"
+                )
+
+            rule_states.append(
+                self.rule_state_class(
+                    rule_name="mae",
+                    current_value=from_cents(max_mae_cents),
+                    threshold=from_cents(round_div(threshold_scaled, BPS)),
+                    remaining_buffer=remaining_buffer,
+                    buffer_percent=buffer_percent,
+                    status=status,
+                    distance_to_violation=self.distance_class(
+                        dollars=remaining_buffer,
+                        percent=buffer_percent,
+                    ),
+                    warnings=warnings,
+                    recoverable=rule.recoverable,
+                    severity=rule.severity,
+                    rule_type=rule.rule_type,
+                    recovery_path="Cannot recover - account fails immediately",
+                )
+            )
+
+        return rule_states
+
+    def _calculate_consistency(
+        self,
+        account_state: AccountSnapshot,
+        daily_pnl_history: Optional[Dict[str, Decimal]] = None,
+        aggregate: Optional[DailyPnlAggregate] = None,
+    ) -> RuleState:
+        """
+        Calculate consistency rule state.
+
+        Placeholder states (no history, no profit) come from the Decimal engine.
+        """
+        compiled = self.plan.get("consistency")
+        assert compiled is not None
+        rule = compiled.rule
+
+        if aggregate is not None:
+            daily_pnl_history = aggregate.days
+        elif daily_pnl_history is None:
+            daily_pnl_history = account_state.daily_pnl_history
+
+        total_cents = to_cents(account_state.realized_pnl)
+        if not daily_pnl_history or total_cents <= 0:
+            return super()._calculate_consistency(account_state, daily_pnl_history)
+
+        if aggregate is not None:
+            max_day_cents = to_cents(aggregate.max_day)
+        elif isinstance(daily_pnl_history, DailyPnlHistory):
+            max_day_cents = max(daily_pnl_history.cents)
+        else:
+            max_day_cents = max(to_cents(pnl) for pnl in daily_pnl_history.values())
+        max_percent_bps = to_bps(rule.max_single_day_percent)
+
+        # Largest day as a share of total profit, compared exactly
+        status = _percent_status(compiled.bands, max_day_cents, total_cents, 0)
+
+        max_allowed_scaled = total_cents * max_percent_bps
+        distance_scaled = max_allowed_scaled - max_day_cents * BPS
+
+        largest_day_percent = from_bps(round_div(max_day_cents * BPS, total_cents))
+        distance_to_violation = from_cents(round_div(distance_scaled, BPS))
+        buffer_percent = from_bps(
+            round_div(distance_scaled * BPS, max_allowed_scaled)
+            if max_allowed_scaled > 0
+            else 0
+        )
+
+        warnings = []
+        if status == RuleStatus.VIOLATED:
+            warnings.append(
+                f"Consistency rule VIOLATED: {largest_day_percent:.1f}% of profit from single day (max {rule.max_single_day_percent}%)"
+            )
+        elif status == RuleStatus.CRITICAL:
+            warnings.append(
+                f"Consistency rule critical: {largest_day_percent:.1f}% of profit from single day (max {rule.max_single_day_percent}%)"
+            )
+        elif status == RuleStatus.CAUTION:
+            warnings.append(
+                f"Consistency rule caution: {largest_day_percent:.1f}% of profit from single day"
+            )
+
+        recovery_path = compiled.recovery_path
+
+        return self.rule_state_class(
+            rule_name="consistency",
+            current_value=largest_day_percent,
+            threshold=rule.max_single_day_percent,
+            remaining_buffer=distance_to_violation,
+            buffer_percent=buffer_percent,
+            status=status,
+            distance_to_violation=self.distance_class(
+                dollars=distance_to_violation,
+                percent=buffer_percent,
+            ),
+            warnings=warnings,
+            recoverable=rule.recoverable,
+            severity=rule.severity,
+            rule_type=rule.rule_type,
+            recovery_path=recovery_path,
+        )
+
+    def _calculate_minimum_trading_days(
+        self,
+        account_state: AccountSnapshot,
+        aggregate: Optional[DailyPnlAggregate] = None,
+    ) -> RuleState:
+        """
+        Calculate minimum trading days rule state.
+
+        The placeholder state (no history) comes from the Decimal engine.
+        """
+        compiled = self.plan.get("minimum_trading_days")
+        assert compiled is not None
+        rule = compiled.rule
+
+        daily_pnl_history = (
+            aggregate.days if aggregate is not None else account_state.daily_pnl_history
+        )
+        if not daily_pnl_history:
+            return super()._calculate_minimum_trading_days(account_state, aggregate)
+
+        min_profit_cents = to_cents(rule.min_profit_per_day)
+        if aggregate is not None:
+            trading_days_counted = aggregate.qualifying_days(from_cents(min_profit_cents))
+        elif isinstance(daily_pnl_history, DailyPnlHistory):
+            trading_days_counted = sum(
+                1 for cents in daily_pnl_history.cents if cents >= min_profit_cents
+            )
+        else:
+            trading_days_counted = sum(
+                1
+                for daily_pnl in daily_pnl_history.values()
+                if to_cents(daily_pnl) >= min_profit_cents
+            )
+        remaining_days = max(0, rule.min_days - trading_days_counted)
+        buffer_percent = from_bps(
+            round_div(remaining_days * BPS, rule.min_days) if rule.min_days > 0 else BPS
+        )
+
+        # SAFE once the requirement is met, CAUTION while days remain
+        status = compiled.bands.statuses[compiled.bands.band_index(remaining_days)]
+
+        warnings = []
+        if remaining_days > 0:
+            warnings.append(
+                f"Minimum trading days: {remaining_days} more days required (min ${rule.min_profit_per_day} profit per day)"
+            )
+        else:
+            warnings.append(
+                f"Minimum trading days requirement met: {trading_days_counted} trading days"
+            )
+
+        recovery_path = None
+        if rule.recoverable == RuleRecoverability.RECOVERABLE:
+            if remaining_days > 0:
+                recovery_path = f"Trade {remaining_days} more days with at least ${rule.min_profit_per_day} profit each day"
+            else:
+                recovery_path = "Requirement met - no action needed"
+
+        return self.rule_state_class(
+            rule_name="minimum_trading_days",
+            current_value=Decimal(trading_days_counted),
+            threshold=Decimal(rule.min_days),
+            remaining_buffer=Decimal(remaining_days),
+            buffer_percent=buffer_percent,
+            status=status,
+            distance_to_violation=self.distance_class(percent=buffer_percent),
+            warnings=warnings,
+            recoverable=rule.recoverable,
+            severity=rule.severity,
+            rule_type=rule.rule_type,
+            recovery_path=recovery_path,
+        )
+
+    def _calculate_profit_target(self, account_state: AccountSnapshot) -> RuleState:
+        """Calculate profit target rule state."""
+        compiled = self.plan.get("profit_target")
+        assert compiled is not None
+        rule = compiled.rule
+
+        target_cents = to_cents(rule.target_amount)
+        profit_cents = to_cents(account_state.realized_pnl) + to_cents(
+            account_state.unrealized_pnl
+        )
+        remaining_cents = target_cents - profit_cents
+        buffer_percent_bps = (
+            round_div(profit_cents * BPS, target_cents) if target_cents > 0 else BPS
+        )
+
+        # CAUTION only between 70% and 90% of target; SAFE otherwise
+        status = _percent_status(compiled.bands, profit_cents, target_cents, buffer_percent_bps)
+
+        remaining_to_target = from_cents(remaining_cents)
+        buffer_percent = from_bps(buffer_percent_bps)
+
+        warnings = []
+        if remaining_cents > 0:
+            warnings.append(
+                f"Profit target: ${remaining_to_target:.2f} remaining to reach ${rule.target_amount}"
+            )
+
+        recovery_path = compiled.recovery_path
+
+        return self.rule_state_class(
+            rule_name="profit_target",
+            current_value=from_cents(profit_cents),
+            threshold=from_cents(target_cents),
+            remaining_buffer=remaining_to_target,
+            buffer_percent=buffer_percent,
+            status=status,
+            distance_to_violation=self.distance_class(
+                dollars=remaining_to_target,
+                percent=buffer_percent,
+            ),
+            warnings=warnings,
+            recoverable=rule.recoverable,
+            severity=rule.severity,
+            rule_type=rule.rule_type,
+            recovery_path=recovery_path,
+        )
+
+
+def _percent_status(
+    bands: ThresholdBands, part: int, whole: int, fallback_bps: int
+) -> RuleStatus:
+    """Status of part / whole * 100 on percent bands, exactly; fallback_bps when whole <= 0."""
+    if whole > 0:
+        return bands.statuses[bands.ratio_band_indices(part, whole)]
+    return bands.statuses[bands.band_index(fallback_bps, scale=100)]
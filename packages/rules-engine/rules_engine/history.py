@@ -0,0 +1,229 @@
+"""
+Compact daily PnL history.
+
+AccountSnapshot.daily_pnl_history used to be a dict of "YYYY-MM-DD" strings
+to Decimals, rebuilt from JSON on every update. DailyPnlHistory stores the
+same data as two parallel int64 arrays (date ordinals and cents), sorted by
+date. Reads go through the Mapping[str, Decimal] interface, so code written
+against the dict form keeps working; on top of that it has cheap appends,
+updates of the latest day and range slices.
+
+Amounts are kept in whole cents (half-up), like FixedPointRuleEngine.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Any, Iterator, Optional, Tuple, Union
+
+from pydantic_core import core_schema
+
+DateLike = Union[str, date, int]
+Amount = Union[Decimal, int, float, str]
+
+
+def _ordinal(day: DateLike) -> int:
+    """Date ordinal of a day; raises ValueError for anything else."""
+    if isinstance(day, int) and not isinstance(day, bool):
+        return day
+    if isinstance(day, str):
+        try:
+            day = date.fromisoformat(day)
+        except ValueError:
+            raise ValueError(f"invalid date {day!r}, expected YYYY-MM-DD") from None
+    if not isinstance(day, date):
+        raise ValueError(f"invalid date {day!r}, expected YYYY-MM-DD")
+    return day.toordinal()
+
+
+def _cents(amount: Amount) -> int:
+    """
+    Dollars to integer cents (half-up); floats are rounded, not expanded.
+
+    Raises ValueError for None, non-numeric and non-finite amounts, so bad
+    input surfaces as a ValidationError when validated through pydantic.
+    """
+    if isinstance(amount, bool) or amount is None:
+        raise ValueError(f"invalid amount {amount!r}, expected a number")
+    if isinstance(amount, int):
+        return amount * 100
+    if isinstance(amount, float):
+        if not math.isfinite(amount):
+            raise ValueError(f"invalid amount {amount!r}, expected a finite number")
+        return int(round(amount * 100))
+    if not isinstance(amount, Decimal):
+        if not isinstance(amount, str):
+            raise ValueError(f"invalid amount {amount!r}, expected a number")
+        try:
+            amount = Decimal(amount)
+        except InvalidOperation:
+            raise ValueError(f"invalid amount {amount!r}, expected a number") from None
+    if not amount.is_finite():
+        raise ValueError(f"invalid amount {amount!r}, expected a finite number")
+    return int(amount.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+class DailyPnlHistory(Mapping):
+    """
+    Daily PnL by trading date, backed by sorted arrays.
+
+    Costs:
+        append / set_day on the latest day or a later one: O(1) amortized
+        lookup, set_day on an existing day, slice: O(log n) (+ size of slice)
+        set_day inserting before the latest day: O(n)
+    """
+
+    __slots__ = ("ordinals", "cents")
+
+    def __init__(self, ordinals: Optional[array] = None, cents: Optional[array] = None):
+        self.ordinals = ordinals if ordinals is not None else array("q")
+        self.cents = cents if cents is not None else array("q")
+
+    @classmethod
+    def from_mapping(cls, history: "Mapping[Any, Amount]") -> "DailyPnlHistory":
+        """Convert the dict form ({"YYYY-MM-DD": pnl}) in any order."""
+        if isinstance(history, DailyPnlHistory):
+            return history.copy()
+        items = sorted((_ordinal(day), _cents(pnl)) for day, pnl in history.items())
+        result = cls()
+        for ordinal, cents in items:
+            if result.ordinals and result.ordinals[-1] == ordinal:
+                result.cents[-1] = cents
+            else:
+                result.ordinals.append(ordinal)
+                result.cents.append(cents)
+        return result
+
+    def copy(self) -> "DailyPnlHistory":
+        return DailyPnlHistory(array("q", self.ordinals), array("q", self.cents))
+
+    # Mapping interface (dates as "YYYY-MM-DD", amounts as Decimal dollars)
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __iter__(self) -> Iterator[str]:
+        for ordinal in self.ordinals:
+            yield date.fromordinal(ordinal).isoformat()
+
+    def __getitem__(self, day: DateLike) -> Decimal:
+        index = self._index(_ordinal(day))
+        if index is None:
+            raise KeyError(day)
+        return Decimal(self.cents[index]).scaleb(-2)
+
+    def __contains__(self, day: object) -> bool:
+        try:
+            return self._index(_ordinal(day)) is not None
+        except (TypeError, ValueError):
+            return False
+
+    def values(self):
+        return [Decimal(cents).scaleb(-2) for cents in self.cents]
+
+    def items(self):
+        return list(zip(self, self.values()))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DailyPnlHistory):
+            return self.ordinals == other.ordinals and self.cents == other.cents
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"DailyPnlHistory({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        """The dict form, for serialization and old callers."""
+        return dict(zip(self, self.values()))
+
+    # Updates
+
+    def _index(self, ordinal: int) -> Optional[int]:
+        index = bisect_left(self.ordinals, ordinal)
+        if index < len(self.ordinals) and self.ordinals[index] == ordinal:
+            return index
+        return None
+
+    def append(self, day: DateLike, pnl: Amount) -> None:
+        """Record a new day after the latest one."""
+        ordinal = _ordinal(day)
+        if self.ordinals and ordinal <= self.ordinals[-1]:
+            raise ValueError(f"{day} is not after the latest day in the history")
+        self.ordinals.append(ordinal)
+        self.cents.append(_cents(pnl))
+
+    def update_last(self, pnl: Amount) -> None:
+        """Replace the PnL of the latest day (today, on a live stream)."""
+        if not self.cents:
+            raise IndexError("update_last on an empty history")
+        self.cents[-1] = _cents(pnl)
+
+    def set_day(self, day: DateLike, pnl: Amount) -> None:
+        """Record or replace the PnL of any day."""
+        ordinal = _ordinal(day)
+        cents = _cents(pnl)
+        if not self.ordinals or ordinal > self.ordinals[-1]:
+            self.ordinals.append(ordinal)
+            self.cents.append(cents)
+            return
+        index = bisect_left(self.ordinals, ordinal)
+        if self.ordinals[index] == ordinal:
+            self.cents[index] = cents
+        else:
+            self.ordinals.insert(index, ordinal)
+            self.cents.insert(index, cents)
+
+    def __setitem__(self, day: DateLike, pnl: Amount) -> None:
+        self.set_day(day, pnl)
+
+    # Queries
+
+    def slice(
+        self, start: Optional[DateLike] = None, end: Optional[DateLike] = None
+    ) -> "DailyPnlHistory":
+        """Days with start <= day < end (either bound may be None)."""
+        low = 0 if start is None else bisect_left(self.ordinals, _ordinal(start))
+        high = len(self.ordinals) if end is None else bisect_left(self.ordinals, _ordinal(end))
+        return DailyPnlHistory(self.ordinals[low:high], self.cents[low:high])
+
+    @property
+    def last(self) -> Optional[Tuple[str, Decimal]]:
+        """The latest day and its PnL, or None if empty."""
+        if not self.ordinals:
+            return None
+        day = date.fromordinal(self.ordinals[-1]).isoformat()
+        return day, Decimal(self.cents[-1]).scaleb(-2)
+
+    # Pydantic integration: accept instances as-is and convert the dict form
+
+    @classmethod
+    def _validate(cls, value: Any) -> "DailyPnlHistory":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, Mapping):
+            return cls.from_mapping(value)
+        raise ValueError("daily PnL history must be a mapping of dates to amounts")
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: Any
+    ) -> core_schema.CoreSchema:
+        from_dict = core_schema.no_info_after_validator_function(
+            cls.from_mapping,
+            core_schema.dict_schema(core_schema.str_schema(), core_schema.decimal_schema()),
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_dict,
+            python_schema=core_schema.no_info_plain_validator_function(cls._validate),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda history: history.to_dict(),
+                return_schema=core_schema.dict_schema(
+                    core_schema.str_schema(), core_schema.decimal_schema()
+                ),
+            ),
+        )
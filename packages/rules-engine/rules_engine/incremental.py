@@ -0,0 +1,149 @@
+"""
+Incremental evaluation for a single account's tick stream.
+
+Most ticks only move equity and unrealized P&L, so most rules see exactly the
+same inputs as on the previous tick. IncrementalEvaluator remembers, per rule,
+the snapshot fields the rule read last time (CompiledRule.reads) and the state
+it produced, and only recomputes rules whose inputs changed.
+"""
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .aggregates import DailyPnlAggregate
+from .engine import RuleEngine
+from .history import DailyPnlHistory
+from .interface import AccountSnapshot, RuleEvaluationResult
+from .models import RuleState
+from .plan import RulePlan
+from .sessions import to_epoch_seconds
+
+# Reads computed from the snapshot rather than taken from one attribute
+DERIVED_FIELDS: Dict[str, Callable[[AccountSnapshot], Any]] = {
+    "epoch_seconds": lambda snapshot: to_epoch_seconds(snapshot.timestamp),
+}
+
+
+def _read_field(snapshot: AccountSnapshot, field: str) -> Any:
+    """
+    Read one input of a rule from a snapshot.
+
+    "open_positions.quantity" reads that attribute from every open position;
+    names in DERIVED_FIELDS are computed from the snapshot.
+    Mutable containers are copied so the value stays valid as a record of
+    this tick even if the caller reuses and mutates the snapshot.
+    """
+    derive = DERIVED_FIELDS.get(field)
+    if derive is not None:
+        return derive(snapshot)
+    if "." in field:
+        collection, attribute = field.split(".", 1)
+        return tuple(getattr(item, attribute) for item in getattr(snapshot, collection))
+    value = getattr(snapshot, field)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, DailyPnlHistory):
+        return value.copy()
+    return value
+
+
+class IncrementalEvaluator:
+    """
+    Stateful evaluator for one account.
+
+    Feed it successive snapshots of the same account; evaluate() returns the
+    same result RuleEngine.evaluate() would, reusing the previous RuleState
+    for every rule whose declared inputs are unchanged. Rules without
+    declared inputs (reads is None) are recomputed on every tick.
+
+    If daily_pnl is given, the history-based rules (consistency, minimum
+    trading days) read it instead of snapshot.daily_pnl_history: the caller
+    records days on the aggregate and those rules are recomputed only when
+    its version changes, without scanning or comparing the history.
+
+    Not thread-safe: use one evaluator per account stream.
+    """
+
+    # Rules whose calculators accept a DailyPnlAggregate
+    AGGREGATE_RULES = ("consistency", "minimum_trading_days")
+
+    def __init__(self, engine: RuleEngine, daily_pnl: Optional[DailyPnlAggregate] = None):
+        self.engine = engine
+        self.daily_pnl = daily_pnl
+        self.recomputed = 0
+        self.reused = 0
+        self._plan: Optional[RulePlan] = None
+        self._evaluators: List[Tuple[str, Optional[Tuple[str, ...]], Callable]] = []
+        self._inputs: Dict[str, Tuple[Any, ...]] = {}
+        self._states: Dict[str, RuleState] = {}
+
+    def reset(self) -> None:
+        """Forget all cached rule states (e.g. at session rollover)."""
+        self._inputs.clear()
+        self._states.clear()
+
+    def _bind(self, plan: RulePlan) -> None:
+        self._plan = plan
+        self._evaluators = []
+        for compiled in plan.rules:
+            if self.daily_pnl is not None and compiled.name in self.AGGREGATE_RULES:
+                # The aggregate replaces the snapshot's history, so do not
+                # skip the rule when the snapshot has none
+                calculate = partial(
+                    self.engine._rule_evaluator(compiled, required=False),
+                    aggregate=self.daily_pnl,
+                )
+            else:
+                calculate = self.engine._rule_evaluator(compiled)
+            self._evaluators.append((compiled.name, compiled.reads, calculate))
+        self.reset()
+
+    def calculate_all_rule_states(
+        self, snapshot: AccountSnapshot
+    ) -> Dict[str, RuleState]:
+        """
+        Calculate the state of all enabled rules, recomputing only the rules
+        whose inputs changed since the previous call.
+        """
+        if self.engine.plan is not self._plan:
+            # Rules were reassigned on the engine; cached states are stale.
+            self._bind(self.engine.plan)
+
+        field_values: Dict[str, Any] = {}
+        if self.daily_pnl is not None:
+            field_values["daily_pnl_history"] = self.daily_pnl.version
+        rule_states = {}
+        for rule_name, reads, calculate in self._evaluators:
+            if reads is None:
+                state = calculate(snapshot)
+                self.recomputed += 1
+                if state is not None:
+                    rule_states[rule_name] = state
+                continue
+
+            inputs = []
+            for field in reads:
+                if field not in field_values:
+                    field_values[field] = _read_field(snapshot, field)
+                inputs.append(field_values[field])
+            inputs = tuple(inputs)
+
+            state = self._states.get(rule_name)
+            if state is not None and self._inputs[rule_name] == inputs:
+                self.reused += 1
+            else:
+                state = calculate(snapshot)
+                self._states[rule_name] = state
+                self._inputs[rule_name] = inputs
+                self.recomputed += 1
+            if state is not None:
+                rule_states[rule_name] = state
+        return rule_states
+
+    def evaluate(self, snapshot: AccountSnapshot) -> RuleEvaluationResult:
+        """
+        Evaluate the next snapshot of this account.
+
+        Returns the same RuleEvaluationResult as engine.evaluate(snapshot).
+        """
+        return self.engine._make_result(snapshot, self.calculate_all_rule_states(snapshot))
@@ -0,0 +1,215 @@
+"""
+Instrument specifications and price levels of rule violations.
+
+Positions only carry a symbol, a quantity and prices. The instrument registry
+maps a symbol (root, contract code like "ESH6" or platform name like
+"ES 03-26") to its tick size and point value, which lets the engine express
+rule buffers in price terms: for every open position, the price at which
+trailing drawdown, daily loss or MAE would be violated, solved in closed form.
+"""
+
+import re
+from decimal import Decimal, ROUND_CEILING
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .engine import RuleEngine
+from .interface import AccountSnapshot, PositionSnapshot
+
+
+class InstrumentSpec(BaseModel):
+    """Contract specification of a futures instrument."""
+
+    model_config = ConfigDict(frozen=True)
+
+    root: str
+    description: str
+    tick_size: Decimal
+    point_value: Decimal  # dollars per 1.0 price move per contract
+
+    @property
+    def tick_value(self) -> Decimal:
+        """Dollars per tick per contract."""
+        return self.tick_size * self.point_value
+
+
+def _spec(root: str, description: str, tick_size: str, point_value: str) -> InstrumentSpec:
+    return InstrumentSpec(
+        root=root,
+        description=description,
+        tick_size=Decimal(tick_size),
+        point_value=Decimal(point_value),
+    )
+
+
+INSTRUMENTS: Dict[str, InstrumentSpec] = {
+    spec.root: spec
+    for spec in (
+        # Equity indices
+        _spec("ES", "E-mini S&P 500", "0.25", "50"),
+        _spec("NQ", "E-mini Nasdaq-100", "0.25", "20"),
+        _spec("YM", "E-mini Dow", "1", "5"),
+        _spec("RTY", "E-mini Russell 2000", "0.1", "50"),
+        _spec("MES", "Micro E-mini S&P 500", "0.25", "5"),
+        _spec("MNQ", "Micro E-mini Nasdaq-100", "0.25", "2"),
+        _spec("MYM", "Micro E-mini Dow", "1", "0.5"),
+        _spec("M2K", "Micro E-mini Russell 2000", "0.1", "5"),
+        # Energy
+        _spec("CL", "Crude Oil", "0.01", "1000"),
+        _spec("MCL", "Micro Crude Oil", "0.01", "100"),
+        _spec("NG", "Natural Gas", "0.001", "10000"),
+        _spec("QM", "E-mini Crude Oil", "0.025", "500"),
+        # Metals
+        _spec("GC", "Gold", "0.1", "100"),
+        _spec("MGC", "Micro Gold", "0.1", "10"),
+        _spec("SI", "Silver", "0.005", "5000"),
+        _spec("SIL", "Micro Silver", "0.005", "1000"),
+        _spec("HG", "Copper", "0.0005", "25000"),
+        # Interest rates
+        _spec("ZB", "30-Year U.S. Treasury Bond", "0.03125", "1000"),
+        _spec("ZN", "10-Year U.S. Treasury Note", "0.015625", "1000"),
+        _spec("ZF", "5-Year U.S. Treasury Note", "0.0078125", "1000"),
+        # Currencies
+        _spec("6E", "Euro FX", "0.00005", "125000"),
+        _spec("6J", "Japanese Yen", "0.0000005", "12500000"),
+        _spec("6B", "British Pound", "0.0001", "62500"),
+        _spec("M6E", "Micro Euro FX", "0.0001", "12500"),
+    )
+}
+
+# "ESH6", "ESH26", "MNQZ5": root + month code + year
+_CONTRACT_CODE = re.compile(r"^([A-Z0-9]+?)[FGHJKMNQUVXZ]\d{1,2}$")
+
+# Resolved symbol -> spec (None = unknown), so repeat lookups are one dict hit
+_resolved: Dict[str, Optional[InstrumentSpec]] = {}
+
+
+def get_instrument(symbol: str) -> Optional[InstrumentSpec]:
+    """
+    Look up the instrument for a position symbol.
+
+    Accepts roots ("ES"), exchange contract codes ("ESH6") and platform
+    names with an expiry suffix ("ES 03-26"). Returns None if unknown.
+    """
+    try:
+        return _resolved[symbol]
+    except KeyError:
+        pass
+
+    root = symbol.strip().upper().split(" ", 1)[0]
+    spec = INSTRUMENTS.get(root)
+    if spec is None:
+        match = _CONTRACT_CODE.match(root)
+        if match:
+            spec = INSTRUMENTS.get(match.group(1))
+    _resolved[symbol] = spec
+    return spec
+
+
+def register_instrument(spec: InstrumentSpec) -> None:
+    """Add or replace an instrument in the registry."""
+    INSTRUMENTS[spec.root] = spec
+    _resolved.clear()
+
+
+class ViolationPrices(BaseModel):
+    """
+    Prices at which one open position would violate each rule.
+
+    prices maps rule name to the first tick price (moving against the
+    position) at which the rule is violated, assuming every other position
+    stays where it is. ticks is the distance from current_price in ticks
+    (0 if already violated). Rules the position's price cannot violate are
+    absent.
+    """
+
+    symbol: str
+    quantity: int
+    current_price: Decimal
+    tick_size: Decimal
+    prices: Dict[str, Decimal]
+    ticks: Dict[str, int]
+
+
+def _violation_price(
+    position: PositionSnapshot, spec: InstrumentSpec, buffer: Decimal
+) -> Decimal:
+    """
+    First tick price at which a loss of buffer dollars is reached.
+
+    Solves buffer = -quantity * point_value * (price - current_price) and
+    rounds away from the current price onto the tick grid, so the loss at
+    the returned price is >= buffer.
+    """
+    if buffer <= 0:
+        return position.current_price
+    move = buffer / (abs(position.quantity) * spec.point_value)
+    ticks = (move / spec.tick_size).to_integral_value(rounding=ROUND_CEILING)
+    if position.quantity > 0:
+        return position.current_price - ticks * spec.tick_size
+    return position.current_price + ticks * spec.tick_size
+
+
+def violation_prices(
+    engine: RuleEngine,
+    snapshot: AccountSnapshot,
+    daily_pnl_includes_unrealized: bool = False,
+) -> List[ViolationPrices]:
+    """
+    Compute the violation price of each price-sensitive rule for every
+    open position with a known instrument.
+
+    Covers trailing drawdown (when it includes unrealized PnL) and MAE.
+    The engine's daily loss limit is on realized daily PnL, which open
+    positions do not move, so it is only included when the caller's
+    daily_pnl includes unrealized PnL (daily_pnl_includes_unrealized=True).
+    """
+    plan = engine.plan
+    enabled = {compiled.name for compiled in plan.rules}
+
+    # Account-level loss buffers in dollars
+    account_buffers: Dict[str, Decimal] = {}
+    trailing = plan.get("trailing_drawdown")
+    if "trailing_drawdown" in enabled and trailing.rule.include_unrealized_pnl:
+        hwm = snapshot.high_water_mark
+        min_allowed = hwm - hwm * trailing.max_drawdown_percent / Decimal("100")
+        account_buffers["trailing_drawdown"] = snapshot.equity - min_allowed
+    daily = plan.get("daily_loss_limit")
+    if "daily_loss_limit" in enabled and daily_pnl_includes_unrealized:
+        account_buffers["daily_loss_limit"] = daily.max_loss + snapshot.daily_pnl
+    mae = plan.get("mae") if "mae" in enabled else None
+    mae_threshold = (
+        snapshot.starting_balance * mae.threshold_fraction if mae is not None else None
+    )
+
+    levels = []
+    for position in snapshot.open_positions:
+        spec = get_instrument(position.symbol)
+        if spec is None or position.quantity == 0:
+            continue
+
+        buffers = dict(account_buffers)
+        if mae_threshold is not None:
+            if -position.peak_unrealized_loss >= mae_threshold:
+                buffers["mae"] = Decimal("0")
+            else:
+                buffers["mae"] = mae_threshold + position.unrealized_pnl
+
+        prices = {}
+        ticks = {}
+        for rule_name, buffer in buffers.items():
+            price = _violation_price(position, spec, buffer)
+            prices[rule_name] = price
+            ticks[rule_name] = int(abs(price - position.current_price) / spec.tick_size)
+        levels.append(
+            ViolationPrices(
+                symbol=position.symbol,
+                quantity=position.quantity,
+                current_price=position.current_price,
+                tick_size=spec.tick_size,
+                prices=prices,
+                ticks=ticks,
+            )
+        )
+    return levels
@@ -9,12 +9,20 @@ DO NOT MODIFY THESE INTERFACES WITHOUT CAREFUL CONSIDERATION.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Dict, List, Optional, Union
+from pydantic import BaseModel, Field, WrapValidator
 
+from .history import DailyPnlHistory
 from .models import RuleState
 
 
+def _keep_history(value, handler):
+    # A DailyPnlHistory is taken as-is; anything else validates as before
+    if isinstance(value, DailyPnlHistory):
+        return value
+    return handler(value)
+
+
 class AccountSnapshot(BaseModel):
     """
     FROZEN INPUT INTERFACE
@@ -52,7 +60,11 @@ class AccountSnapshot(BaseModel):
     
     # Daily PnL history for consistency rule and minimum trading days
     # Key: Date string (YYYY-MM-DD), Value: Daily realized PnL for that date
-    daily_pnl_history: Optional[Dict[str, Decimal]] = Field(
+    # A DailyPnlHistory (amounts in whole cents) is also accepted and kept as-is;
+    # dicts are validated and stored as dicts, without rounding to cents.
+    daily_pnl_history: Optional[
+        Annotated[Union[Dict[str, Decimal], DailyPnlHistory], WrapValidator(_keep_history)]
+    ] = Field(
         default=None,
         description="Historical daily PnL by date. Required for consistency rule and minimum trading days."
     )
@@ -5,7 +5,7 @@ Data models for the rules engine.
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -208,6 +208,8 @@ class FirmRules(BaseModel):
     trading_hours: Optional[TradingHoursRule] = None
     minimum_trading_days: Optional[MinimumTradingDaysRule] = None
     profit_target: Optional[ProfitTargetRule] = None
+    # Configuration of rules added with registry.register_rule, by rule name
+    custom_rules: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
 
 
 class DistanceMetric(BaseModel):
@@ -0,0 +1,111 @@
+"""
+Server-side tracking of per-position peak unrealized loss.
+
+The MAE rule reads PositionSnapshot.peak_unrealized_loss, which only some
+data sources fill in (the Tradovate path does not). PeakLossTracker keeps
+the worst unrealized loss seen for every open position, keyed by
+(account_id, symbol, opened_at), and writes it back into each incoming
+snapshot, so MAE does not depend on the source tracking it.
+
+The tracked peak is the minimum of every unrealized PnL and every
+source-reported peak received for the position, so it never improves when
+updates are coalesced or dropped; a loss that happened only between two
+received updates is still visible if the source reported it as a peak.
+"""
+
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .interface import AccountSnapshot, PositionSnapshot
+
+PositionKey = Tuple[str, str, str]  # (account_id, symbol, opened_at ISO 8601)
+
+ZERO = Decimal("0")
+
+
+def position_key(account_id: str, position: PositionSnapshot) -> PositionKey:
+    return (account_id, position.symbol, position.opened_at.isoformat())
+
+
+class PeakLossTracker:
+    """
+    Running worst unrealized loss per open position.
+
+    update() is O(1) per position in the snapshot. Positions that are no
+    longer in an account's snapshot are forgotten. version increases on
+    every change, so checkpointing can skip unchanged state.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._peaks: Dict[PositionKey, Decimal] = {}
+        self._by_account: Dict[str, Set[PositionKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._peaks)
+
+    def peak(self, account_id: str, position: PositionSnapshot) -> Optional[Decimal]:
+        """Tracked peak unrealized loss of a position, if known."""
+        return self._peaks.get(position_key(account_id, position))
+
+    def update(self, snapshot: AccountSnapshot) -> AccountSnapshot:
+        """
+        Record the snapshot's positions and return it with tracked peaks.
+
+        Returns the snapshot itself when every position already carries its
+        tracked peak, otherwise a copy with updated positions.
+        """
+        account_id = snapshot.account_id
+        previous_keys = self._by_account.get(account_id, set())
+        current_keys = set()
+        positions: List[PositionSnapshot] = []
+        changed = False
+
+        for position in snapshot.open_positions:
+            key = position_key(account_id, position)
+            current_keys.add(key)
+            peak = min(position.peak_unrealized_loss, position.unrealized_pnl, ZERO)
+            tracked = self._peaks.get(key)
+            if tracked is not None and tracked < peak:
+                peak = tracked
+            if tracked is None or peak != tracked:
+                self._peaks[key] = peak
+                self.version += 1
+            if peak != position.peak_unrealized_loss:
+                position = position.model_copy(update={"peak_unrealized_loss": peak})
+                changed = True
+            positions.append(position)
+
+        closed = previous_keys - current_keys
+        if closed:
+            for key in closed:
+                del self._peaks[key]
+            self.version += 1
+        if current_keys:
+            self._by_account[account_id] = current_keys
+        else:
+            self._by_account.pop(account_id, None)
+
+        if not changed:
+            return snapshot
+        return snapshot.model_copy(update={"open_positions": positions})
+
+    def forget(self, account_id: str) -> None:
+        """Drop all positions of an account (e.g. when it is disconnected)."""
+        for key in self._by_account.pop(account_id, ()):
+            del self._peaks[key]
+        self.version += 1
+
+    def dump(self) -> List[List[str]]:
+        """JSON-serializable state: [account_id, symbol, opened_at, peak] rows."""
+        return [[*key, str(peak)] for key, peak in self._peaks.items()]
+
+    def load(self, rows: Iterable[List[str]]) -> None:
+        """Replace the state with rows from dump()."""
+        self._peaks.clear()
+        self._by_account.clear()
+        for account_id, symbol, opened_at, peak in rows:
+            key = (account_id, symbol, opened_at)
+            self._peaks[key] = Decimal(peak)
+            self._by_account.setdefault(account_id, set()).add(key)
+        self.version += 1
@@ -0,0 +1,552 @@
+"""
+Compiled rule plans.
+
+A RulePlan is the immutable, pre-resolved form of a FirmRules: the ordered
+list of enabled rules, each with the constants its evaluator needs already
+converted (threshold fractions, status bands, parsed close times, resolved
+timezones). Status bands are ThresholdBands over the measure each evaluator
+classifies. Plans are cached by a content hash of the rules, so every engine
+for the same firm, account type and version shares one plan.
+
+Which rules exist, and in which order they run, comes from the rule
+registry (registry.py); the built-in rules are registered at the bottom of
+this module.
+"""
+
+import hashlib
+import threading
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pytz
+from pydantic import BaseModel, ConfigDict
+
+from .bands import ThresholdBands
+from .registry import RuleSpec, register_rule, registered_rules
+from .sessions import SessionCalendar, session_calendar
+from .models import (
+    ConsistencyRule,
+    DailyLossLimitRule,
+    FirmRules,
+    MAERule,
+    MaxPositionSizeRule,
+    MinimumTradingDaysRule,
+    OverallMaxLossRule,
+    ProfitTargetRule,
+    RuleRecoverability,
+    RuleStatus,
+    TradingHoursRule,
+    TrailingDrawdownRule,
+)
+
+
+class CompiledRule(BaseModel):
+    """
+    A rule ready for evaluation.
+
+    name is the key in RuleEvaluationResult.rule_states; method and
+    batch_method name the RuleEngine methods that evaluate it for one
+    snapshot and for a batch (None = loop over method). Plugin rules have
+    no method and are evaluated by CompiledPlugin.evaluator.
+
+    reads lists the AccountSnapshot fields the rule depends on. A dotted
+    name ("open_positions.quantity") means that attribute of every open
+    position; "epoch_seconds" is the snapshot timestamp in whole UTC
+    seconds. None means the rule has inputs outside the snapshot and must
+    always be recomputed.
+
+    requires lists the fields that must be present and non-empty for the
+    rule to be evaluated; otherwise the engine returns placeholder(engine,
+    compiled) without calling the evaluator (see registry.RuleSpec).
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    name: str
+    method: Optional[str] = None
+    batch_method: Optional[str] = None
+    enabled: bool = True
+    reads: Optional[Tuple[str, ...]] = None
+    requires: Tuple[str, ...] = ()
+    placeholder: Optional[Callable[..., Any]] = None
+
+
+class CompiledPlugin(CompiledRule):
+    """A registered rule evaluated by evaluator(engine, compiled, snapshot)."""
+
+    rule: BaseModel
+    evaluator: Callable[..., Any]
+
+
+class CompiledTrailingDrawdown(CompiledRule):
+    rule: TrailingDrawdownRule
+    max_drawdown_percent: Decimal
+    caution_fraction: Decimal
+    critical_fraction: Decimal
+    bands: ThresholdBands  # over buffer percent, once not violated
+    recovery_path: Optional[str]
+
+
+class CompiledDailyLossLimit(CompiledRule):
+    rule: DailyLossLimitRule
+    max_loss: Decimal
+    critical_loss: Decimal
+    caution_loss: Decimal
+    bands: ThresholdBands  # over the day's loss
+    recovery_path: Optional[str]
+
+
+class CompiledOverallMaxLoss(CompiledRule):
+    rule: OverallMaxLossRule
+    critical_percent: Decimal
+    caution_percent: Decimal
+    bands: ThresholdBands  # over buffer percent, once not violated
+
+
+class CompiledMaxPositionSize(CompiledRule):
+    rule: MaxPositionSizeRule
+    max_contracts: Decimal
+    critical_size: Decimal
+    caution_size: Decimal
+    bands: ThresholdBands  # over gross contracts held
+    recovery_path: Optional[str]
+
+
+class CompiledMAE(CompiledRule):
+    rule: MAERule
+    threshold_fraction: Decimal
+    critical_percent: Decimal
+    caution_percent: Decimal
+    bands: ThresholdBands  # over buffer percent, once not violated
+
+
+class CompiledConsistency(CompiledRule):
+    rule: ConsistencyRule
+    max_single_day_fraction: Decimal
+    critical_percent: Decimal
+    caution_percent: Decimal
+    bands: ThresholdBands  # over the largest day's percent of total profit
+    recovery_path: Optional[str]
+
+
+class CompiledTradingHours(CompiledRule):
+    rule: TradingHoursRule
+    tz: Any  # resolved pytz timezone
+    calendar: SessionCalendar
+    close_hour: int
+    close_minute: int
+    critical_seconds: int
+    caution_seconds: int
+    bands: ThresholdBands  # over seconds to the close, with open positions
+    recovery_path: Optional[str]
+
+
+class CompiledMinimumTradingDays(CompiledRule):
+    rule: MinimumTradingDaysRule
+    min_days: Decimal
+    bands: ThresholdBands  # over trading days still needed
+
+
+class CompiledProfitTarget(CompiledRule):
+    rule: ProfitTargetRule
+    safe_percent: Decimal
+    caution_percent: Decimal
+    bands: ThresholdBands  # over percent of target reached
+    recovery_path: Optional[str]
+
+
+class RulePlan(BaseModel):
+    """
+    Immutable evaluation plan for one FirmRules.
+
+    rules holds the enabled rules in evaluation order. by_name also holds
+    disabled rules so their calculators can still be called directly.
+    reads is the union of the enabled rules' reads, or None if any of them
+    has undeclared inputs.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    key: str
+    firm_rules: FirmRules
+    rules: Tuple[CompiledRule, ...]
+    by_name: Dict[str, CompiledRule]
+    reads: Optional[Tuple[str, ...]] = None
+
+    def get(self, name: str) -> Optional[CompiledRule]:
+        """Get a compiled rule by its rule_states name."""
+        return self.by_name.get(name)
+
+
+def _non_recoverable_path(rule: Any) -> Optional[str]:
+    if rule.recoverable == RuleRecoverability.NON_RECOVERABLE:
+        return "Cannot recover - account fails immediately"
+    return None
+
+
+def _buffer_percent_bands(critical_percent: Decimal, caution_percent: Decimal) -> ThresholdBands:
+    """CRITICAL at or below critical_percent buffer left, CAUTION at or below caution_percent."""
+    return ThresholdBands.falling(
+        [(RuleStatus.CRITICAL, critical_percent), (RuleStatus.CAUTION, caution_percent)],
+        RuleStatus.SAFE,
+    )
+
+
+def _compile_trailing_drawdown(rule: TrailingDrawdownRule) -> CompiledRule:
+    caution_fraction = Decimal("0.20")
+    critical_fraction = Decimal("0.05")
+    return CompiledTrailingDrawdown(
+        name="trailing_drawdown",
+        method="_calculate_trailing_drawdown",
+        batch_method="_calculate_trailing_drawdown_many",
+        enabled=rule.enabled,
+        reads=(
+            "equity" if rule.include_unrealized_pnl else "balance",
+            "high_water_mark",
+        ),
+        rule=rule,
+        max_drawdown_percent=Decimal(str(rule.max_drawdown_percent)),
+        caution_fraction=caution_fraction,
+        critical_fraction=critical_fraction,
+        bands=_buffer_percent_bands(critical_fraction * 100, caution_fraction * 100),
+        recovery_path=(
+            None
+            if rule.recoverable == RuleRecoverability.NON_RECOVERABLE
+            else "Cannot recover - account fails immediately"
+        ),
+    )
+
+
+def _compile_daily_loss_limit(rule: DailyLossLimitRule) -> CompiledRule:
+    max_loss = Decimal(str(rule.max_loss_amount))
+    critical_loss = max_loss * Decimal("0.95")
+    caution_loss = max_loss * Decimal("0.80")
+    recovery_path = None
+    if rule.recoverable == RuleRecoverability.RECOVERABLE:
+        recovery_path = f"Trading disabled until next session (resets at {rule.reset_time}). Account does not fail unless repeated abuse."
+    elif rule.recoverable == RuleRecoverability.NON_RECOVERABLE:
+        recovery_path = "Cannot recover - account fails immediately"
+    return CompiledDailyLossLimit(
+        name="daily_loss_limit",
+        method="_calculate_daily_loss_limit",
+        batch_method="_calculate_daily_loss_limit_many",
+        enabled=rule.enabled,
+        reads=("daily_pnl",),
+        rule=rule,
+        max_loss=max_loss,
+        critical_loss=critical_loss,
+        caution_loss=caution_loss,
+        bands=ThresholdBands.rising(
+            [
+                (RuleStatus.VIOLATED, max_loss),
+                (RuleStatus.CRITICAL, critical_loss),
+                (RuleStatus.CAUTION, caution_loss),
+            ],
+            RuleStatus.SAFE,
+        ),
+        recovery_path=recovery_path,
+    )
+
+
+def _compile_overall_max_loss(rule: OverallMaxLossRule) -> CompiledRule:
+    return CompiledOverallMaxLoss(
+        name="overall_max_loss",
+        method="_calculate_overall_max_loss",
+        enabled=rule.enabled,
+        reads=(
+            ("starting_balance", "equity")
+            if rule.from_starting_balance
+            else ("realized_pnl",)
+        ),
+        rule=rule,
+        critical_percent=Decimal("10"),
+        caution_percent=Decimal("30"),
+        bands=_buffer_percent_bands(Decimal("10"), Decimal("30")),
+    )
+
+
+def _compile_max_position_size(rule: MaxPositionSizeRule) -> CompiledRule:
+    critical_size = rule.max_contracts * Decimal("0.95")
+    caution_size = rule.max_contracts * Decimal("0.80")
+    return CompiledMaxPositionSize(
+        name="max_position_size",
+        method="_calculate_max_position_size",
+        batch_method="_calculate_max_position_size_many",
+        enabled=rule.enabled,
+        reads=("open_positions.quantity",),
+        rule=rule,
+        max_contracts=Decimal(rule.max_contracts),
+        critical_size=critical_size,
+        caution_size=caution_size,
+        bands=ThresholdBands.rising(
+            [
+                (RuleStatus.VIOLATED, rule.max_contracts),
+                (RuleStatus.CRITICAL, critical_size),
+                (RuleStatus.CAUTION, caution_size),
+            ],
+            RuleStatus.SAFE,
+            inclusive=False,
+        ),
+        recovery_path=_non_recoverable_path(rule),
+    )
+
+
+def _compile_mae(rule: MAERule) -> CompiledRule:
+    return CompiledMAE(
+        name="mae",
+        method="_calculate_mae",
+        batch_method="_calculate_mae_many",
+        enabled=rule.enabled,
+        reads=("open_positions.peak_unrealized_loss", "starting_balance"),
+        rule=rule,
+        threshold_fraction=rule.max_adverse_excursion_percent / Decimal("100"),
+        critical_percent=Decimal("10"),
+        caution_percent=Decimal("30"),
+        bands=_buffer_percent_bands(Decimal("10"), Decimal("30")),
+    )
+
+
+def _compile_consistency(rule: ConsistencyRule) -> CompiledRule:
+    return CompiledConsistency(
+        name="consistency",
+        method="_calculate_consistency",
+        enabled=rule.enabled,
+        reads=("realized_pnl", "daily_pnl_history"),
+        rule=rule,
+        max_single_day_fraction=rule.max_single_day_percent / Decimal("100"),
+        critical_percent=Decimal("45"),
+        caution_percent=Decimal("40"),
+        bands=ThresholdBands.rising(
+            [
+                (RuleStatus.VIOLATED, rule.max_single_day_percent),
+                (RuleStatus.CRITICAL, Decimal("45")),
+                (RuleStatus.CAUTION, Decimal("40")),
+            ],
+            RuleStatus.SAFE,
+            inclusive=False,
+        ),
+        recovery_path=(
+            "Add more trading days or increase total profit to reduce single-day percentage"
+            if rule.recoverable == RuleRecoverability.RECOVERABLE
+            else None
+        ),
+    )
+
+
+def _compile_trading_hours(rule: TradingHoursRule) -> CompiledRule:
+    close_hour, close_minute = map(int, rule.forced_close_time.split(":"))
+    return CompiledTradingHours(
+        name="trading_hours",
+        method="_calculate_trading_hours",
+        enabled=rule.enabled,
+        reads=("epoch_seconds", "open_positions.quantity"),
+        rule=rule,
+        tz=pytz.timezone(rule.timezone),
+        calendar=session_calendar(rule.timezone, rule.forced_close_time),
+        close_hour=close_hour,
+        close_minute=close_minute,
+        critical_seconds=600,  # 10 minutes
+        caution_seconds=1800,  # 30 minutes
+        # Seconds to the close are 0 at or after it
+        bands=ThresholdBands.falling(
+            [
+                (RuleStatus.VIOLATED, 0),
+                (RuleStatus.CRITICAL, 600),
+                (RuleStatus.CAUTION, 1800),
+            ],
+            RuleStatus.SAFE,
+        ),
+        recovery_path=_non_recoverable_path(rule),
+    )
+
+
+def _compile_minimum_trading_days(rule: MinimumTradingDaysRule) -> CompiledRule:
+    return CompiledMinimumTradingDays(
+        name="minimum_trading_days",
+        method="_calculate_minimum_trading_days",
+        enabled=rule.enabled,
+        reads=("daily_pnl_history",),
+        rule=rule,
+        min_days=Decimal(str(rule.min_days)),
+        bands=ThresholdBands.falling([(RuleStatus.SAFE, 0)], RuleStatus.CAUTION),
+    )
+
+
+def _compile_profit_target(rule: ProfitTargetRule) -> CompiledRule:
+    return CompiledProfitTarget(
+        name="profit_target",
+        method="_calculate_profit_target",
+        enabled=rule.enabled,
+        reads=("realized_pnl", "unrealized_pnl"),
+        rule=rule,
+        safe_percent=Decimal("90"),
+        caution_percent=Decimal("70"),
+        bands=ThresholdBands.rising(
+            [(RuleStatus.SAFE, Decimal("90")), (RuleStatus.CAUTION, Decimal("70"))],
+            RuleStatus.SAFE,
+        ),
+        recovery_path=(
+            f"Continue trading to reach ${rule.target_amount} profit target"
+            if rule.recoverable == RuleRecoverability.RECOVERABLE
+            else None
+        ),
+    )
+
+
+def _engine_placeholder(method: str) -> Callable[..., Any]:
+    """Placeholder that calls a RuleEngine method (built with its rule_state_class)."""
+
+    def placeholder(engine: Any, compiled: CompiledRule) -> Any:
+        return getattr(engine, method)()
+
+    return placeholder
+
+
+def _compile_rule(spec: RuleSpec, config: Any) -> CompiledRule:
+    if spec.compile is not None:
+        compiled = spec.compile(config)
+    else:
+        compiled = CompiledPlugin(
+            name=spec.name,
+            enabled=getattr(config, "enabled", True),
+            reads=spec.reads,
+            rule=config,
+            evaluator=spec.evaluator,
+        )
+    if spec.requires or spec.placeholder is not None:
+        compiled = compiled.model_copy(
+            update={"requires": spec.requires, "placeholder": spec.placeholder}
+        )
+    return compiled
+
+
+_plan_cache: Dict[str, RulePlan] = {}
+_plan_cache_lock = threading.Lock()
+
+
+def rules_hash(rules: FirmRules) -> str:
+    """Content hash of a FirmRules, used as the plan cache key."""
+    return hashlib.sha256(rules.model_dump_json().encode()).hexdigest()
+
+
+def compile_rules(rules: FirmRules) -> RulePlan:
+    """
+    Compile a FirmRules into a RulePlan, reusing a cached plan when one exists
+    for identical rules.
+
+    The plan keeps a private copy of the rules, so later mutation of the
+    FirmRules passed in does not affect it.
+    """
+    key = rules_hash(rules)
+    plan = _plan_cache.get(key)
+    if plan is not None:
+        return plan
+
+    firm_rules = rules.model_copy(deep=True)
+    specs = registered_rules()
+    unknown = set(firm_rules.custom_rules) - {spec.name for spec in specs}
+    if unknown:
+        raise ValueError(f"Unknown rules {sorted(unknown)}; register them with register_rule")
+
+    by_name = {}
+    ordered = []
+    for spec in specs:
+        if spec.field is not None:
+            config = getattr(firm_rules, spec.field)
+        else:
+            config = firm_rules.custom_rules.get(spec.name)
+            if config is not None:
+                config = spec.config_model.model_validate(config)
+        if config is None:
+            continue
+        compiled = _compile_rule(spec, config)
+        by_name[compiled.name] = compiled
+        if compiled.enabled:
+            ordered.append(compiled)
+
+    reads: Optional[Tuple[str, ...]] = ()
+    for compiled in ordered:
+        if compiled.reads is None:
+            reads = None
+            break
+        reads += tuple(field for field in compiled.reads if field not in reads)
+
+    plan = RulePlan(
+        key=key,
+        firm_rules=firm_rules,
+        rules=tuple(ordered),
+        by_name=by_name,
+        reads=reads,
+    )
+    with _plan_cache_lock:
+        return _plan_cache.setdefault(key, plan)
+
+
+def clear_plan_cache() -> None:
+    """Drop all cached plans (e.g. after rule definitions change)."""
+    with _plan_cache_lock:
+        _plan_cache.clear()
+
+
+def plan_cache_size() -> int:
+    """Number of distinct plans currently cached."""
+    return len(_plan_cache)
+
+
+# Built-in rules, in evaluation order
+for _spec in (
+    RuleSpec(
+        name="trailing_drawdown",
+        field="trailing_drawdown",
+        config_model=TrailingDrawdownRule,
+        compile=_compile_trailing_drawdown,
+    ),
+    RuleSpec(
+        name="daily_loss_limit",
+        field="daily_loss_limit",
+        config_model=DailyLossLimitRule,
+        compile=_compile_daily_loss_limit,
+    ),
+    RuleSpec(
+        name="overall_max_loss",
+        field="overall_max_loss",
+        config_model=OverallMaxLossRule,
+        compile=_compile_overall_max_loss,
+    ),
+    RuleSpec(
+        name="max_position_size",
+        field="max_position_size",
+        config_model=MaxPositionSizeRule,
+        compile=_compile_max_position_size,
+    ),
+    RuleSpec(name="mae", field="mae_rule", config_model=MAERule, compile=_compile_mae),
+    RuleSpec(
+        name="consistency",
+        field="consistency_rule",
+        config_model=ConsistencyRule,
+        compile=_compile_consistency,
+        requires=("daily_pnl_history",),
+        placeholder=_engine_placeholder("_consistency_placeholder"),
+    ),
+    RuleSpec(
+        name="trading_hours",
+        field="trading_hours",
+        config_model=TradingHoursRule,
+        compile=_compile_trading_hours,
+    ),
+    RuleSpec(
+        name="minimum_trading_days",
+        field="minimum_trading_days",
+        config_model=MinimumTradingDaysRule,
+        compile=_compile_minimum_trading_days,
+        requires=("daily_pnl_history",),
+        placeholder=_engine_placeholder("_minimum_trading_days_placeholder"),
+    ),
+    RuleSpec(
+        name="profit_target",
+        field="profit_target",
+        config_model=ProfitTargetRule,
+        compile=_compile_profit_target,
+    ),
+):
+    register_rule(_spec)
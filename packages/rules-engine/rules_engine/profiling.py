@@ -0,0 +1,109 @@
+"""
+Opt-in per-rule timing for RuleEngine.
+
+RuleEngine.enable_profiling() shadows each _calculate_* method (and
+get_max_allowed_risk) on that engine instance with a wrapper that counts
+calls, cumulative time and worst-case time. Engines without profiling run
+the plain methods, so the default path pays nothing.
+
+The wrapper is two perf_counter_ns() calls and three integer updates, cheap
+enough to leave on in production. One RuleProfiler can be shared by many
+engines; timings are aggregated by method name. Counters are updated
+without a lock, so concurrent threads may occasionally lose an update.
+"""
+
+import time
+from typing import Callable, Dict
+
+from pydantic import BaseModel
+
+PROFILED_METHODS = ("get_max_allowed_risk",)
+PROFILED_PREFIX = "_calculate_"
+
+
+class MethodTiming(BaseModel):
+    """Call count and latency of one engine method."""
+
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class _Counter:
+    __slots__ = ("calls", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+
+class RuleProfiler:
+    """
+    Timing counters per engine method.
+
+    Usage:
+        profiler = engine.enable_profiling()
+        engine.evaluate(snapshot)
+        profiler.snapshot()["_calculate_mae"].max_ms
+
+    Single-account calculators that delegate to their _many variant (e.g.
+    _calculate_mae) include the time of that call, which is also counted
+    under its own name.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, _Counter] = {}
+
+    def wrap(self, name: str, method: Callable) -> Callable:
+        """Return method wrapped to record its timing under name."""
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters[name] = _Counter()
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                counter.calls += 1
+                counter.total_ns += elapsed
+                if elapsed > counter.max_ns:
+                    counter.max_ns = elapsed
+
+        timed.__name__ = getattr(method, "__name__", name)
+        timed.__wrapped__ = method
+        return timed
+
+    def snapshot(self) -> Dict[str, MethodTiming]:
+        """Current timings of every method that has been called, slowest total first."""
+        timings = {
+            name: MethodTiming(
+                calls=counter.calls,
+                total_ms=counter.total_ns / 1e6,
+                max_ms=counter.max_ns / 1e6,
+            )
+            for name, counter in self._counters.items()
+            if counter.calls
+        }
+        return dict(sorted(timings.items(), key=lambda item: -item[1].total_ms))
+
+    def reset(self) -> None:
+        """Zero all counters (wrapped engines keep reporting here)."""
+        for counter in self._counters.values():
+            counter.calls = counter.total_ns = counter.max_ns = 0
+
+
+def profiled_method_names(engine_class: type) -> list:
+    """Names of the methods enable_profiling() instruments on an engine class."""
+    return [
+        name
+        for name in dir(engine_class)
+        if name.startswith(PROFILED_PREFIX) or name in PROFILED_METHODS
+    ]
@@ -0,0 +1,103 @@
+"""
+Rule registry.
+
+Every rule the engine can evaluate is described by a RuleSpec: its name in
+rule_states, its configuration model, the snapshot fields it reads and
+requires, and how it is evaluated. compile_rules() builds plans from the
+registry, so a new rule is added by registering it, without touching
+FirmRules or the engine.
+
+Built-in rules are registered by plan.py with a compile function that
+pre-resolves their constants and names their RuleEngine method. Plugin
+rules give an evaluator function instead and take their configuration
+from FirmRules.custom_rules[name]:
+
+    class NewsBlackoutRule(BaseModel):
+        enabled: bool = True
+        minutes: int = 2
+
+    def evaluate_news_blackout(engine, compiled, snapshot) -> RuleState:
+        ...
+
+    register_rule(RuleSpec(
+        name="news_blackout",
+        config_model=NewsBlackoutRule,
+        reads=("epoch_seconds",),
+        evaluator=evaluate_news_blackout,
+    ))
+
+Only rules configured in a FirmRules are compiled into its plan, so a rule
+used by one firm costs nothing when evaluating the others.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RuleSpec(BaseModel):
+    """
+    Declaration of one rule.
+
+    field is the FirmRules attribute holding the rule's configuration; None
+    means FirmRules.custom_rules[name], validated with config_model.
+
+    reads are the snapshot fields the rule depends on (see CompiledRule);
+    requires are the fields that must be present and non-empty for the rule
+    to be evaluated. When one is missing the engine skips the evaluator and
+    uses placeholder(engine, compiled) instead, or leaves the rule out of
+    rule_states if there is no placeholder.
+
+    compile turns the configuration into a CompiledRule (built-in rules);
+    otherwise the plan builds one that calls evaluator(engine, compiled,
+    snapshot).
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    name: str
+    config_model: Type[BaseModel]
+    field: Optional[str] = None
+    reads: Optional[Tuple[str, ...]] = None
+    requires: Tuple[str, ...] = ()
+    compile: Optional[Callable[[Any], Any]] = None
+    evaluator: Optional[Callable[..., Any]] = None
+    placeholder: Optional[Callable[..., Any]] = None
+
+
+_registry: Dict[str, RuleSpec] = {}
+_registry_lock = threading.Lock()
+
+
+def register_rule(spec: RuleSpec, replace: bool = False) -> RuleSpec:
+    """
+    Add a rule to the registry. Rules are evaluated in registration order.
+
+    Raises:
+        ValueError: If a rule with the same name is registered and replace
+            is False, or the spec has neither compile nor evaluator
+    """
+    if spec.compile is None and spec.evaluator is None:
+        raise ValueError(f"Rule {spec.name!r} needs a compile function or an evaluator")
+    with _registry_lock:
+        if spec.name in _registry and not replace:
+            raise ValueError(f"Rule {spec.name!r} is already registered")
+        _registry[spec.name] = spec
+    return spec
+
+
+def unregister_rule(name: str) -> None:
+    """Remove a rule from the registry (plans already compiled keep it)."""
+    with _registry_lock:
+        _registry.pop(name, None)
+
+
+def get_rule_spec(name: str) -> Optional[RuleSpec]:
+    """Get a registered rule by name."""
+    return _registry.get(name)
+
+
+def registered_rules() -> List[RuleSpec]:
+    """All registered rules, in evaluation order."""
+    return list(_registry.values())
@@ -0,0 +1,228 @@
+"""
+Replay of recorded account snapshots.
+
+ReplayRunner streams a recorded sequence of AccountSnapshots (e.g. a month
+of 300 ms add-on updates) through a RuleEngine as fast as possible and
+reports every rule status transition plus throughput.
+
+Replays are deterministic: the engine takes the time of day only from
+snapshot.timestamp, never the wall clock. Wall time is only used to measure
+throughput, through an injectable timer.
+
+Accounts may be interleaved in the stream. A snapshot older than an earlier
+one of the same account (a clock-skewed tick) is still evaluated in stream
+order and reported in stats.out_of_order instead of aborting the replay.
+"""
+
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from .engine import RuleEngine
+from .incremental import IncrementalEvaluator
+from .interface import AccountSnapshot, RuleEvaluationResult
+from .models import RuleStatus
+
+
+class StatusTransition(BaseModel):
+    """A rule changing status between two consecutive snapshots of an account."""
+
+    index: int  # position of the snapshot in the replayed stream
+    account_id: str
+    timestamp: datetime
+    rule_name: str
+    previous: Optional[RuleStatus]  # None on an account's first snapshot
+    current: RuleStatus
+    remaining_buffer: Decimal
+
+
+class OutOfOrderSnapshot(BaseModel):
+    """A snapshot older than an earlier snapshot of the same account."""
+
+    index: int  # position of the snapshot in the replayed stream
+    account_id: str
+    timestamp: datetime
+    latest_timestamp: datetime  # latest timestamp seen for the account before it
+
+
+class ReplayStats(BaseModel):
+    """Counts and throughput of a replay."""
+
+    snapshots: int = 0
+    accounts: int = 0
+    transitions: int = 0
+    elapsed_seconds: float = 0.0
+    first_timestamp: Optional[datetime] = None
+    last_timestamp: Optional[datetime] = None
+    out_of_order: List[OutOfOrderSnapshot] = Field(default_factory=list)
+
+    @property
+    def snapshots_per_second(self) -> float:
+        return self.snapshots / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def replayed_seconds(self) -> float:
+        """Span of recorded time covered by the replay."""
+        if self.first_timestamp is None or self.last_timestamp is None:
+            return 0.0
+        return (self.last_timestamp - self.first_timestamp).total_seconds()
+
+
+class ReplayRunner:
+    """
+    Replays snapshots of one or more accounts through a RuleEngine.
+
+    Each account gets its own IncrementalEvaluator, so rules whose inputs
+    did not change between ticks are not recomputed. Each account's
+    snapshots are expected in timestamp order; ones that are not are
+    evaluated anyway and listed in stats.out_of_order.
+
+    Usage:
+        runner = ReplayRunner(engine)
+        for transition in runner.run(read_ndjson("account.ndjson")):
+            print(transition)
+        print(runner.stats.snapshots_per_second)
+    """
+
+    def __init__(
+        self,
+        engine: RuleEngine,
+        timer: Callable[[], float] = time.perf_counter,
+        on_result: Optional[Callable[[AccountSnapshot, RuleEvaluationResult], None]] = None,
+    ):
+        self.engine = engine
+        self.timer = timer
+        self.on_result = on_result
+        self.stats = ReplayStats()
+        self._evaluators: Dict[str, IncrementalEvaluator] = {}
+        self._statuses: Dict[str, Dict[str, RuleStatus]] = {}
+        self._latest: Dict[str, datetime] = {}
+
+    def run(self, snapshots: Iterable[AccountSnapshot]) -> Iterator[StatusTransition]:
+        """
+        Evaluate every snapshot, yielding status transitions as they occur.
+
+        stats is updated as the replay progresses; time spent by the caller
+        between transitions is not counted.
+        """
+        stats = self.stats
+        index = stats.snapshots
+        started: Optional[float] = self.timer()
+        try:
+            for snapshot in snapshots:
+                timestamp = snapshot.timestamp
+                latest = self._latest.get(snapshot.account_id)
+                if latest is None or timestamp >= latest:
+                    self._latest[snapshot.account_id] = timestamp
+                else:
+                    stats.out_of_order.append(
+                        OutOfOrderSnapshot(
+                            index=index,
+                            account_id=snapshot.account_id,
+                            timestamp=timestamp,
+                            latest_timestamp=latest,
+                        )
+                    )
+                evaluator = self._evaluators.get(snapshot.account_id)
+                if evaluator is None:
+                    evaluator = self._evaluators[snapshot.account_id] = IncrementalEvaluator(
+                        self.engine
+                    )
+                    self._statuses[snapshot.account_id] = {}
+                result = evaluator.evaluate(snapshot)
+                if self.on_result is not None:
+                    self.on_result(snapshot, result)
+
+                if stats.first_timestamp is None or timestamp < stats.first_timestamp:
+                    stats.first_timestamp = timestamp
+                if stats.last_timestamp is None or timestamp > stats.last_timestamp:
+                    stats.last_timestamp = timestamp
+                stats.snapshots += 1
+
+                statuses = self._statuses[snapshot.account_id]
+                transitions = []
+                for rule_name, state in result.rule_states.items():
+                    previous = statuses.get(rule_name)
+                    if state.status != previous:
+                        statuses[rule_name] = state.status
+                        transitions.append(
+                            StatusTransition(
+                                index=index,
+                                account_id=snapshot.account_id,
+                                timestamp=snapshot.timestamp,
+                                rule_name=rule_name,
+                                previous=previous,
+                                current=state.status,
+                                remaining_buffer=state.remaining_buffer,
+                            )
+                        )
+                index += 1
+
+                if transitions:
+                    stats.transitions += len(transitions)
+                    stats.elapsed_seconds += self.timer() - started
+                    started = None
+                    yield from transitions
+                    started = self.timer()
+        finally:
+            if started is not None:
+                stats.elapsed_seconds += self.timer() - started
+            stats.accounts = len(self._evaluators)
+
+    def replay(self, snapshots: Iterable[AccountSnapshot]) -> List[StatusTransition]:
+        """Run the whole stream and return all transitions."""
+        return list(self.run(snapshots))
+
+
+def read_ndjson(source: Union[str, IO[str]]) -> Iterator[AccountSnapshot]:
+    """
+    Stream AccountSnapshots from newline-delimited JSON.
+
+    source is a path or an open text file; blank lines are skipped.
+    """
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as file:
+            yield from read_ndjson(file)
+        return
+    for line in source:
+        if line.strip():
+            yield AccountSnapshot.model_validate_json(line)
+
+
+def write_ndjson(snapshots: Iterable[AccountSnapshot], target: IO[str]) -> int:
+    """Record snapshots as newline-delimited JSON. Returns the number written."""
+    count = 0
+    for snapshot in snapshots:
+        target.write(snapshot.model_dump_json())
+        target.write("\n")
+        count += 1
+    return count
+
+
+def snapshot_from_row(row: Dict, starting_balance: Decimal) -> AccountSnapshot:
+    """
+    Build an AccountSnapshot from an account_state_snapshots row.
+
+    Rows do not store the starting balance (it belongs to the account) or
+    the daily PnL history, so starting_balance is passed in and history-based
+    rules see no history.
+    """
+    positions = row.get("open_positions") or []
+    if isinstance(positions, str):
+        positions = json.loads(positions)
+    return AccountSnapshot(
+        account_id=row["account_id"],
+        timestamp=row["timestamp"],
+        equity=Decimal(str(row["equity"])),
+        balance=Decimal(str(row["balance"])),
+        realized_pnl=Decimal(str(row.get("realized_pnl") or 0)),
+        unrealized_pnl=Decimal(str(row.get("unrealized_pnl") or 0)),
+        high_water_mark=Decimal(str(row["high_water_mark"])),
+        daily_pnl=Decimal(str(row.get("daily_pnl") or 0)),
+        starting_balance=starting_balance,
+        open_positions=positions,
+    )
@@ -0,0 +1,195 @@
+"""
+Compact evaluation results for internal hot paths.
+
+Building a RuleEvaluationResult validates a RuleState and a DistanceMetric
+model per rule, which dominates the cost of an evaluation. CompactRuleEngine
+builds plain __slots__ records instead and only materializes the frozen
+RuleEvaluationResult interface (without re-validation) when asked for it.
+"""
+
+from decimal import Decimal
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .engine import RuleEngine
+from .interface import AccountSnapshot, RuleEvaluationResult
+from .models import (
+    DistanceMetric,
+    RuleRecoverability,
+    RuleSeverity,
+    RuleState,
+    RuleStatus,
+    RuleType,
+)
+
+
+class CompactDistanceMetric:
+    """__slots__ counterpart of DistanceMetric."""
+
+    __slots__ = ("dollars", "ticks", "contracts", "percent")
+
+    def __init__(
+        self,
+        dollars: Optional[Decimal] = None,
+        ticks: Optional[Decimal] = None,
+        contracts: Optional[int] = None,
+        percent: Optional[Decimal] = None,
+    ):
+        self.dollars = dollars
+        self.ticks = ticks
+        self.contracts = contracts
+        self.percent = percent
+
+    def to_model(self) -> DistanceMetric:
+        return DistanceMetric.model_construct(
+            dollars=self.dollars,
+            ticks=self.ticks,
+            contracts=self.contracts,
+            percent=self.percent,
+        )
+
+
+class CompactRuleState:
+    """__slots__ counterpart of RuleState, with the same constructor."""
+
+    __slots__ = (
+        "rule_name",
+        "current_value",
+        "threshold",
+        "remaining_buffer",
+        "buffer_percent",
+        "status",
+        "distance_to_violation",
+        "warnings",
+        "recoverable",
+        "severity",
+        "rule_type",
+        "recovery_path",
+    )
+
+    def __init__(
+        self,
+        rule_name: str,
+        current_value: Decimal,
+        threshold: Decimal,
+        remaining_buffer: Decimal,
+        buffer_percent: Decimal,
+        status: RuleStatus,
+        distance_to_violation: CompactDistanceMetric,
+        warnings: Optional[List[str]] = None,
+        recoverable: RuleRecoverability = RuleRecoverability.NON_RECOVERABLE,
+        severity: RuleSeverity = RuleSeverity.HARD_FAIL,
+        rule_type: RuleType = RuleType.OBJECTIVE,
+        recovery_path: Optional[str] = None,
+    ):
+        self.rule_name = rule_name
+        self.current_value = current_value
+        self.threshold = threshold
+        self.remaining_buffer = remaining_buffer
+        self.buffer_percent = buffer_percent
+        self.status = status
+        self.distance_to_violation = distance_to_violation
+        self.warnings = warnings if warnings is not None else []
+        self.recoverable = recoverable
+        self.severity = severity
+        self.rule_type = rule_type
+        self.recovery_path = recovery_path
+
+    def to_model(self) -> RuleState:
+        """Materialize as a RuleState without re-validating."""
+        return RuleState.model_construct(
+            rule_name=self.rule_name,
+            current_value=self.current_value,
+            threshold=self.threshold,
+            remaining_buffer=self.remaining_buffer,
+            buffer_percent=self.buffer_percent,
+            status=self.status,
+            distance_to_violation=self.distance_to_violation.to_model(),
+            warnings=self.warnings,
+            recoverable=self.recoverable,
+            severity=self.severity,
+            rule_type=self.rule_type,
+            recovery_path=self.recovery_path,
+        )
+
+
+class CompactEvaluationResult:
+    """
+    __slots__ counterpart of RuleEvaluationResult.
+
+    materialize() builds the frozen RuleEvaluationResult interface on first
+    call and returns the same object afterwards.
+    """
+
+    __slots__ = (
+        "account_id",
+        "timestamp",
+        "rule_states",
+        "max_allowed_risk",
+        "overall_risk_level",
+        "_model",
+    )
+
+    def __init__(
+        self,
+        account_id: str,
+        timestamp: datetime,
+        rule_states: Dict[str, CompactRuleState],
+        max_allowed_risk: Dict[str, Decimal],
+        overall_risk_level: str,
+    ):
+        self.account_id = account_id
+        self.timestamp = timestamp
+        self.rule_states = rule_states
+        self.max_allowed_risk = max_allowed_risk
+        self.overall_risk_level = overall_risk_level
+        self._model: Optional[RuleEvaluationResult] = None
+
+    def materialize(self) -> RuleEvaluationResult:
+        """The frozen RuleEvaluationResult for this evaluation."""
+        if self._model is None:
+            self._model = RuleEvaluationResult.model_construct(
+                account_id=self.account_id,
+                timestamp=self.timestamp,
+                rule_states={
+                    name: state.to_model() for name, state in self.rule_states.items()
+                },
+                max_allowed_risk=self.max_allowed_risk,
+                overall_risk_level=self.overall_risk_level,
+            )
+        return self._model
+
+
+class CompactRuleEngine(RuleEngine):
+    """
+    RuleEngine whose calculators build CompactRuleStates.
+
+    evaluate_compact() returns a CompactEvaluationResult for internal use;
+    evaluate() and evaluate_many() still return RuleEvaluationResults,
+    materialized from the compact records without re-validation.
+    """
+
+    rule_state_class = CompactRuleState
+    distance_class = CompactDistanceMetric
+
+    def evaluate_compact(self, snapshot: AccountSnapshot) -> CompactEvaluationResult:
+        """Evaluate rules against a snapshot without building Pydantic models."""
+        return self._make_compact_result(
+            snapshot, self.calculate_all_rule_states(snapshot)
+        )
+
+    def _make_compact_result(
+        self, snapshot: AccountSnapshot, rule_states: Dict[str, CompactRuleState]
+    ) -> CompactEvaluationResult:
+        return CompactEvaluationResult(
+            account_id=snapshot.account_id,
+            timestamp=snapshot.timestamp,
+            rule_states=rule_states,
+            max_allowed_risk=self.get_max_allowed_risk(snapshot, rule_states),
+            overall_risk_level=self._calculate_overall_risk_level(rule_states),
+        )
+
+    def _make_result(
+        self, snapshot: AccountSnapshot, rule_states: Dict[str, CompactRuleState]
+    ) -> RuleEvaluationResult:
+        return self._make_compact_result(snapshot, rule_states).materialize()
@@ -0,0 +1,123 @@
+"""
+Trading-session calendar.
+
+Forced-close deadlines are wall-clock times in a firm's timezone (e.g. 16:59
+America/New_York). A SessionCalendar converts them once into UTC epoch
+seconds for every local date, a year at a time, so the trading-hours rule
+reduces to integer comparisons against the snapshot timestamp. Calendars
+are shared by every account with the same (timezone, forced_close_time).
+"""
+
+import calendar
+import threading
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+import pytz
+
+
+def to_epoch_seconds(timestamp: datetime) -> int:
+    """
+    Whole UTC epoch seconds of a timestamp.
+
+    Naive timestamps are taken to be UTC, as produced by the backend and the
+    platform add-ons.
+    """
+    return calendar.timegm(timestamp.utctimetuple())
+
+
+class SessionCalendar:
+    """
+    Precomputed forced-close instants for one (timezone, forced_close_time).
+
+    For each local date it stores the UTC epoch of local midnight and of the
+    forced close. DST transitions are handled by localizing every date
+    individually. Years are computed on first use and kept.
+    """
+
+    def __init__(self, timezone: str, forced_close_time: str):
+        self.timezone = timezone
+        self.forced_close_time = forced_close_time
+        self._tz = pytz.timezone(timezone)
+        self._close_hour, self._close_minute = map(int, forced_close_time.split(":"))
+        self._lock = threading.Lock()
+        self._first_year = 0
+        self._last_year = -1
+        # (day_starts, closes, end) replaced as a whole so lookups never
+        # see a half-extended table
+        self._table: Tuple[List[int], List[int], int] = ([], [], 0)
+
+    def _local_epoch(self, day: date, hour: int, minute: int) -> int:
+        local = self._tz.localize(
+            datetime(day.year, day.month, day.day, hour, minute), is_dst=False
+        )
+        return to_epoch_seconds(local)
+
+    def _compute_year(self, year: int) -> Tuple[List[int], List[int]]:
+        day_starts = []
+        closes = []
+        day = date(year, 1, 1)
+        one_day = timedelta(days=1)
+        while day.year == year:
+            day_starts.append(self._local_epoch(day, 0, 0))
+            closes.append(self._local_epoch(day, self._close_hour, self._close_minute))
+            day += one_day
+        return day_starts, closes
+
+    def _table_for(self, epoch: int) -> Tuple[List[int], List[int], int]:
+        """Return a table covering epoch, extending it by whole years if needed."""
+        table = self._table
+        if table[0] and table[0][0] <= epoch < table[2]:
+            return table
+        with self._lock:
+            day_starts, closes, end = self._table
+            if not day_starts:
+                self._first_year = self._last_year = time.gmtime(epoch).tm_year
+                day_starts, closes = self._compute_year(self._first_year)
+                end = self._local_epoch(date(self._last_year + 1, 1, 1), 0, 0)
+            while epoch < day_starts[0]:
+                self._first_year -= 1
+                earlier_starts, earlier_closes = self._compute_year(self._first_year)
+                day_starts = earlier_starts + day_starts
+                closes = earlier_closes + closes
+            while epoch >= end:
+                self._last_year += 1
+                later_starts, later_closes = self._compute_year(self._last_year)
+                day_starts = day_starts + later_starts
+                closes = closes + later_closes
+                end = self._local_epoch(date(self._last_year + 1, 1, 1), 0, 0)
+            self._table = (day_starts, closes, end)
+            return self._table
+
+    def forced_close(self, epoch: int) -> int:
+        """Epoch of the forced close on the local date containing epoch."""
+        day_starts, closes, _ = self._table_for(epoch)
+        return closes[bisect_right(day_starts, epoch) - 1]
+
+    def next_forced_close(self, epoch: int) -> int:
+        """Epoch of the first forced close strictly after epoch."""
+        day_starts, closes, end = self._table_for(epoch)
+        index = bisect_right(day_starts, epoch) - 1
+        if closes[index] > epoch:
+            return closes[index]
+        if index + 1 < len(closes):
+            return closes[index + 1]
+        return self.forced_close(end)
+
+
+_calendars: Dict[Tuple[str, str], SessionCalendar] = {}
+_calendars_lock = threading.Lock()
+
+
+def session_calendar(timezone: str, forced_close_time: str) -> SessionCalendar:
+    """Get the shared SessionCalendar for a timezone and forced close time."""
+    key = (timezone, forced_close_time)
+    shared = _calendars.get(key)
+    if shared is None:
+        with _calendars_lock:
+            shared = _calendars.setdefault(
+                key, SessionCalendar(timezone, forced_close_time)
+            )
+    return shared
@@ -0,0 +1,354 @@
+"""
+Monte Carlo risk of ruin.
+
+Estimates, for one account, the probability of breaching trailing drawdown,
+daily loss limit, overall max loss or MAE before the profit target is
+reached, by simulating many independent PnL paths from the current
+AccountSnapshot under the account's FirmRules.
+
+Paths are simulated as whole NumPy arrays (paths x steps) and can be split
+into chunks that run on a process pool. Each chunk has its own seed spawned
+from one SeedSequence, so results only depend on seed and chunks, not on
+where the chunks ran.
+
+Requires NumPy (the "numpy" extra).
+"""
+
+from concurrent.futures import Executor
+from typing import Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .engine import RuleEngine
+from .interface import AccountSnapshot
+from .models import RuleStatus
+
+# Rules whose breach ends a path, in the order ties are reported
+RUIN_RULES = ("trailing_drawdown", "daily_loss_limit", "overall_max_loss", "mae")
+
+
+class PnlDistribution(BaseModel):
+    """
+    Distribution of simulated PnL outcomes.
+
+    per="trade" draws trades_per_day outcomes per day; per="day" draws one
+    outcome per day. Outcomes are resampled from samples when given,
+    otherwise drawn from a normal distribution with mean and std.
+    """
+
+    per: Literal["trade", "day"] = "day"
+    samples: Optional[List[float]] = None
+    mean: float = 0.0
+    std: float = 0.0
+    trades_per_day: int = Field(default=1, ge=1)
+
+    @classmethod
+    def from_history(cls, daily_pnl_history: Dict[str, object]) -> "PnlDistribution":
+        """Empirical per-day distribution from an account's daily PnL history."""
+        return cls(per="day", samples=[float(pnl) for pnl in daily_pnl_history.values()])
+
+    @property
+    def steps_per_day(self) -> int:
+        return self.trades_per_day if self.per == "trade" else 1
+
+    def sample(self, rng: np.random.Generator, shape: Tuple[int, int]) -> np.ndarray:
+        """Draw outcomes in dollars."""
+        if self.samples:
+            return rng.choice(np.asarray(self.samples, dtype=np.float64), size=shape)
+        return rng.normal(self.mean, self.std, size=shape)
+
+
+class RiskOfRuinResult(BaseModel):
+    """
+    Outcome frequencies over all simulated paths.
+
+    Probabilities of ruin, target and unresolved (neither within
+    horizon_days) sum to 1. breach_probabilities splits ruin by the rule
+    breached first.
+    """
+
+    account_id: str
+    paths: int
+    horizon_days: int
+    ruin_probability: float
+    target_probability: float
+    unresolved_probability: float
+    breach_probabilities: Dict[str, float]
+    mean_days_to_ruin: Optional[float] = None
+    mean_days_to_target: Optional[float] = None
+
+
+class _Limits(NamedTuple):
+    """Plain-float account state and thresholds shipped to worker processes."""
+
+    equity: float
+    high_water_mark: float
+    daily_pnl: float
+    profit: float
+    realized_pnl: float
+    starting_balance: float
+    trailing_fraction: Optional[float]
+    daily_max_loss: Optional[float]
+    overall_max_loss: Optional[float]
+    overall_from_starting_balance: bool
+    mae_threshold: Optional[float]
+    profit_target: Optional[float]
+
+
+def _limits(engine: RuleEngine, snapshot: AccountSnapshot) -> _Limits:
+    plan = engine.plan
+    enabled = {compiled.name for compiled in plan.rules}
+
+    def compiled_rule(name):
+        return plan.get(name).rule if name in enabled else None
+
+    trailing = compiled_rule("trailing_drawdown")
+    daily = compiled_rule("daily_loss_limit")
+    overall = compiled_rule("overall_max_loss")
+    mae = compiled_rule("mae")
+    target = compiled_rule("profit_target")
+    return _Limits(
+        equity=float(snapshot.equity),
+        high_water_mark=float(snapshot.high_water_mark),
+        daily_pnl=float(snapshot.daily_pnl),
+        profit=float(snapshot.realized_pnl + snapshot.unrealized_pnl),
+        realized_pnl=float(snapshot.realized_pnl),
+        starting_balance=float(snapshot.starting_balance),
+        trailing_fraction=(
+            float(trailing.max_drawdown_percent) / 100 if trailing is not None else None
+        ),
+        daily_max_loss=float(daily.max_loss_amount) if daily is not None else None,
+        overall_max_loss=float(overall.max_loss_amount) if overall is not None else None,
+        overall_from_starting_balance=overall is None or overall.from_starting_balance,
+        mae_threshold=(
+            float(snapshot.starting_balance * mae.max_adverse_excursion_percent) / 100
+            if mae is not None
+            else None
+        ),
+        profit_target=float(target.target_amount) if target is not None else None,
+    )
+
+
+def _first(mask: np.ndarray) -> np.ndarray:
+    """Index of the first True per row, or the row length if none."""
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), mask.shape[1])
+
+
+def _simulate_chunk(
+    limits: _Limits,
+    distribution: PnlDistribution,
+    horizon_days: int,
+    paths: int,
+    seed: np.random.SeedSequence,
+) -> Tuple[np.ndarray, int, float, float]:
+    """
+    Simulate one chunk of paths.
+
+    Returns (breaches per RUIN_RULES entry, target count, summed days to
+    ruin, summed days to target).
+    """
+    rng = np.random.default_rng(seed)
+    per_day = distribution.steps_per_day
+    steps = horizon_days * per_day
+    pnl = distribution.sample(rng, (paths, steps))
+    cumulative = np.cumsum(pnl, axis=1)
+
+    # Open positions are treated as closed at their current price, so equity
+    # and balance move together from here on.
+    equity = limits.equity + cumulative
+    never = np.full(paths, steps)
+    first_breach = []
+
+    if limits.trailing_fraction is not None:
+        hwm = np.maximum(limits.high_water_mark, np.maximum.accumulate(equity, axis=1))
+        first_breach.append(_first(equity <= hwm * (1 - limits.trailing_fraction)))
+    else:
+        first_breach.append(never)
+
+    if limits.daily_max_loss is not None:
+        daily = np.cumsum(pnl.reshape(paths, horizon_days, per_day), axis=2)
+        daily[:, 0, :] += limits.daily_pnl
+        first_breach.append(_first(daily.reshape(paths, steps) <= -limits.daily_max_loss))
+    else:
+        first_breach.append(never)
+
+    if limits.overall_max_loss is not None:
+        if limits.overall_from_starting_balance:
+            total_loss = limits.starting_balance - equity
+        else:
+            total_loss = -(limits.realized_pnl + cumulative)
+        first_breach.append(_first(total_loss >= limits.overall_max_loss))
+    else:
+        first_breach.append(never)
+
+    if limits.mae_threshold is not None:
+        # A step's loss is a lower bound on the adverse excursion within it
+        first_breach.append(_first(pnl <= -limits.mae_threshold))
+    else:
+        first_breach.append(never)
+
+    if limits.profit_target is not None:
+        reached = _first(limits.profit + cumulative >= limits.profit_target)
+    else:
+        reached = never
+
+    breach_steps = np.stack(first_breach)
+    ruin_step = breach_steps.min(axis=0)
+    # A breach on the same step as the target still fails the account
+    ruined = (ruin_step < steps) & (ruin_step <= reached)
+    succeeded = ~ruined & (reached < steps)
+
+    breached_rule = breach_steps.argmin(axis=0)[ruined]
+    breaches = np.bincount(breached_rule, minlength=len(RUIN_RULES))
+    days_to_ruin = float((ruin_step[ruined] // per_day + 1).sum())
+    days_to_target = float((reached[succeeded] // per_day + 1).sum())
+    return breaches, int(succeeded.sum()), days_to_ruin, days_to_target
+
+
+def _settled_result(
+    snapshot: AccountSnapshot, engine: RuleEngine, paths: int, horizon_days: int
+) -> Optional[RiskOfRuinResult]:
+    """Result for an account already failed or already at its target."""
+    result = engine.evaluate(snapshot)
+    for rule_name in RUIN_RULES:
+        state = result.rule_states.get(rule_name)
+        if state is not None and state.status == RuleStatus.VIOLATED:
+            return RiskOfRuinResult(
+                account_id=snapshot.account_id,
+                paths=paths,
+                horizon_days=horizon_days,
+                ruin_probability=1.0,
+                target_probability=0.0,
+                unresolved_probability=0.0,
+                breach_probabilities={
+                    name: float(name == rule_name) for name in RUIN_RULES
+                },
+                mean_days_to_ruin=0.0,
+            )
+    target = result.rule_states.get("profit_target")
+    if target is not None and target.remaining_buffer <= 0:
+        return RiskOfRuinResult(
+            account_id=snapshot.account_id,
+            paths=paths,
+            horizon_days=horizon_days,
+            ruin_probability=0.0,
+            target_probability=1.0,
+            unresolved_probability=0.0,
+            breach_probabilities={name: 0.0 for name in RUIN_RULES},
+            mean_days_to_target=0.0,
+        )
+    return None
+
+
+def _chunk_sizes(paths: int, chunks: int) -> List[int]:
+    base, extra = divmod(paths, chunks)
+    return [base + (1 if i < extra else 0) for i in range(chunks) if base or i < extra]
+
+
+def simulate_accounts(
+    jobs: Sequence[Tuple[RuleEngine, AccountSnapshot, PnlDistribution]],
+    paths: int = 10_000,
+    horizon_days: int = 20,
+    seed: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunks: int = 1,
+) -> List[RiskOfRuinResult]:
+    """
+    Estimate risk of ruin for several accounts.
+
+    Every account's chunks are submitted before any is awaited, so a
+    process pool works on the whole group at once.
+
+    Args:
+        jobs: (engine, snapshot, distribution) per account
+        paths: Simulated paths per account
+        horizon_days: Trading days simulated per path
+        seed: Seed for reproducible results
+        executor: Pool to run chunks on; None runs them in this process
+        chunks: Number of chunks each account's paths are split into
+
+    Returns:
+        One RiskOfRuinResult per job, in order.
+    """
+    if paths < 1 or horizon_days < 1 or chunks < 1:
+        raise ValueError("paths, horizon_days and chunks must be positive")
+
+    account_seeds = np.random.SeedSequence(seed).spawn(len(jobs))
+    settled: List[Optional[RiskOfRuinResult]] = []
+    pending = []
+    for (engine, snapshot, distribution), account_seed in zip(jobs, account_seeds):
+        result = _settled_result(snapshot, engine, paths, horizon_days)
+        settled.append(result)
+        if result is not None:
+            pending.append([])
+            continue
+        limits = _limits(engine, snapshot)
+        sizes = _chunk_sizes(paths, chunks)
+        args = [
+            (limits, distribution, horizon_days, size, chunk_seed)
+            for size, chunk_seed in zip(sizes, account_seed.spawn(len(sizes)))
+        ]
+        if executor is None:
+            pending.append([_simulate_chunk(*chunk_args) for chunk_args in args])
+        else:
+            pending.append([executor.submit(_simulate_chunk, *chunk_args) for chunk_args in args])
+
+    results = []
+    for (engine, snapshot, _), result, chunk_results in zip(jobs, settled, pending):
+        if result is not None:
+            results.append(result)
+            continue
+        breaches = np.zeros(len(RUIN_RULES), dtype=np.int64)
+        targets = 0
+        days_to_ruin = days_to_target = 0.0
+        for chunk in chunk_results:
+            chunk_breaches, chunk_targets, chunk_ruin_days, chunk_target_days = (
+                chunk if executor is None else chunk.result()
+            )
+            breaches += chunk_breaches
+            targets += chunk_targets
+            days_to_ruin += chunk_ruin_days
+            days_to_target += chunk_target_days
+        ruins = int(breaches.sum())
+        results.append(
+            RiskOfRuinResult(
+                account_id=snapshot.account_id,
+                paths=paths,
+                horizon_days=horizon_days,
+                ruin_probability=ruins / paths,
+                target_probability=targets / paths,
+                unresolved_probability=(paths - ruins - targets) / paths,
+                breach_probabilities={
+                    name: int(count) / paths for name, count in zip(RUIN_RULES, breaches)
+                },
+                mean_days_to_ruin=days_to_ruin / ruins if ruins else None,
+                mean_days_to_target=days_to_target / targets if targets else None,
+            )
+        )
+    return results
+
+
+def simulate_risk_of_ruin(
+    engine: RuleEngine,
+    snapshot: AccountSnapshot,
+    distribution: PnlDistribution,
+    paths: int = 10_000,
+    horizon_days: int = 20,
+    seed: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunks: int = 1,
+) -> RiskOfRuinResult:
+    """
+    Estimate the probability of a rule breach before the profit target.
+
+    See simulate_accounts for the arguments.
+    """
+    return simulate_accounts(
+        [(engine, snapshot, distribution)],
+        paths=paths,
+        horizon_days=horizon_days,
+        seed=seed,
+        executor=executor,
+        chunks=chunks,
+    )[0]
@@ -0,0 +1,320 @@
+"""
+Vectorized what-if price sweeps.
+
+Given a snapshot and a grid of hypothetical price moves (in ticks) for its
+open positions, price_sweep() computes the status of every price-sensitive
+rule at every grid point with NumPy integer arrays instead of calling
+evaluate() per point. Money is handled in integer cents and statuses come
+from the plan's ThresholdBands with the same exact integer comparisons as
+FixedPointRuleEngine, so they match what that engine would return for the
+moved snapshot.
+
+Requires NumPy (the "numpy" extra).
+"""
+
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .bands import ThresholdBands
+from .engine import RuleEngine
+from .fixed_point import BPS, to_bps, to_cents
+from .instruments import get_instrument
+from .interface import AccountSnapshot, RuleEvaluationResult
+from .models import RuleStatus
+
+# Status codes used in sweep arrays, in increasing severity
+STATUS_CODES = (
+    RuleStatus.SAFE,
+    RuleStatus.CAUTION,
+    RuleStatus.CRITICAL,
+    RuleStatus.VIOLATED,
+)
+SAFE, CAUTION, CRITICAL, VIOLATED = range(4)
+
+# Rules whose state depends on open-position prices
+SWEPT_RULES = (
+    "trailing_drawdown",
+    "daily_loss_limit",
+    "overall_max_loss",
+    "mae",
+    "profit_target",
+)
+
+PerPosition = Union[Decimal, Sequence[Decimal]]
+
+
+class PriceSweep:
+    """
+    Rule statuses over a grid of price moves.
+
+    moves: (points, positions) tick moves; positive = price up
+    pnl_delta: (points,) change in open PnL at each point, in cents
+    status: rule name -> (points,) status codes (index into STATUS_CODES)
+    remaining_buffer: rule name -> (points,) remaining buffer in dollars
+    tick_values: (positions,) cents per tick per contract of each position
+    """
+
+    def __init__(
+        self,
+        moves: np.ndarray,
+        pnl_delta: np.ndarray,
+        status: Dict[str, np.ndarray],
+        remaining_buffer: Dict[str, np.ndarray],
+        tick_values: Optional[np.ndarray] = None,
+    ):
+        self.moves = moves
+        self.pnl_delta = pnl_delta
+        self.status = status
+        self.remaining_buffer = remaining_buffer
+        self.tick_values = (
+            tick_values if tick_values is not None else np.zeros(moves.shape[1], dtype=np.int64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    @property
+    def overall(self) -> np.ndarray:
+        """(points,) worst status code across swept rules."""
+        if not self.status:
+            return np.zeros(len(self.moves), dtype=np.int8)
+        return np.max(np.stack(list(self.status.values())), axis=0)
+
+    def statuses(self, rule_name: str) -> List[RuleStatus]:
+        """Statuses of one rule at every grid point."""
+        return [STATUS_CODES[code] for code in self.status[rule_name]]
+
+    def ticks_to_violation(self, rule_name: str) -> Optional[int]:
+        """
+        Smallest move (in ticks, largest absolute move across positions) at
+        which the rule is violated, or None if no grid point violates it.
+        """
+        violated = self.status[rule_name] == VIOLATED
+        if not violated.any():
+            return None
+        size = np.max(np.abs(self.moves), axis=1) if self.moves.shape[1] else np.zeros(len(self))
+        return int(size[violated].min())
+
+    def contracts_for(self, dollars: Decimal, ticks: int) -> Optional[int]:
+        """
+        Whole contracts whose loss over a move of ticks fits in dollars.
+
+        Uses the largest tick value among the open positions, so with mixed
+        instruments the count is for the one that loses fastest. None when
+        there are no positions or ticks is not positive.
+        """
+        if ticks <= 0 or not len(self.tick_values):
+            return None
+        tick_value = int(np.max(self.tick_values))
+        if tick_value <= 0:
+            return None
+        return max(to_cents(dollars), 0) // (ticks * tick_value)
+
+
+def _per_position(value: PerPosition, count: int) -> List[Decimal]:
+    if isinstance(value, (Decimal, int, float, str)):
+        return [Decimal(str(value))] * count
+    values = [Decimal(str(v)) for v in value]
+    if len(values) != count:
+        raise ValueError(f"Expected {count} values (one per open position), got {len(values)}")
+    return values
+
+
+def price_sweep(
+    engine: RuleEngine,
+    snapshot: AccountSnapshot,
+    moves: Sequence,
+    tick_size: Optional[PerPosition] = None,
+    point_value: Optional[PerPosition] = None,
+    daily_pnl_includes_unrealized: bool = False,
+) -> PriceSweep:
+    """
+    Sweep hypothetical price moves of the snapshot's open positions.
+
+    Args:
+        engine: Engine whose rules are swept
+        snapshot: Current account state
+        moves: Tick moves, either (points,) applied to every position or
+            (points, positions) with one column per open position
+        tick_size: Minimum price increment, per position or for all
+            (default: looked up from the instrument registry)
+        point_value: Dollars per point per contract, per position or for all
+            (default: looked up from the instrument registry)
+        daily_pnl_includes_unrealized: Whether daily_pnl moves with open PnL
+            (default False: the daily loss limit is on realized PnL, as in
+            evaluate(), so price moves do not change its status)
+
+    Returns:
+        PriceSweep with the status of every price-sensitive enabled rule at
+        every grid point.
+    """
+    positions = snapshot.open_positions
+    count = len(positions)
+    grid = np.asarray(moves, dtype=np.int64)
+    if grid.ndim == 1:
+        grid = np.repeat(grid[:, None], count, axis=1)
+    if grid.ndim != 2 or grid.shape[1] != count:
+        raise ValueError(
+            f"moves must have shape (points,) or (points, {count}), got {np.shape(moves)}"
+        )
+
+    if tick_size is None or point_value is None:
+        specs = []
+        for position in positions:
+            spec = get_instrument(position.symbol)
+            if spec is None:
+                raise ValueError(
+                    f"Unknown instrument {position.symbol!r}; pass tick_size and point_value"
+                )
+            specs.append(spec)
+        if tick_size is None:
+            tick_size = [spec.tick_size for spec in specs]
+        if point_value is None:
+            point_value = [spec.point_value for spec in specs]
+
+    tick_values = [
+        to_cents(size * value)
+        for size, value in zip(
+            _per_position(tick_size, count), _per_position(point_value, count)
+        )
+    ]
+    cents_per_tick = np.array(
+        [pos.quantity * tick_value for pos, tick_value in zip(positions, tick_values)],
+        dtype=np.int64,
+    )
+    # (points, positions) change in each position's open PnL
+    position_delta = grid * cents_per_tick
+    pnl_delta = position_delta.sum(axis=1)
+
+    status: Dict[str, np.ndarray] = {}
+    remaining_buffer: Dict[str, np.ndarray] = {}
+    plan = engine.plan
+    enabled = {compiled.name for compiled in plan.rules}
+
+    def codes(bands: ThresholdBands, indices) -> np.ndarray:
+        # Band indices to status codes, broadcast over the grid
+        band_codes = np.array([STATUS_CODES.index(s) for s in bands.statuses], dtype=np.int8)
+        return band_codes[np.broadcast_to(indices, pnl_delta.shape)]
+
+    def percent_codes(bands: ThresholdBands, part, whole: int, fallback_bps: int) -> np.ndarray:
+        # Percent bands over part / whole, as FixedPointRuleEngine classifies them
+        if whole > 0:
+            return codes(bands, bands.ratio_band_indices(part, whole))
+        return codes(bands, bands.band_index(fallback_bps, scale=100))
+
+    equity = to_cents(snapshot.equity) + pnl_delta
+
+    if "trailing_drawdown" in enabled:
+        compiled = plan.get("trailing_drawdown")
+        rule = compiled.rule
+        current = equity if rule.include_unrealized_pnl else np.full_like(
+            pnl_delta, to_cents(snapshot.balance)
+        )
+        hwm = to_cents(snapshot.high_water_mark)
+        threshold_scaled = hwm * to_bps(compiled.max_drawdown_percent)
+        buffer_scaled = current * BPS - (hwm * BPS - threshold_scaled)
+        status["trailing_drawdown"] = np.where(
+            buffer_scaled <= 0,
+            VIOLATED,
+            percent_codes(compiled.bands, buffer_scaled, threshold_scaled, BPS),
+        ).astype(np.int8)
+        remaining_buffer["trailing_drawdown"] = buffer_scaled / (BPS * 100)
+
+    if "daily_loss_limit" in enabled:
+        compiled = plan.get("daily_loss_limit")
+        max_loss = to_cents(compiled.max_loss)
+        daily_pnl = to_cents(snapshot.daily_pnl) + (
+            pnl_delta if daily_pnl_includes_unrealized else 0
+        )
+        daily_loss = np.maximum(0, -daily_pnl) * np.ones_like(pnl_delta)
+        # The plan's loss bands in cents: one searchsorted over the grid
+        status["daily_loss_limit"] = codes(
+            compiled.bands, compiled.bands.band_indices(daily_loss, scale=100)
+        )
+        remaining_buffer["daily_loss_limit"] = (max_loss - daily_loss) / 100
+
+    if "overall_max_loss" in enabled:
+        compiled = plan.get("overall_max_loss")
+        rule = compiled.rule
+        max_loss = to_cents(rule.max_loss_amount)
+        if rule.from_starting_balance:
+            total_loss = to_cents(snapshot.starting_balance) - equity
+        else:
+            total_loss = np.full_like(pnl_delta, max(0, -to_cents(snapshot.realized_pnl)))
+        remaining = max_loss - total_loss
+        status["overall_max_loss"] = np.where(
+            remaining <= 0, VIOLATED, percent_codes(compiled.bands, remaining, max_loss, 0)
+        ).astype(np.int8)
+        remaining_buffer["overall_max_loss"] = remaining / 100
+
+    if "mae" in enabled:
+        compiled = plan.get("mae")
+        rule = compiled.rule
+        if count:
+            unrealized = np.array([to_cents(p.unrealized_pnl) for p in positions], dtype=np.int64)
+            peak = np.array([to_cents(p.peak_unrealized_loss) for p in positions], dtype=np.int64)
+            worst = np.minimum(peak, unrealized + position_delta).min(axis=1)
+            max_mae = -np.minimum(0, worst)
+        else:
+            max_mae = np.zeros_like(pnl_delta)
+        threshold_scaled = to_cents(snapshot.starting_balance) * to_bps(
+            rule.max_adverse_excursion_percent
+        )
+        remaining_scaled = threshold_scaled - max_mae * BPS
+        status["mae"] = np.where(
+            remaining_scaled <= 0,
+            VIOLATED,
+            percent_codes(compiled.bands, remaining_scaled, threshold_scaled, BPS),
+        ).astype(np.int8)
+        remaining_buffer["mae"] = remaining_scaled / (BPS * 100)
+
+    if "profit_target" in enabled:
+        compiled = plan.get("profit_target")
+        target = to_cents(compiled.rule.target_amount)
+        profit = to_cents(snapshot.realized_pnl) + to_cents(snapshot.unrealized_pnl) + pnl_delta
+        remaining = target - profit
+        status["profit_target"] = percent_codes(compiled.bands, profit, target, BPS)
+        remaining_buffer["profit_target"] = remaining / 100
+
+    return PriceSweep(
+        grid, pnl_delta, status, remaining_buffer, np.array(tick_values, dtype=np.int64)
+    )
+
+
+def with_tick_distances(
+    result: RuleEvaluationResult, sweep: PriceSweep
+) -> RuleEvaluationResult:
+    """
+    Fill DistanceMetric.ticks and contracts of the swept rules from a price sweep.
+
+    ticks is 0 for rules already violated and None when no grid point
+    violates the rule. contracts is how many contracts of the open
+    instrument with the largest tick value would lose the rule's dollar
+    distance over that many ticks (see PriceSweep.contracts_for): 0 when
+    violated, None when ticks is None. Returns a copy; result is not
+    modified.
+    """
+    rule_states = dict(result.rule_states)
+    for rule_name, state in result.rule_states.items():
+        if rule_name not in sweep.status:
+            continue
+        if state.status == RuleStatus.VIOLATED:
+            ticks, contracts = 0, 0
+        else:
+            ticks = sweep.ticks_to_violation(rule_name)
+            dollars = state.distance_to_violation.dollars
+            if dollars is None:
+                dollars = state.remaining_buffer
+            contracts = sweep.contracts_for(dollars, ticks) if ticks is not None else None
+        distance = state.distance_to_violation.model_copy(
+            update={
+                "ticks": Decimal(ticks) if ticks is not None else None,
+                "contracts": contracts,
+            }
+        )
+        rule_states[rule_name] = state.model_copy(
+            update={"distance_to_violation": distance}
+        )
+    return result.model_copy(update={"rule_states": rule_states})
@@ -9,5 +9,8 @@ setup(
         "python-dateutil>=2.8.0",
         "pytz>=2023.3",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.24"],
+    },
 )
 
@@ -0,0 +1,150 @@
+"""
+Unit tests for streaming daily PnL aggregates (DailyPnlAggregate).
+
+Aggregated rule states must be identical to scanning the full history.
+"""
+
+import random
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from rules_engine.aggregates import DailyPnlAggregate
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import FixedPointRuleEngine
+from rules_engine.incremental import IncrementalEvaluator
+from rules_engine.interface import AccountSnapshot
+from rules_engine.models import (
+    FirmRules,
+    ConsistencyRule,
+    MinimumTradingDaysRule,
+)
+
+
+def _rules() -> FirmRules:
+    return FirmRules(
+        consistency_rule=ConsistencyRule(
+            enabled=True, max_single_day_percent=Decimal("40")
+        ),
+        minimum_trading_days=MinimumTradingDaysRule(
+            enabled=True, min_days=10, min_profit_per_day=Decimal("50")
+        ),
+    )
+
+
+def _snapshot(history, realized_pnl: Decimal) -> AccountSnapshot:
+    return AccountSnapshot(
+        account_id="acct-1",
+        timestamp=datetime(2026, 3, 2, 14, 0, 0),
+        equity=Decimal("50000") + realized_pnl,
+        balance=Decimal("50000") + realized_pnl,
+        realized_pnl=realized_pnl,
+        high_water_mark=Decimal("50000") + realized_pnl,
+        daily_pnl=Decimal("0"),
+        starting_balance=Decimal("50000"),
+        daily_pnl_history=dict(history),
+    )
+
+
+def test_aggregate_matches_brute_force():
+    """Random day updates and revisions keep all aggregates exact."""
+    rng = random.Random(7)
+    aggregate = DailyPnlAggregate()
+    aggregate.qualifying_days(Decimal("50"))
+    history = {}
+
+    for step in range(2000):
+        if rng.random() < 0.8 and history:
+            date = list(history)[-1]  # today's PnL moves
+        else:
+            date = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        pnl = Decimal(rng.randint(-50000, 80000)) / Decimal("100")
+        history[date] = pnl
+        aggregate.set_day(date, pnl)
+
+        assert aggregate.max_day == max(history.values())
+        assert aggregate.total == sum(history.values())
+        assert aggregate.qualifying_days(Decimal("50")) == sum(
+            1 for value in history.values() if value >= Decimal("50")
+        )
+
+    assert aggregate.qualifying_days(Decimal("0")) == sum(
+        1 for value in history.values() if value >= 0
+    )
+    assert dict(aggregate.days) == history
+
+
+def test_revising_the_largest_day_downward():
+    """Lowering the largest day (settled or hot) falls back to the next largest."""
+    aggregate = DailyPnlAggregate(
+        {"2026-01-02": Decimal("900"), "2026-01-05": Decimal("300")}
+    )
+
+    aggregate.set_day("2026-01-02", Decimal("1200"))
+    aggregate.set_day("2026-01-02", Decimal("100"))
+
+    assert aggregate.max_day == Decimal("300")
+
+
+def test_version_changes_only_on_updates():
+    """Re-recording the same value does not bump the version."""
+    aggregate = DailyPnlAggregate({"2026-01-02": Decimal("100")})
+    version = aggregate.version
+
+    aggregate.set_day("2026-01-02", Decimal("100"))
+    assert aggregate.version == version
+
+    aggregate.set_day("2026-01-02", Decimal("150"))
+    assert aggregate.version == version + 1
+
+
+@pytest.mark.parametrize("engine_class", [RuleEngine, FixedPointRuleEngine])
+def test_rules_with_aggregate_match_history_scan(engine_class):
+    """Consistency and minimum trading days agree with and without an aggregate."""
+    engine = engine_class(_rules())
+    history = {
+        f"2026-02-{day:02d}": Decimal(day * 37 % 400) - Decimal("60")
+        for day in range(1, 25)
+    }
+    aggregate = DailyPnlAggregate(history)
+
+    for realized in (Decimal("-100"), Decimal("1500"), Decimal("4000"), Decimal("20000")):
+        snapshot = _snapshot(history, realized)
+        assert engine._calculate_consistency(
+            snapshot, aggregate=aggregate
+        ) == engine._calculate_consistency(snapshot)
+        assert engine._calculate_minimum_trading_days(
+            snapshot, aggregate=aggregate
+        ) == engine._calculate_minimum_trading_days(snapshot)
+
+
+def test_empty_aggregate_returns_placeholders():
+    """An empty aggregate gives the same placeholder states as missing history."""
+    engine = RuleEngine(_rules())
+    snapshot = _snapshot({}, Decimal("1000"))
+
+    assert engine._calculate_consistency(
+        snapshot, aggregate=DailyPnlAggregate()
+    ) == engine._calculate_consistency(snapshot)
+    assert engine._calculate_minimum_trading_days(
+        snapshot, aggregate=DailyPnlAggregate()
+    ) == engine._calculate_minimum_trading_days(snapshot)
+
+
+def test_incremental_evaluator_uses_aggregate():
+    """With an aggregate, history rules recompute only when a day changes."""
+    engine = RuleEngine(_rules())
+    history = {"2026-02-27": Decimal("400"), "2026-03-02": Decimal("100")}
+    aggregate = DailyPnlAggregate(history)
+    evaluator = IncrementalEvaluator(engine, daily_pnl=aggregate)
+
+    evaluator.evaluate(_snapshot(history, Decimal("500")))
+    evaluator.evaluate(_snapshot(history, Decimal("500")))
+    assert evaluator.recomputed == 2
+
+    history["2026-03-02"] = Decimal("250")
+    aggregate.set_day("2026-03-02", Decimal("250"))
+    result = evaluator.evaluate(_snapshot(history, Decimal("650")))
+
+    assert evaluator.recomputed == 4
+    assert result == engine.evaluate(_snapshot(history, Decimal("650")))
@@ -0,0 +1,138 @@
+"""
+Unit tests for threshold-band status classification (ThresholdBands).
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from rules_engine.bands import ThresholdBands
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import FixedPointRuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import RuleStatus
+from rules_engine.plan import compile_rules
+from tests.test_evaluate_many import _rules
+
+SAFE, CAUTION, CRITICAL, VIOLATED = (
+    RuleStatus.SAFE,
+    RuleStatus.CAUTION,
+    RuleStatus.CRITICAL,
+    RuleStatus.VIOLATED,
+)
+
+
+def _daily_loss_chain(loss: Decimal) -> RuleStatus:
+    if loss >= Decimal("1000"):
+        return VIOLATED
+    if loss >= Decimal("950"):
+        return CRITICAL
+    if loss >= Decimal("800"):
+        return CAUTION
+    return SAFE
+
+
+def test_rising_bands_match_if_elif_chain_at_boundaries():
+    bands = ThresholdBands.rising(
+        [(VIOLATED, Decimal("1000")), (CRITICAL, Decimal("950")), (CAUTION, Decimal("800"))],
+        SAFE,
+    )
+    values = [Decimal(v) for v in ("0", "799.99", "800", "949.99", "950", "999.99", "1000", "5000")]
+
+    assert [bands.classify(v) for v in values] == [_daily_loss_chain(v) for v in values]
+    assert bands.classify_many(values) == [_daily_loss_chain(v) for v in values]
+
+
+def test_strict_and_falling_bands():
+    strict = ThresholdBands.rising([(VIOLATED, 10), (CRITICAL, 9), (CAUTION, 8)], SAFE, inclusive=False)
+    assert [strict.classify(v) for v in (8, 9, 10, 11)] == [SAFE, CAUTION, CRITICAL, VIOLATED]
+
+    falling = ThresholdBands.falling([(CRITICAL, 5), (CAUTION, 20)], SAFE)
+    assert [falling.classify(v) for v in (-1, 5, 5.5, 20, 21)] == [
+        CRITICAL,
+        CRITICAL,
+        CAUTION,
+        CAUTION,
+        SAFE,
+    ]
+
+
+def test_unreachable_tiers_become_empty_bands():
+    """A tier behind a stricter earlier one never matches, as in the if/elif chain."""
+    # Consistency with a 30% cap: 40% and 45% tiers can never be reached
+    bands = ThresholdBands.rising(
+        [(VIOLATED, Decimal("30")), (CRITICAL, Decimal("45")), (CAUTION, Decimal("40"))],
+        SAFE,
+        inclusive=False,
+    )
+
+    assert bands.classify(Decimal("30")) == SAFE
+    assert bands.classify(Decimal("42")) == VIOLATED
+
+
+def test_finer_bands_add_cuts_not_branches():
+    bands = ThresholdBands.falling(
+        [(CRITICAL, 5), (CAUTION, 20), (CAUTION, 35), (SAFE, 60)], SAFE
+    )
+
+    assert bands.cuts == (5, 20, 35, 60)
+    assert bands.classify(30) == CAUTION
+
+
+def test_band_indices_match_scalar_classification_on_integer_cents():
+    np = pytest.importorskip("numpy")
+    bands = compile_rules(_rules()).get("daily_loss_limit").bands
+    cents = np.arange(0, 120_001, 1, dtype=np.int64)
+
+    indices = bands.band_indices(cents, scale=100)
+
+    for value in (0, 79_999, 80_000, 94_999, 95_000, 99_999, 100_000, 120_000):
+        expected = bands.classify(Decimal(value) / 100)
+        assert bands.statuses[indices[value]] == expected
+
+
+def test_bands_validate_their_shape():
+    with pytest.raises(ValueError):
+        ThresholdBands([1, 2], [SAFE, CAUTION], upper_inclusive=True)
+    with pytest.raises(ValueError):
+        ThresholdBands([2, 1], [SAFE, CAUTION, CRITICAL], upper_inclusive=True)
+
+
+def test_engine_statuses_match_fixed_point_chains():
+    """Band classification in RuleEngine agrees with FixedPointRuleEngine's if/elif chains."""
+    rules = _rules()
+    engine, reference = RuleEngine(rules), FixedPointRuleEngine(rules)
+    now = datetime(2026, 1, 6, 15, 0, tzinfo=timezone.utc)
+    snapshots = []
+    for loss in range(0, 1200, 25):
+        equity = Decimal("52000") - Decimal(loss) * 3
+        snapshots.append(
+            AccountSnapshot(
+                account_id=f"acc{loss}",
+                timestamp=now,
+                equity=equity,
+                balance=equity,
+                realized_pnl=Decimal("-500") + Decimal(loss),
+                unrealized_pnl=Decimal("0"),
+                high_water_mark=Decimal("52000"),
+                daily_pnl=-Decimal(loss),
+                starting_balance=Decimal("50000"),
+                open_positions=[
+                    PositionSnapshot(
+                        symbol="ES",
+                        quantity=1,
+                        avg_price=Decimal("5000"),
+                        current_price=Decimal("5000"),
+                        unrealized_pnl=Decimal("0"),
+                        opened_at=now - timedelta(minutes=5),
+                        peak_unrealized_loss=-Decimal(loss),
+                    )
+                    for _ in range(loss // 100)
+                ],
+            )
+        )
+
+    for result, expected in zip(engine.evaluate_many(snapshots), reference.evaluate_many(snapshots)):
+        for name, state in result.rule_states.items():
+            assert state.status == expected.rule_states[name].status, name
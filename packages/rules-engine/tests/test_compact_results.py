@@ -0,0 +1,114 @@
+"""
+Tests for compact evaluation results (CompactRuleEngine).
+
+Every existing rule test is re-run with an engine that also evaluates each
+snapshot through CompactRuleEngine; the materialized result must equal the
+validated one exactly.
+"""
+
+import pytest
+from decimal import Decimal
+
+from rules_engine.engine import RuleEngine
+from rules_engine.incremental import IncrementalEvaluator
+from rules_engine.interface import RuleEvaluationResult
+from rules_engine.models import RuleState
+from rules_engine.results import (
+    CompactEvaluationResult,
+    CompactRuleEngine,
+    CompactRuleState,
+)
+from tests.test_evaluate_many import _rules, _snapshot
+from tests.test_fixed_point import EXISTING_TEST_MODULES
+
+
+class CrossCheckingRuleEngine(RuleEngine):
+    """RuleEngine that checks every evaluation against CompactRuleEngine."""
+
+    def __init__(self, rules):
+        super().__init__(rules)
+        self.compact = CompactRuleEngine(rules)
+
+    def evaluate(self, snapshot):
+        result = super().evaluate(snapshot)
+        materialized = self.compact.evaluate(snapshot)
+        if materialized != result:
+            pytest.fail(f"compact result differs: {materialized} != {result}")
+        return result
+
+    def _calculate_trailing_drawdown(self, account_state):
+        state = super()._calculate_trailing_drawdown(account_state)
+        if self.compact._calculate_trailing_drawdown(account_state).to_model() != state:
+            pytest.fail("compact trailing drawdown state differs")
+        return state
+
+    def _calculate_daily_loss_limit(self, account_state):
+        state = super()._calculate_daily_loss_limit(account_state)
+        if self.compact._calculate_daily_loss_limit(account_state).to_model() != state:
+            pytest.fail("compact daily loss limit state differs")
+        return state
+
+
+def _existing_tests():
+    for module in EXISTING_TEST_MODULES:
+        module_name = module.__name__.rsplit(".", 1)[-1]
+        for name, func in vars(module).items():
+            if name.startswith("test_") and callable(func):
+                yield pytest.param(module, func, id=f"{module_name}::{name}")
+
+
+@pytest.mark.parametrize("module,test_func", list(_existing_tests()))
+def test_compact_matches_existing_tests(monkeypatch, module, test_func):
+    """Re-run an existing rule test with compact results cross-checked."""
+    monkeypatch.setattr(module, "RuleEngine", CrossCheckingRuleEngine)
+    try:
+        test_func()
+    except AssertionError:
+        # Original expectations are reported by the original test.
+        pass
+
+
+def test_evaluate_compact_defers_materialization():
+    """evaluate_compact builds slots records and materializes once on demand."""
+    engine = CompactRuleEngine(_rules())
+    snapshot = _snapshot(5)
+
+    compact = engine.evaluate_compact(snapshot)
+
+    assert isinstance(compact, CompactEvaluationResult)
+    assert all(isinstance(s, CompactRuleState) for s in compact.rule_states.values())
+    assert not hasattr(compact.rule_states["trailing_drawdown"], "__dict__")
+
+    model = compact.materialize()
+    assert isinstance(model, RuleEvaluationResult)
+    assert isinstance(model.rule_states["trailing_drawdown"], RuleState)
+    assert compact.materialize() is model
+    assert model == RuleEngine(_rules()).evaluate(snapshot)
+
+
+def test_compact_batch_and_incremental_match():
+    """evaluate_many and incremental evaluation work with compact states."""
+    engine = CompactRuleEngine(_rules())
+    reference = RuleEngine(_rules())
+    snapshots = [_snapshot(i) for i in range(20)]
+
+    assert engine.evaluate_many(snapshots) == reference.evaluate_many(snapshots)
+
+    evaluator = IncrementalEvaluator(engine)
+    for snapshot in snapshots:
+        assert evaluator.evaluate(snapshot) == reference.evaluate(snapshot)
+
+
+def test_materialized_result_serializes_like_validated():
+    """The backend's .dict() output is unchanged for materialized results."""
+    snapshot = _snapshot(12)
+    materialized = CompactRuleEngine(_rules()).evaluate(snapshot)
+    validated = RuleEngine(_rules()).evaluate(snapshot)
+
+    assert materialized.model_dump() == validated.model_dump()
+    assert materialized.max_allowed_risk["max_loss_allowed"] == validated.max_allowed_risk[
+        "max_loss_allowed"
+    ]
+    assert isinstance(
+        materialized.rule_states["trailing_drawdown"].remaining_buffer, Decimal
+    )
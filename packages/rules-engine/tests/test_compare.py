@@ -0,0 +1,91 @@
+"""
+Unit tests for multi-firm evaluation of one snapshot.
+"""
+
+from decimal import Decimal
+
+from rules_engine.compare import MultiFirmEvaluator, evaluate_across
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import FixedPointRuleEngine
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    TradingHoursRule,
+    ProfitTargetRule,
+)
+from tests.test_evaluate_many import _rules, _snapshot
+
+
+def _firm_rules():
+    trading_hours = TradingHoursRule(enabled=True, forced_close_time="16:59")
+    target = ProfitTargetRule(enabled=True, target_amount=Decimal("3000"))
+    return {
+        "five_percent": FirmRules(
+            trailing_drawdown=TrailingDrawdownRule(
+                enabled=True, max_drawdown_percent=Decimal("5")
+            ),
+            trading_hours=trading_hours,
+            profit_target=target,
+        ),
+        "four_percent_dll": FirmRules(
+            trailing_drawdown=TrailingDrawdownRule(
+                enabled=True, max_drawdown_percent=Decimal("4")
+            ),
+            daily_loss_limit=DailyLossLimitRule(
+                enabled=True, max_loss_amount=Decimal("1000"), reset_time="17:00"
+            ),
+            trading_hours=trading_hours,
+            profit_target=target,
+        ),
+        "five_percent_dll": FirmRules(
+            trailing_drawdown=TrailingDrawdownRule(
+                enabled=True, max_drawdown_percent=Decimal("5")
+            ),
+            daily_loss_limit=DailyLossLimitRule(
+                enabled=True, max_loss_amount=Decimal("1000"), reset_time="17:00"
+            ),
+            trading_hours=trading_hours,
+        ),
+        "everything": _rules(),
+    }
+
+
+def test_results_match_individual_evaluation():
+    """Each label gets exactly what its engine's evaluate() returns."""
+    engines = {label: RuleEngine(rules) for label, rules in _firm_rules().items()}
+
+    for index in (0, 7, 15):
+        snapshot = _snapshot(index)
+        results = evaluate_across(engines, snapshot)
+
+        assert list(results) == list(engines)
+        for label, engine in engines.items():
+            assert results[label] == engine.evaluate(snapshot), label
+
+
+def test_identical_rules_are_computed_once():
+    """Rules shared between rule sets are computed once per snapshot."""
+    engines = {label: RuleEngine(rules) for label, rules in _firm_rules().items()}
+    evaluator = MultiFirmEvaluator(engines)
+
+    evaluator.evaluate(_snapshot(3))
+
+    total = sum(len(engine.plan.rules) for engine in engines.values())
+    assert evaluator.computed == evaluator.distinct_rules
+    assert evaluator.computed + evaluator.shared == total
+    # 5% and 4% trailing, one DLL, trading hours, one target, plus the
+    # "everything" rule set (whose 5% trailing and 3000 target are shared)
+    assert evaluator.distinct_rules == 5 + len(engines["everything"].plan.rules) - 2
+
+
+def test_engine_classes_do_not_share_states():
+    """States are only shared between engines of the same class."""
+    rules = _firm_rules()["five_percent"]
+    engines = {"decimal": RuleEngine(rules), "fixed": FixedPointRuleEngine(rules)}
+    evaluator = MultiFirmEvaluator(engines)
+
+    results = evaluator.evaluate(_snapshot(4))
+
+    assert evaluator.shared == 0
+    assert results["fixed"] == engines["fixed"].evaluate(_snapshot(4))
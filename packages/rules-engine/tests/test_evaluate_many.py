@@ -0,0 +1,131 @@
+"""
+Unit tests for batch evaluation (RuleEngine.evaluate_many).
+
+Batch results must be identical to evaluating each snapshot on its own.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    OverallMaxLossRule,
+    MaxPositionSizeRule,
+    MAERule,
+    ConsistencyRule,
+    MinimumTradingDaysRule,
+    ProfitTargetRule,
+    RuleStatus,
+)
+
+
+def _rules() -> FirmRules:
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True,
+            max_drawdown_percent=Decimal("5"),
+            include_unrealized_pnl=True,
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True,
+            max_loss_amount=Decimal("1000"),
+            reset_time="16:00",
+        ),
+        overall_max_loss=OverallMaxLossRule(
+            enabled=True,
+            max_loss_amount=Decimal("2500"),
+        ),
+        max_position_size=MaxPositionSizeRule(enabled=True, max_contracts=10),
+        mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("2")),
+        consistency_rule=ConsistencyRule(
+            enabled=True, max_single_day_percent=Decimal("50")
+        ),
+        minimum_trading_days=MinimumTradingDaysRule(enabled=True, min_days=5),
+        profit_target=ProfitTargetRule(enabled=True, target_amount=Decimal("3000")),
+    )
+
+
+def _snapshot(index: int) -> AccountSnapshot:
+    equity = Decimal("50000") - Decimal(index * 250)
+    quantity = index % 12
+    return AccountSnapshot(
+        account_id=f"acct-{index}",
+        timestamp=datetime(2026, 1, 5, 14, 0, 0),
+        equity=equity,
+        balance=equity,
+        realized_pnl=Decimal(index * 100) - Decimal("400"),
+        unrealized_pnl=Decimal("-25"),
+        high_water_mark=Decimal("50500"),
+        daily_pnl=Decimal(-index * 90),
+        starting_balance=Decimal("50000"),
+        daily_pnl_history={
+            "2026-01-02": Decimal("300"),
+            "2026-01-05": Decimal(index * 40),
+        },
+        open_positions=[
+            PositionSnapshot(
+                symbol="ES",
+                quantity=quantity,
+                avg_price=Decimal("5000"),
+                current_price=Decimal("4999.50"),
+                unrealized_pnl=Decimal("-25"),
+                opened_at=datetime(2026, 1, 5, 13, 0, 0),
+                peak_unrealized_loss=Decimal(-index * 60),
+            )
+        ] if quantity else [],
+    )
+
+
+def test_evaluate_many_matches_evaluate():
+    """Every batch result equals the single-snapshot result for that account."""
+    engine = RuleEngine(_rules())
+    snapshots = [_snapshot(i) for i in range(20)]
+
+    batch_results = engine.evaluate_many(snapshots)
+
+    assert len(batch_results) == len(snapshots)
+    for snapshot, batch_result in zip(snapshots, batch_results):
+        assert batch_result == engine.evaluate(snapshot)
+
+
+def test_evaluate_many_preserves_order_and_rule_order():
+    """Results come back in input order with the same rule ordering as evaluate()."""
+    engine = RuleEngine(_rules())
+    snapshots = [_snapshot(i) for i in (7, 0, 3)]
+
+    batch_results = engine.evaluate_many(snapshots)
+
+    assert [r.account_id for r in batch_results] == ["acct-7", "acct-0", "acct-3"]
+    assert list(batch_results[0].rule_states) == list(
+        engine.evaluate(snapshots[0]).rule_states
+    )
+
+
+def test_evaluate_many_covers_all_statuses():
+    """The batch spans safe through violated accounts for trailing drawdown."""
+    engine = RuleEngine(_rules())
+    snapshots = [_snapshot(i) for i in range(20)]
+
+    statuses = {
+        result.rule_states["trailing_drawdown"].status
+        for result in engine.evaluate_many(snapshots)
+    }
+
+    assert statuses == {
+        RuleStatus.SAFE,
+        RuleStatus.CAUTION,
+        RuleStatus.CRITICAL,
+        RuleStatus.VIOLATED,
+    }
+
+
+def test_evaluate_many_empty_batch():
+    """An empty batch returns an empty list."""
+    engine = RuleEngine(_rules())
+
+    assert engine.evaluate_many([]) == []
@@ -0,0 +1,169 @@
+"""
+Unit tests for snapshot fingerprint memoization (EvaluationCache).
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from rules_engine.cache import EvaluationCache, snapshot_fingerprint
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import FixedPointRuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    MaxPositionSizeRule,
+    MinimumTradingDaysRule,
+    TradingHoursRule,
+)
+
+
+def _rules() -> FirmRules:
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True,
+            max_drawdown_percent=Decimal("5"),
+            include_unrealized_pnl=True,
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True,
+            max_loss_amount=Decimal("1000"),
+            reset_time="16:00",
+        ),
+        max_position_size=MaxPositionSizeRule(enabled=True, max_contracts=10),
+        minimum_trading_days=MinimumTradingDaysRule(enabled=True, min_days=5),
+    )
+
+
+def _snapshot(second: int = 0, equity: str = "50200", quantity: int = 0) -> AccountSnapshot:
+    return AccountSnapshot(
+        account_id="acct-1",
+        timestamp=datetime(2026, 1, 5, 14, 0, second),
+        equity=Decimal(equity),
+        balance=Decimal("50200"),
+        high_water_mark=Decimal("50500"),
+        daily_pnl=Decimal("-100"),
+        starting_balance=Decimal("50000"),
+        daily_pnl_history={"2026-01-02": Decimal("300")},
+        open_positions=[
+            PositionSnapshot(
+                symbol="ES",
+                quantity=quantity,
+                avg_price=Decimal("5000"),
+                current_price=Decimal("5000"),
+                unrealized_pnl=Decimal("0"),
+                opened_at=datetime(2026, 1, 5, 13, 0, 0),
+            )
+        ] if quantity else [],
+    )
+
+
+def test_repeated_snapshot_is_a_hit():
+    """An identical snapshot returns the cached result without re-evaluating."""
+    engine = RuleEngine(_rules())
+    cache = EvaluationCache()
+
+    first = cache.evaluate(engine, _snapshot(0))
+    second = cache.evaluate(engine, _snapshot(1))
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+    assert second.rule_states is first.rule_states
+    assert second.timestamp == datetime(2026, 1, 5, 14, 0, 1)
+    assert second == engine.evaluate(_snapshot(1))
+
+
+def test_changed_snapshot_is_a_miss():
+    """Changing any field a rule reads re-evaluates."""
+    engine = RuleEngine(_rules())
+    cache = EvaluationCache()
+
+    cache.evaluate(engine, _snapshot())
+    cache.evaluate(engine, _snapshot(equity="50100"))
+    result = cache.evaluate(engine, _snapshot(equity="50100", quantity=3))
+
+    assert cache.hits == 0
+    assert cache.misses == 3
+    assert result == engine.evaluate(_snapshot(equity="50100", quantity=3))
+
+
+def test_cache_is_keyed_by_plan_and_engine():
+    """Different rules or engine implementations never share a cached result."""
+    cache = EvaluationCache()
+    rules = _rules()
+    cache.evaluate(RuleEngine(rules), _snapshot())
+
+    stricter = _rules()
+    stricter.daily_loss_limit = DailyLossLimitRule(
+        enabled=True, max_loss_amount=Decimal("500"), reset_time="16:00"
+    )
+    result = cache.evaluate(RuleEngine(stricter), _snapshot())
+    cache.evaluate(FixedPointRuleEngine(stricter), _snapshot())
+
+    assert cache.misses == 3
+    assert result.rule_states["daily_loss_limit"].threshold == Decimal("500")
+
+
+def test_trading_hours_plan_is_cached_per_second():
+    """The trading-hours rule reads whole seconds, so sub-second repeats hit."""
+    rules = _rules()
+    rules.trading_hours = TradingHoursRule(enabled=True, forced_close_time="16:59")
+    engine = RuleEngine(rules)
+    cache = EvaluationCache()
+
+    cache.evaluate(engine, _snapshot(5))
+    cache.evaluate(engine, _snapshot(5).model_copy(update={
+        "timestamp": datetime(2026, 1, 5, 14, 0, 5, 300000),
+    }))
+    result = cache.evaluate(engine, _snapshot(6))
+
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+    assert result == engine.evaluate(_snapshot(6))
+
+
+def test_plan_with_undeclared_inputs_is_not_cached(monkeypatch):
+    """Plans that read outside the snapshot bypass the cache."""
+    engine = RuleEngine(_rules())
+    monkeypatch.setattr(engine, "plan", engine.plan.model_copy(update={"reads": None}))
+    cache = EvaluationCache()
+
+    cache.evaluate(engine, _snapshot())
+    cache.evaluate(engine, _snapshot())
+
+    assert snapshot_fingerprint(engine, _snapshot()) is None
+    assert cache.stats() == {"hits": 0, "misses": 2, "size": 0}
+
+
+def test_invalidate_forgets_account():
+    """invalidate() drops cached entries."""
+    engine = RuleEngine(_rules())
+    cache = EvaluationCache()
+    cache.evaluate(engine, _snapshot())
+
+    cache.invalidate("acct-1")
+    cache.evaluate(engine, _snapshot())
+
+    assert cache.misses == 2
+
+
+def test_evaluate_many_serves_unchanged_accounts_and_batches_the_rest():
+    engine = RuleEngine(_rules())
+    cache = EvaluationCache()
+    accounts = [
+        _snapshot(0, equity=str(50000 + 10 * i)).model_copy(update={"account_id": f"acct-{i}"})
+        for i in range(4)
+    ]
+    cache.evaluate_many(engine, accounts)
+
+    # Two accounts changed, two did not
+    updated = [
+        snapshot.model_copy(update={"timestamp": datetime(2026, 1, 5, 14, 0, 1)})
+        if i % 2 == 0
+        else snapshot.model_copy(update={"equity": Decimal("49000")})
+        for i, snapshot in enumerate(accounts)
+    ]
+    results = cache.evaluate_many(engine, updated)
+
+    assert cache.stats() == {"hits": 2, "misses": 6, "size": 4}
+    assert results == [engine.evaluate(snapshot) for snapshot in updated]
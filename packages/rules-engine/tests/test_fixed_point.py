@@ -0,0 +1,219 @@
+"""
+Differential tests for the integer fixed-point engine.
+
+Every existing rule test is re-run with an engine that evaluates each
+snapshot through both RuleEngine and FixedPointRuleEngine and fails on any
+divergence: statuses must be identical, values must agree within quantization.
+"""
+
+import random
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import (
+    FixedPointRuleEngine,
+    from_bps,
+    from_cents,
+    round_div,
+    to_bps,
+    to_cents,
+)
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    OverallMaxLossRule,
+    MaxPositionSizeRule,
+    MAERule,
+    ConsistencyRule,
+    MinimumTradingDaysRule,
+    ProfitTargetRule,
+)
+from tests import (
+    test_apex_trailing_drawdown,
+    test_consistency_rule,
+    test_minimum_trading_days,
+    test_position_size,
+    test_topstep_daily_loss_limit,
+    test_trailing_drawdown,
+)
+
+# One cent for money, 0.01 for percentages
+TOLERANCE = Decimal("0.01")
+
+EXISTING_TEST_MODULES = [
+    test_apex_trailing_drawdown,
+    test_consistency_rule,
+    test_minimum_trading_days,
+    test_position_size,
+    test_topstep_daily_loss_limit,
+    test_trailing_drawdown,
+]
+
+
+def assert_states_match(decimal_state, fixed_state):
+    """Fail if a fixed-point RuleState diverges from the Decimal one."""
+    name = decimal_state.rule_name
+    if fixed_state.status != decimal_state.status:
+        pytest.fail(
+            f"{name}: status {fixed_state.status} != {decimal_state.status}"
+        )
+    for field in ("current_value", "threshold", "remaining_buffer", "buffer_percent"):
+        decimal_value = getattr(decimal_state, field)
+        fixed_value = getattr(fixed_state, field)
+        if abs(decimal_value - fixed_value) > TOLERANCE:
+            pytest.fail(f"{name}.{field}: {fixed_value} != {decimal_value}")
+    for field in ("dollars", "percent"):
+        decimal_value = getattr(decimal_state.distance_to_violation, field)
+        fixed_value = getattr(fixed_state.distance_to_violation, field)
+        if (decimal_value is None) != (fixed_value is None) or (
+            decimal_value is not None and abs(decimal_value - fixed_value) > TOLERANCE
+        ):
+            pytest.fail(f"{name}.distance.{field}: {fixed_value} != {decimal_value}")
+    if (
+        fixed_state.distance_to_violation.contracts
+        != decimal_state.distance_to_violation.contracts
+    ):
+        pytest.fail(f"{name}.distance.contracts differs")
+    if len(fixed_state.warnings) != len(decimal_state.warnings):
+        pytest.fail(f"{name}: warnings {fixed_state.warnings} != {decimal_state.warnings}")
+
+
+def assert_results_match(decimal_result, fixed_result):
+    """Fail if a fixed-point evaluation diverges from the Decimal one."""
+    if list(fixed_result.rule_states) != list(decimal_result.rule_states):
+        pytest.fail("rule sets differ")
+    for name, decimal_state in decimal_result.rule_states.items():
+        assert_states_match(decimal_state, fixed_result.rule_states[name])
+    if fixed_result.overall_risk_level != decimal_result.overall_risk_level:
+        pytest.fail("overall risk level differs")
+    for key, decimal_value in decimal_result.max_allowed_risk.items():
+        if abs(fixed_result.max_allowed_risk[key] - decimal_value) > TOLERANCE:
+            pytest.fail(f"max_allowed_risk.{key} differs")
+
+
+class DifferentialRuleEngine(RuleEngine):
+    """RuleEngine that cross-checks every calculation against FixedPointRuleEngine."""
+
+    def __init__(self, rules: FirmRules):
+        super().__init__(rules)
+        self.fixed = FixedPointRuleEngine(rules)
+
+    def evaluate(self, snapshot):
+        result = super().evaluate(snapshot)
+        assert_results_match(result, self.fixed.evaluate(snapshot))
+        return result
+
+    def _calculate_trailing_drawdown(self, account_state):
+        state = super()._calculate_trailing_drawdown(account_state)
+        assert_states_match(state, self.fixed._calculate_trailing_drawdown(account_state))
+        return state
+
+    def _calculate_daily_loss_limit(self, account_state):
+        state = super()._calculate_daily_loss_limit(account_state)
+        assert_states_match(state, self.fixed._calculate_daily_loss_limit(account_state))
+        return state
+
+
+def _existing_tests():
+    for module in EXISTING_TEST_MODULES:
+        module_name = module.__name__.rsplit(".", 1)[-1]
+        for name, func in vars(module).items():
+            if name.startswith("test_") and callable(func):
+                yield pytest.param(module, func, id=f"{module_name}::{name}")
+
+
+@pytest.mark.parametrize("module,test_func", list(_existing_tests()))
+def test_fixed_point_matches_existing_tests(monkeypatch, module, test_func):
+    """Re-run an existing rule test with both engines cross-checking each other."""
+    monkeypatch.setattr(module, "RuleEngine", DifferentialRuleEngine)
+    try:
+        test_func()
+    except AssertionError:
+        # The original expectation failing is reported by the original test;
+        # this test only fails when the two engines disagree (pytest.fail).
+        pass
+
+
+def _random_snapshot(rng: random.Random, index: int) -> AccountSnapshot:
+    def cents(low: int, high: int) -> Decimal:
+        return Decimal(rng.randint(low, high)) / Decimal("100")
+
+    starting_balance = Decimal(rng.choice([25000, 50000, 100000, 150000]))
+    equity = starting_balance + cents(-800000, 600000)
+    unrealized = cents(-150000, 50000)
+    return AccountSnapshot(
+        account_id=f"random-{index}",
+        timestamp=datetime(2026, 1, 5, 12, 0, 0),
+        equity=equity,
+        balance=equity - unrealized,
+        realized_pnl=cents(-300000, 900000),
+        unrealized_pnl=unrealized,
+        high_water_mark=max(equity, starting_balance) + cents(0, 400000),
+        daily_pnl=cents(-300000, 100000),
+        starting_balance=starting_balance,
+        daily_pnl_history={
+            f"2026-01-{day:02d}": cents(-200000, 400000)
+            for day in range(1, rng.randint(1, 20))
+        },
+        open_positions=[
+            PositionSnapshot(
+                symbol="NQ",
+                quantity=rng.randint(-8, 8),
+                avg_price=Decimal("18000"),
+                current_price=Decimal("17990"),
+                unrealized_pnl=unrealized,
+                opened_at=datetime(2026, 1, 5, 11, 0, 0),
+                peak_unrealized_loss=cents(-400000, 0),
+            )
+            for _ in range(rng.randint(0, 3))
+        ],
+    )
+
+
+def test_fixed_point_matches_decimal_on_random_snapshots():
+    """Randomized cent-valued snapshots produce matching results under all money rules."""
+    rules = FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True, max_drawdown_percent=Decimal("4.5"), include_unrealized_pnl=True
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True, max_loss_amount=Decimal("1250.50"), reset_time="16:00"
+        ),
+        overall_max_loss=OverallMaxLossRule(enabled=True, max_loss_amount=Decimal("3000")),
+        max_position_size=MaxPositionSizeRule(enabled=True, max_contracts=15),
+        mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("3")),
+        consistency_rule=ConsistencyRule(enabled=True, max_single_day_percent=Decimal("30")),
+        minimum_trading_days=MinimumTradingDaysRule(
+            enabled=True, min_days=7, min_profit_per_day=Decimal("50")
+        ),
+        profit_target=ProfitTargetRule(enabled=True, target_amount=Decimal("3000")),
+    )
+    decimal_engine = RuleEngine(rules)
+    fixed_engine = FixedPointRuleEngine(rules)
+    rng = random.Random(1234)
+
+    snapshots = [_random_snapshot(rng, i) for i in range(500)]
+
+    for snapshot in snapshots:
+        assert_results_match(
+            decimal_engine.evaluate(snapshot), fixed_engine.evaluate(snapshot)
+        )
+    for decimal_result, fixed_result in zip(
+        decimal_engine.evaluate_many(snapshots), fixed_engine.evaluate_many(snapshots)
+    ):
+        assert_results_match(decimal_result, fixed_result)
+
+
+def test_cent_and_basis_point_conversions():
+    """Conversions quantize half-up and round-trip cent/bps values exactly."""
+    assert to_cents(Decimal("1234.565")) == 123457
+    assert to_cents(Decimal("-0.004")) == 0
+    assert from_cents(123457) == Decimal("1234.57")
+    assert to_bps(Decimal("4.5")) == 450
+    assert from_bps(450) == Decimal("4.5")
+    assert round_div(5, 2) == 3
+    assert round_div(-5, 2) == -2
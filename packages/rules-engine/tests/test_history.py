@@ -0,0 +1,159 @@
+"""
+Unit tests for the compact daily PnL history (DailyPnlHistory).
+"""
+
+import pickle
+import pytest
+from decimal import Decimal
+from datetime import date
+
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import FixedPointRuleEngine
+from pydantic import TypeAdapter, ValidationError
+
+from rules_engine.history import DailyPnlHistory
+from rules_engine.incremental import IncrementalEvaluator
+from rules_engine.interface import AccountSnapshot
+from tests.test_evaluate_many import _rules, _snapshot
+
+
+HISTORY = {
+    "2026-01-05": Decimal("250.50"),
+    "2026-01-02": Decimal("-120"),
+    "2026-01-06": Decimal("75.25"),
+}
+
+
+def test_dict_form_converts_sorted_and_reads_like_a_dict():
+    """The dict form converts in any order and reads back as the same mapping."""
+    history = DailyPnlHistory.from_mapping(HISTORY)
+
+    assert list(history) == ["2026-01-02", "2026-01-05", "2026-01-06"]
+    assert history == HISTORY
+    assert HISTORY == history
+    assert history["2026-01-05"] == Decimal("250.50")
+    assert "2026-01-03" not in history
+    assert max(history.values()) == Decimal("250.50")
+    assert history.last == ("2026-01-06", Decimal("75.25"))
+    with pytest.raises(KeyError):
+        history["2026-01-03"]
+
+
+def test_append_update_last_and_set_day():
+    """Appends must move forward; earlier days are updated or inserted in order."""
+    history = DailyPnlHistory()
+    history.append("2026-01-02", 100)
+    history.append(date(2026, 1, 5), "40.10")
+    history.update_last(Decimal("55.555"))
+
+    assert history["2026-01-05"] == Decimal("55.56")
+    with pytest.raises(ValueError):
+        history.append("2026-01-05", 1)
+
+    history.set_day("2026-01-03", -20.5)
+    history["2026-01-02"] = 90
+    history.set_day("2026-01-07", 10)
+
+    assert history.to_dict() == {
+        "2026-01-02": Decimal("90"),
+        "2026-01-03": Decimal("-20.5"),
+        "2026-01-05": Decimal("55.56"),
+        "2026-01-07": Decimal("10"),
+    }
+
+
+def test_slice_by_range():
+    """slice() keeps days with start <= day < end."""
+    history = DailyPnlHistory.from_mapping(HISTORY)
+
+    assert list(history.slice("2026-01-03", "2026-01-06")) == ["2026-01-05"]
+    assert list(history.slice(start="2026-01-05")) == ["2026-01-05", "2026-01-06"]
+    assert list(history.slice(end="2026-01-01")) == []
+
+
+def test_snapshot_accepts_history_and_dict_form():
+    """Snapshots keep a given history as-is and dicts as dicts; serialization is the dict form."""
+    history = DailyPnlHistory.from_mapping(HISTORY)
+    snapshot = _snapshot(3).model_copy(update={"daily_pnl_history": None})
+
+    direct = AccountSnapshot(**{**snapshot.model_dump(), "daily_pnl_history": history})
+    converted = AccountSnapshot(**{**snapshot.model_dump(), "daily_pnl_history": HISTORY})
+
+    assert direct.daily_pnl_history is history
+    assert type(converted.daily_pnl_history) is dict
+    assert converted.daily_pnl_history == HISTORY
+    assert direct == converted
+    assert direct.model_dump()["daily_pnl_history"] == HISTORY
+    assert AccountSnapshot.model_validate_json(direct.model_dump_json()) == direct
+    assert pickle.loads(pickle.dumps(history)) == history
+
+
+def test_snapshot_keeps_sub_cent_dict_amounts():
+    """Dict histories are not rounded to cents; a DailyPnlHistory is (half-up)."""
+    snapshot = _snapshot(3).model_copy(update={"daily_pnl_history": None})
+    exact = {"2026-01-05": Decimal("100.005")}
+
+    validated = AccountSnapshot(**{**snapshot.model_dump(), "daily_pnl_history": exact})
+
+    assert validated.daily_pnl_history["2026-01-05"] == Decimal("100.005")
+    assert DailyPnlHistory.from_mapping(exact)["2026-01-05"] == Decimal("100.01")
+
+
+@pytest.mark.parametrize(
+    "history",
+    [
+        {"2026-01-05": "abc"},
+        {"2026-01-05": None},
+        {"2026-01-05": float("nan")},
+        {"2026-01-05": Decimal("Infinity")},
+        {"2026-01-05": "-inf"},
+        {"2026-13-01": Decimal("10")},
+        {"yesterday": Decimal("10")},
+        {None: Decimal("10")},
+    ],
+)
+def test_invalid_history_raises_value_error(history):
+    """Bad amounts and dates raise ValueError, so pydantic reports a ValidationError."""
+    with pytest.raises(ValueError):
+        DailyPnlHistory.from_mapping(history)
+
+    adapter = TypeAdapter(DailyPnlHistory)
+    with pytest.raises(ValidationError):
+        adapter.validate_python(history)
+
+
+def test_invalid_history_updates_raise_value_error():
+    history = DailyPnlHistory.from_mapping(HISTORY)
+
+    with pytest.raises(ValueError):
+        history.append("2026-02-01", "abc")
+    with pytest.raises(ValueError):
+        history.update_last(None)
+    with pytest.raises(ValueError):
+        history.set_day("not-a-date", Decimal("1"))
+    assert history == HISTORY
+
+
+@pytest.mark.parametrize("engine_class", [RuleEngine, FixedPointRuleEngine])
+def test_engines_evaluate_history_like_dict(engine_class):
+    """Consistency and minimum trading days give the same states for both forms."""
+    engine = engine_class(_rules())
+    for index in range(0, 20, 3):
+        snapshot = _snapshot(index)
+        history = DailyPnlHistory.from_mapping(snapshot.daily_pnl_history)
+        expected = engine.evaluate(snapshot)
+
+        assert engine.evaluate(snapshot.model_copy(update={"daily_pnl_history": history})) == expected
+
+
+def test_incremental_detects_history_updates():
+    """Updating today's PnL in place is picked up by the incremental evaluator."""
+    engine = RuleEngine(_rules())
+    evaluator = IncrementalEvaluator(engine)
+    snapshot = _snapshot(4)
+    snapshot.daily_pnl_history = DailyPnlHistory.from_mapping(snapshot.daily_pnl_history)
+    evaluator.evaluate(snapshot)
+
+    snapshot.daily_pnl_history.update_last(Decimal("1500"))
+
+    assert evaluator.evaluate(snapshot) == engine.evaluate(snapshot)
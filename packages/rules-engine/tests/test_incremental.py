@@ -0,0 +1,146 @@
+"""
+Unit tests for incremental evaluation (IncrementalEvaluator).
+
+Incremental results must be identical to full evaluation, while rules whose
+inputs did not change are not recomputed.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import FixedPointRuleEngine
+from rules_engine.incremental import IncrementalEvaluator
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    OverallMaxLossRule,
+    MaxPositionSizeRule,
+    MAERule,
+    ConsistencyRule,
+    MinimumTradingDaysRule,
+    ProfitTargetRule,
+)
+
+
+def _rules() -> FirmRules:
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True,
+            max_drawdown_percent=Decimal("5"),
+            include_unrealized_pnl=True,
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True,
+            max_loss_amount=Decimal("1000"),
+            reset_time="16:00",
+        ),
+        overall_max_loss=OverallMaxLossRule(
+            enabled=True,
+            max_loss_amount=Decimal("2500"),
+        ),
+        max_position_size=MaxPositionSizeRule(enabled=True, max_contracts=10),
+        mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("2")),
+        consistency_rule=ConsistencyRule(
+            enabled=True, max_single_day_percent=Decimal("50")
+        ),
+        minimum_trading_days=MinimumTradingDaysRule(enabled=True, min_days=5),
+        profit_target=ProfitTargetRule(enabled=True, target_amount=Decimal("3000")),
+    )
+
+
+def _tick(price_move: int, quantity: int = 2, realized: int = 400) -> AccountSnapshot:
+    """A tick where only the open position's price (and so equity) moves."""
+    unrealized = Decimal(price_move * 50)
+    return AccountSnapshot(
+        account_id="acct-1",
+        timestamp=datetime(2026, 1, 5, 14, 0, price_move % 60),
+        equity=Decimal("50400") + unrealized,
+        balance=Decimal("50400"),
+        realized_pnl=Decimal(realized),
+        unrealized_pnl=unrealized,
+        high_water_mark=Decimal("50600"),
+        daily_pnl=Decimal("150"),
+        starting_balance=Decimal("50000"),
+        daily_pnl_history={"2026-01-02": Decimal("250"), "2026-01-05": Decimal("150")},
+        open_positions=[
+            PositionSnapshot(
+                symbol="ES",
+                quantity=quantity,
+                avg_price=Decimal("5000"),
+                current_price=Decimal("5000") + Decimal(price_move),
+                unrealized_pnl=unrealized,
+                opened_at=datetime(2026, 1, 5, 13, 0, 0),
+                peak_unrealized_loss=Decimal("-300"),
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize("engine_class", [RuleEngine, FixedPointRuleEngine])
+def test_incremental_matches_full_evaluation(engine_class):
+    """Every incremental result equals engine.evaluate() for the same tick."""
+    engine = engine_class(_rules())
+    evaluator = IncrementalEvaluator(engine)
+    ticks = [_tick(move) for move in (0, -2, -2, 3, -8, -8)]
+    ticks.append(_tick(-8, quantity=5))
+    ticks.append(_tick(-8, quantity=5, realized=900))
+
+    for tick in ticks:
+        assert evaluator.evaluate(tick) == engine.evaluate(tick)
+
+
+def test_incremental_skips_rules_with_unchanged_inputs():
+    """Equity-only ticks recompute fewer than half of the rules."""
+    evaluator = IncrementalEvaluator(RuleEngine(_rules()))
+    rule_count = len(evaluator.engine.plan.rules)
+
+    evaluator.evaluate(_tick(0))
+    assert evaluator.recomputed == rule_count
+
+    evaluator.evaluate(_tick(-3))
+    # trailing drawdown, overall max loss and profit target read equity/unrealized
+    assert evaluator.recomputed == rule_count + 3
+    assert evaluator.reused == rule_count - 3
+
+    evaluator.evaluate(_tick(-3))
+    assert evaluator.recomputed == rule_count + 3
+
+
+def test_incremental_recomputes_on_position_change():
+    """Changing a position quantity recomputes the position size rule."""
+    evaluator = IncrementalEvaluator(RuleEngine(_rules()))
+    evaluator.evaluate(_tick(0, quantity=2))
+
+    result = evaluator.evaluate(_tick(0, quantity=9))
+
+    assert result.rule_states["max_position_size"].current_value == Decimal("9")
+
+
+def test_incremental_detects_in_place_history_mutation():
+    """Mutating the same daily_pnl_history dict between ticks is detected."""
+    engine = RuleEngine(_rules())
+    evaluator = IncrementalEvaluator(engine)
+    snapshot = _tick(0)
+    evaluator.evaluate(snapshot)
+
+    snapshot.daily_pnl_history["2026-01-06"] = Decimal("900")
+
+    assert evaluator.evaluate(snapshot) == engine.evaluate(snapshot)
+
+
+def test_incremental_rebinds_when_rules_change():
+    """Reassigning engine.rules discards cached states."""
+    engine = RuleEngine(_rules())
+    evaluator = IncrementalEvaluator(engine)
+    evaluator.evaluate(_tick(0, quantity=6))
+
+    rules = _rules()
+    rules.max_position_size = MaxPositionSizeRule(enabled=True, max_contracts=5)
+    engine.rules = rules
+
+    result = evaluator.evaluate(_tick(0, quantity=6))
+    assert result.rule_states["max_position_size"].threshold == Decimal("5")
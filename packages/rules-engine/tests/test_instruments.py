@@ -0,0 +1,166 @@
+"""
+Unit tests for the instrument registry and closed-form violation prices.
+
+The price returned for each rule must violate it when the position is moved
+there, and the tick before it must not.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from rules_engine.engine import RuleEngine
+from rules_engine.instruments import get_instrument, violation_prices
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    MAERule,
+    RuleStatus,
+)
+
+
+def _rules(include_unrealized: bool = True) -> FirmRules:
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True,
+            max_drawdown_percent=Decimal("4"),
+            include_unrealized_pnl=include_unrealized,
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True, max_loss_amount=Decimal("1000"), reset_time="16:00"
+        ),
+        mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("2")),
+    )
+
+
+def _snapshot(symbol: str, quantity: int, price: Decimal) -> AccountSnapshot:
+    return AccountSnapshot(
+        account_id="acct-1",
+        timestamp=datetime(2026, 1, 5, 14, 0, 0),
+        equity=Decimal("50150"),
+        balance=Decimal("50300"),
+        realized_pnl=Decimal("300"),
+        unrealized_pnl=Decimal("-150"),
+        high_water_mark=Decimal("50600"),
+        daily_pnl=Decimal("-150"),
+        starting_balance=Decimal("50000"),
+        open_positions=[
+            PositionSnapshot(
+                symbol=symbol,
+                quantity=quantity,
+                avg_price=price,
+                current_price=price,
+                unrealized_pnl=Decimal("-150"),
+                opened_at=datetime(2026, 1, 5, 13, 0, 0),
+                peak_unrealized_loss=Decimal("-300"),
+            )
+        ],
+    )
+
+
+def _moved(
+    snapshot: AccountSnapshot, price: Decimal, daily_pnl_moves: bool = False
+) -> AccountSnapshot:
+    """The snapshot after its single position trades at price."""
+    position = snapshot.open_positions[0]
+    spec = get_instrument(position.symbol)
+    change = (price - position.current_price) * spec.point_value * position.quantity
+    unrealized = position.unrealized_pnl + change
+    moved = position.model_copy(
+        update={
+            "current_price": price,
+            "unrealized_pnl": unrealized,
+            "peak_unrealized_loss": min(position.peak_unrealized_loss, unrealized),
+        }
+    )
+    return snapshot.model_copy(
+        update={
+            "equity": snapshot.equity + change,
+            "unrealized_pnl": snapshot.unrealized_pnl + change,
+            "daily_pnl": snapshot.daily_pnl + (change if daily_pnl_moves else 0),
+            "open_positions": [moved],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "symbol,root",
+    [("ES", "ES"), ("ESH6", "ES"), ("ES 03-26", "ES"), ("mnqz25", "MNQ"), ("M2KU6", "M2K")],
+)
+def test_symbol_lookup(symbol, root):
+    """Roots, contract codes and platform names resolve to the same spec."""
+    assert get_instrument(symbol).root == root
+
+
+def test_unknown_symbol_and_tick_value():
+    """Unknown symbols return None; tick value is tick size times point value."""
+    assert get_instrument("XYZ") is None
+    assert get_instrument("ES").tick_value == Decimal("12.50")
+    assert get_instrument("MNQ").tick_value == Decimal("0.50")
+
+
+@pytest.mark.parametrize(
+    "symbol,quantity,price",
+    [
+        ("ES", 2, Decimal("5000")),
+        ("NQ", -1, Decimal("18000")),
+        ("MES", 5, Decimal("5000.25")),
+        ("CL", -3, Decimal("72.15")),
+        ("YM", 1, Decimal("39000")),
+    ],
+)
+@pytest.mark.parametrize("daily_pnl_moves", [False, True])
+def test_violation_price_is_first_violating_tick(symbol, quantity, price, daily_pnl_moves):
+    """Each rule is violated at its price and not one tick earlier."""
+    engine = RuleEngine(_rules())
+    snapshot = _snapshot(symbol, quantity, price)
+    tick = get_instrument(symbol).tick_size
+    toward_safety = tick if quantity > 0 else -tick
+
+    (levels,) = violation_prices(engine, snapshot, daily_pnl_includes_unrealized=daily_pnl_moves)
+
+    expected = {"trailing_drawdown", "mae"} | ({"daily_loss_limit"} if daily_pnl_moves else set())
+    assert set(levels.prices) == expected
+    for rule_name, level in levels.prices.items():
+        assert levels.ticks[rule_name] == abs(level - price) / tick
+        at_level = engine.evaluate(_moved(snapshot, level, daily_pnl_moves))
+        before = engine.evaluate(_moved(snapshot, level + toward_safety, daily_pnl_moves))
+        assert at_level.rule_states[rule_name].status == RuleStatus.VIOLATED, rule_name
+        assert before.rule_states[rule_name].status != RuleStatus.VIOLATED, rule_name
+
+
+def test_realized_daily_loss_limit_has_no_price_level():
+    """By default daily PnL is realized-only, as in evaluate(): no DLL price level."""
+    engine = RuleEngine(_rules())
+    snapshot = _snapshot("ES", 1, Decimal("5000"))
+
+    (levels,) = violation_prices(engine, snapshot)
+
+    assert "daily_loss_limit" not in levels.prices
+    far = engine.evaluate(_moved(snapshot, Decimal("4000")))
+    assert far.rule_states["daily_loss_limit"].status == RuleStatus.SAFE
+
+
+def test_violated_rule_is_at_current_price():
+    """A rule already violated reports the current price and zero ticks."""
+    engine = RuleEngine(_rules())
+    snapshot = _snapshot("ES", 1, Decimal("5000")).model_copy(
+        update={"daily_pnl": Decimal("-1200")}
+    )
+
+    (levels,) = violation_prices(engine, snapshot, daily_pnl_includes_unrealized=True)
+
+    assert levels.prices["daily_loss_limit"] == Decimal("5000")
+    assert levels.ticks["daily_loss_limit"] == 0
+
+
+def test_balance_based_trailing_and_unknown_instruments_are_skipped():
+    """Trailing drawdown on balance has no price level; unknown symbols are skipped."""
+    engine = RuleEngine(_rules(include_unrealized=False))
+
+    (levels,) = violation_prices(engine, _snapshot("ES", 1, Decimal("5000")))
+
+    assert "trailing_drawdown" not in levels.prices
+    assert violation_prices(engine, _snapshot("XYZ", 1, Decimal("10"))) == []
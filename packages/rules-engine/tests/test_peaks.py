@@ -0,0 +1,118 @@
+"""
+Unit tests for server-side per-position peak loss tracking (PeakLossTracker).
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import FirmRules, MAERule
+from rules_engine.peaks import PeakLossTracker
+
+OPENED = datetime(2026, 1, 6, 14, 30, tzinfo=timezone.utc)
+
+
+def _position(unrealized: str, symbol: str = "ES", reported_peak: str = "0") -> PositionSnapshot:
+    return PositionSnapshot(
+        symbol=symbol,
+        quantity=1,
+        avg_price=Decimal("5000"),
+        current_price=Decimal("5000") + Decimal(unrealized) / 50,
+        unrealized_pnl=Decimal(unrealized),
+        opened_at=OPENED,
+        peak_unrealized_loss=Decimal(reported_peak),
+    )
+
+
+def _snapshot(*positions: PositionSnapshot, account_id: str = "acc") -> AccountSnapshot:
+    unrealized = sum((p.unrealized_pnl for p in positions), Decimal("0"))
+    return AccountSnapshot(
+        account_id=account_id,
+        timestamp=OPENED,
+        equity=Decimal("50000") + unrealized,
+        balance=Decimal("50000"),
+        realized_pnl=Decimal("0"),
+        unrealized_pnl=unrealized,
+        high_water_mark=Decimal("50000"),
+        daily_pnl=unrealized,
+        starting_balance=Decimal("50000"),
+        open_positions=list(positions),
+    )
+
+
+def test_tracks_worst_unrealized_loss_across_updates():
+    """The peak is the worst unrealized PnL seen, even after the trade recovers."""
+    tracker = PeakLossTracker()
+
+    peaks = [
+        tracker.update(_snapshot(_position(pnl))).open_positions[0].peak_unrealized_loss
+        for pnl in ("-100", "-900", "-300", "250")
+    ]
+
+    assert peaks == [Decimal("-100"), Decimal("-900"), Decimal("-900"), Decimal("-900")]
+
+
+def test_source_reported_peak_survives_dropped_updates():
+    """A deeper peak reported by the source is kept; a shallower one is overridden."""
+    tracker = PeakLossTracker()
+    tracker.update(_snapshot(_position("-400")))
+
+    deeper = tracker.update(_snapshot(_position("-50", reported_peak="-1200")))
+    shallower = tracker.update(_snapshot(_position("-50", reported_peak="-10")))
+
+    assert deeper.open_positions[0].peak_unrealized_loss == Decimal("-1200")
+    assert shallower.open_positions[0].peak_unrealized_loss == Decimal("-1200")
+
+
+def test_snapshot_returned_unchanged_when_peak_already_known():
+    tracker = PeakLossTracker()
+    snapshot = _snapshot(_position("-100", reported_peak="-100"))
+
+    assert tracker.update(snapshot) is snapshot
+
+
+def test_closed_positions_and_forgotten_accounts_are_dropped():
+    tracker = PeakLossTracker()
+    tracker.update(_snapshot(_position("-500"), _position("-200", symbol="NQ")))
+    tracker.update(_snapshot(_position("-100"), account_id="other"))
+    assert len(tracker) == 3
+
+    tracker.update(_snapshot(_position("-50", symbol="NQ")))
+    assert len(tracker) == 2
+    # A reopened position with the same key starts fresh
+    reopened = tracker.update(_snapshot(_position("-50")))
+    assert reopened.open_positions[0].peak_unrealized_loss == Decimal("-50")
+
+    tracker.forget("other")
+    assert len(tracker) == 1
+
+
+def test_dump_and_load_round_trip_through_json():
+    tracker = PeakLossTracker()
+    tracker.update(_snapshot(_position("-700"), _position("-300", symbol="NQ")))
+
+    restored = PeakLossTracker()
+    restored.load(json.loads(json.dumps(tracker.dump())))
+    snapshot = restored.update(_snapshot(_position("-10")))
+
+    assert snapshot.open_positions[0].peak_unrealized_loss == Decimal("-700")
+    # NQ was not in the new snapshot, so it is treated as closed
+    assert len(restored) == 1
+
+
+def test_mae_rule_sees_tracked_peak():
+    """MAE is violated by a past excursion even though the position has recovered."""
+    engine = RuleEngine(
+        FirmRules(mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("2")))
+    )
+    tracker = PeakLossTracker()
+    tracker.update(_snapshot(_position("-1100")))
+
+    recovered = _snapshot(_position("-100"))
+    untracked = engine.evaluate(recovered)
+    tracked = engine.evaluate(tracker.update(recovered))
+
+    assert untracked.rule_states["mae"].status != "violated"
+    assert tracked.rule_states["mae"].status == "violated"
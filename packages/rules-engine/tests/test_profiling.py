@@ -0,0 +1,75 @@
+"""
+Unit tests for opt-in per-rule profiling (RuleEngine.enable_profiling).
+"""
+
+from rules_engine.compare import MultiFirmEvaluator
+from rules_engine.engine import RuleEngine
+from rules_engine.profiling import RuleProfiler
+from rules_engine.results import CompactRuleEngine
+from tests.test_evaluate_many import _rules, _snapshot
+
+
+def test_profiling_counts_every_rule_and_aggregation_step():
+    engine = RuleEngine(_rules())
+    profiler = engine.enable_profiling()
+
+    for index in range(3):
+        engine.evaluate(_snapshot(index))
+    timings = profiler.snapshot()
+
+    for compiled in engine.plan.rules:
+        assert timings[compiled.method].calls == 3
+    assert timings["get_max_allowed_risk"].calls == 3
+    assert timings["_calculate_overall_risk_level"].calls == 3
+    for timing in timings.values():
+        assert 0 <= timing.max_ms <= timing.total_ms
+        assert timing.mean_ms <= timing.max_ms
+
+
+def test_profiled_results_are_unchanged():
+    plain = RuleEngine(_rules())
+    profiled = RuleEngine(_rules())
+    profiled.enable_profiling()
+    snapshots = [_snapshot(i) for i in range(10)]
+
+    assert profiled.evaluate_many(snapshots) == plain.evaluate_many(snapshots)
+    assert [profiled.evaluate(s) for s in snapshots] == [plain.evaluate(s) for s in snapshots]
+
+
+def test_batch_and_multi_firm_paths_are_profiled():
+    profiler = RuleProfiler()
+    engine = CompactRuleEngine(_rules())
+    engine.enable_profiling(profiler)
+
+    engine.evaluate_many([_snapshot(i) for i in range(4)])
+    MultiFirmEvaluator({"a": engine}).evaluate(_snapshot(1))
+    timings = profiler.snapshot()
+
+    assert timings["_calculate_mae_many"].calls >= 1
+    assert timings["get_max_allowed_risk"].calls == 5
+
+
+def test_shared_profiler_aggregates_engines_and_resets():
+    profiler = RuleProfiler()
+    first, second = RuleEngine(_rules()), RuleEngine(_rules())
+    first.enable_profiling(profiler)
+    second.enable_profiling(profiler)
+
+    first.evaluate(_snapshot(0))
+    second.evaluate(_snapshot(1))
+    assert profiler.snapshot()["get_max_allowed_risk"].calls == 2
+
+    profiler.reset()
+    assert profiler.snapshot() == {}
+
+
+def test_disable_profiling_restores_plain_methods():
+    engine = RuleEngine(_rules())
+    profiler = engine.enable_profiling()
+    engine.disable_profiling()
+
+    engine.evaluate(_snapshot(0))
+
+    assert engine.profiler is None
+    assert profiler.snapshot() == {}
+    assert "_calculate_mae" not in vars(engine)
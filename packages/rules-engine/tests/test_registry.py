@@ -0,0 +1,144 @@
+"""
+Unit tests for the rule registry (registered plugin rules and required inputs).
+"""
+
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+
+from rules_engine.compare import MultiFirmEvaluator
+from rules_engine.engine import RuleEngine
+from rules_engine.incremental import IncrementalEvaluator
+from rules_engine.models import (
+    ConsistencyRule,
+    FirmRules,
+    MinimumTradingDaysRule,
+    RuleState,
+    RuleStatus,
+)
+from rules_engine.plan import compile_rules
+from rules_engine.registry import RuleSpec, register_rule, registered_rules, unregister_rule
+from tests.test_evaluate_many import _rules, _snapshot
+
+
+class MaxOpenSymbolsRule(BaseModel):
+    enabled: bool = True
+    max_symbols: int
+
+
+def evaluate_max_open_symbols(engine, compiled, snapshot) -> RuleState:
+    evaluate_max_open_symbols.calls += 1
+    symbols = len({position.symbol for position in snapshot.open_positions})
+    limit = compiled.rule.max_symbols
+    return engine.rule_state_class(
+        rule_name="max_open_symbols",
+        current_value=Decimal(symbols),
+        threshold=Decimal(limit),
+        remaining_buffer=Decimal(limit - symbols),
+        buffer_percent=Decimal(100 * (limit - symbols) / limit),
+        status=RuleStatus.VIOLATED if symbols > limit else RuleStatus.SAFE,
+        distance_to_violation=engine.distance_class(contracts=limit - symbols),
+    )
+
+
+evaluate_max_open_symbols.calls = 0
+
+
+@pytest.fixture
+def plugin():
+    spec = register_rule(
+        RuleSpec(
+            name="max_open_symbols",
+            config_model=MaxOpenSymbolsRule,
+            reads=("open_positions.symbol",),
+            requires=("open_positions",),
+            evaluator=evaluate_max_open_symbols,
+        )
+    )
+    evaluate_max_open_symbols.calls = 0
+    yield spec
+    unregister_rule(spec.name)
+
+
+def _with_plugin(max_symbols: int = 1) -> FirmRules:
+    rules = _rules()
+    rules.custom_rules = {"max_open_symbols": {"max_symbols": max_symbols}}
+    return rules
+
+
+def test_builtin_rules_are_registered_in_evaluation_order():
+    assert [spec.name for spec in registered_rules()][:9] == [
+        "trailing_drawdown",
+        "daily_loss_limit",
+        "overall_max_loss",
+        "max_position_size",
+        "mae",
+        "consistency",
+        "trading_hours",
+        "minimum_trading_days",
+        "profit_target",
+    ]
+
+
+def test_plugin_rule_is_evaluated_from_custom_rules(plugin):
+    engine = RuleEngine(_with_plugin(max_symbols=1))
+    snapshot = _snapshot(5)
+
+    result = engine.evaluate(snapshot)
+
+    state = result.rule_states["max_open_symbols"]
+    assert state.current_value == Decimal(len({p.symbol for p in snapshot.open_positions}))
+    assert engine.plan.get("max_open_symbols").rule == MaxOpenSymbolsRule(max_symbols=1)
+    assert engine.evaluate_many([snapshot]) == [result]
+    assert IncrementalEvaluator(engine).evaluate(snapshot) == result
+    assert MultiFirmEvaluator({"a": engine}).evaluate(snapshot)["a"] == result
+
+
+def test_plugin_without_placeholder_is_left_out_when_inputs_missing(plugin):
+    engine = RuleEngine(_with_plugin())
+    flat = _snapshot(0).model_copy(update={"open_positions": []})
+
+    result = engine.evaluate(flat)
+
+    assert "max_open_symbols" not in result.rule_states
+    assert evaluate_max_open_symbols.calls == 0
+    assert engine.evaluate_many([flat]) == [result]
+
+
+def test_plugin_rules_only_affect_firms_that_configure_them(plugin):
+    assert "max_open_symbols" not in compile_rules(_rules()).by_name
+    assert len(compile_rules(_with_plugin()).rules) == len(compile_rules(_rules()).rules) + 1
+
+
+def test_unknown_or_duplicate_rules_are_rejected(plugin):
+    rules = _rules()
+    rules.custom_rules = {"not_registered": {}}
+    with pytest.raises(ValueError):
+        compile_rules(rules)
+    with pytest.raises(ValueError):
+        register_rule(plugin)
+
+
+def test_history_rules_skip_evaluation_without_history():
+    """Consistency and minimum trading days use their placeholder without being evaluated."""
+    rules = FirmRules(
+        consistency_rule=ConsistencyRule(enabled=True, max_single_day_percent=Decimal("40")),
+        minimum_trading_days=MinimumTradingDaysRule(enabled=True, min_days=5),
+    )
+    engine = RuleEngine(rules)
+    profiler = engine.enable_profiling()
+    snapshot = _snapshot(1).model_copy(update={"daily_pnl_history": None})
+
+    first = engine.evaluate(snapshot)
+    second = engine.evaluate(snapshot)
+
+    assert first == second
+    assert first.rule_states["consistency"].warnings == [
+        "Daily PnL history required for consistency rule calculation"
+    ]
+    assert first.rule_states["minimum_trading_days"].status == RuleStatus.CAUTION
+    assert "_calculate_consistency" not in profiler.snapshot()
+    assert "_calculate_minimum_trading_days" not in profiler.snapshot()
+    # Called directly, the calculators still return the same placeholder
+    assert engine._calculate_consistency(snapshot) == first.rule_states["consistency"]
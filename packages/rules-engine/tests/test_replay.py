@@ -0,0 +1,169 @@
+"""
+Unit tests for snapshot replay (ReplayRunner).
+"""
+
+import io
+import pytest
+from decimal import Decimal
+from datetime import datetime, timedelta
+
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    TradingHoursRule,
+    RuleStatus,
+)
+from rules_engine.replay import (
+    ReplayRunner,
+    read_ndjson,
+    snapshot_from_row,
+    write_ndjson,
+)
+
+
+def _rules() -> FirmRules:
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True, max_drawdown_percent=Decimal("4"), include_unrealized_pnl=True
+        ),
+        trading_hours=TradingHoursRule(
+            enabled=True, forced_close_time="16:00", timezone="America/New_York"
+        ),
+    )
+
+
+def _stream(count: int = 400, account_id: str = "acct-1"):
+    """Ticks 9 s apart from 15:20 ET, equity falling $10 per tick, one open position."""
+    start = datetime(2026, 1, 5, 20, 20, 0)  # 15:20 America/New_York
+    position = PositionSnapshot(
+        symbol="ES",
+        quantity=1,
+        avg_price=Decimal("5000"),
+        current_price=Decimal("5000"),
+        unrealized_pnl=Decimal("0"),
+        opened_at=start,
+    )
+    for i in range(count):
+        equity = Decimal("50000") - Decimal(i * 10)
+        yield AccountSnapshot(
+            account_id=account_id,
+            timestamp=start + timedelta(milliseconds=300 * i * 30),
+            equity=equity,
+            balance=Decimal("50000"),
+            high_water_mark=Decimal("50000"),
+            daily_pnl=equity - Decimal("50000"),
+            starting_balance=Decimal("50000"),
+            open_positions=[position],
+        )
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.5
+        return self.now
+
+
+def test_transitions_match_per_snapshot_evaluation():
+    """Every status change of every rule is reported once, in stream order."""
+    engine = RuleEngine(_rules())
+    snapshots = list(_stream())
+
+    transitions = ReplayRunner(engine).replay(snapshots)
+
+    expected = []
+    previous = {}
+    for index, snapshot in enumerate(snapshots):
+        for name, state in engine.evaluate(snapshot).rule_states.items():
+            if previous.get(name) != state.status:
+                expected.append((index, name, previous.get(name), state.status))
+                previous[name] = state.status
+    assert [(t.index, t.rule_name, t.previous, t.current) for t in transitions] == expected
+    assert [t.current for t in transitions if t.rule_name == "trading_hours"] == [
+        RuleStatus.SAFE,
+        RuleStatus.CAUTION,
+        RuleStatus.CRITICAL,
+        RuleStatus.VIOLATED,
+    ]
+    assert transitions[-1].timestamp <= snapshots[-1].timestamp
+
+
+def test_replay_is_deterministic_and_reports_throughput():
+    """Replaying the same recording twice gives the same transitions; stats use the timer."""
+    engine = RuleEngine(_rules())
+    first = ReplayRunner(engine, timer=FakeTimer())
+    second = ReplayRunner(engine, timer=FakeTimer())
+
+    assert first.replay(_stream()) == second.replay(_stream())
+    assert first.stats.snapshots == 400
+    assert first.stats.accounts == 1
+    assert first.stats.transitions == second.stats.transitions > 0
+    assert first.stats.elapsed_seconds > 0
+    assert first.stats.snapshots_per_second == 400 / first.stats.elapsed_seconds
+    assert first.stats.replayed_seconds == 399 * 9
+
+
+def test_ndjson_round_trip():
+    """Recorded NDJSON replays like the original snapshots."""
+    engine = RuleEngine(_rules())
+    buffer = io.StringIO()
+    assert write_ndjson(_stream(50), buffer) == 50
+    buffer.seek(0)
+
+    assert ReplayRunner(engine).replay(read_ndjson(buffer)) == ReplayRunner(engine).replay(
+        _stream(50)
+    )
+
+
+def test_out_of_order_snapshots_are_reported_not_raised():
+    """A clock-skewed tick is evaluated and reported; order is tracked per account."""
+    engine = RuleEngine(_rules())
+    a = list(_stream(4, "acct-a"))
+    b = list(_stream(4, "acct-b"))
+    # b starts a little later; then an old tick of a arrives late
+    b = [s.model_copy(update={"timestamp": s.timestamp + timedelta(seconds=1)}) for s in b]
+    stream = [a[0], a[1], b[0], a[2], b[1], a[1], b[2], a[3], b[3]]
+
+    runner = ReplayRunner(engine)
+    runner.replay(stream)
+
+    assert runner.stats.snapshots == len(stream)
+    (late,) = runner.stats.out_of_order
+    assert (late.index, late.account_id) == (5, "acct-a")
+    assert late.timestamp == a[1].timestamp
+    assert late.latest_timestamp == a[2].timestamp
+    assert runner.stats.first_timestamp == a[0].timestamp
+    assert runner.stats.last_timestamp == b[3].timestamp
+
+
+def test_interleaved_accounts_and_table_rows():
+    """Accounts are tracked separately; table rows convert to snapshots."""
+    engine = RuleEngine(_rules())
+    a = list(_stream(20, "acct-a"))
+    b = list(_stream(20, "acct-b"))
+    interleaved = [s for pair in zip(a, b) for s in pair]
+
+    runner = ReplayRunner(engine)
+    transitions = runner.replay(interleaved)
+
+    assert runner.stats.accounts == 2
+    assert {t.account_id for t in transitions if t.previous is None} == {"acct-a", "acct-b"}
+
+    row = {
+        "account_id": "acct-a",
+        "timestamp": a[0].timestamp,
+        "equity": 49900.0,
+        "balance": 50000.0,
+        "realized_pnl": 0,
+        "unrealized_pnl": -100.0,
+        "high_water_mark": 50000.0,
+        "daily_pnl": -100.0,
+        "open_positions": [a[0].open_positions[0].model_dump(mode="json")],
+    }
+    snapshot = snapshot_from_row(row, Decimal("50000"))
+    assert snapshot.equity == Decimal("49900.0")
+    assert snapshot.open_positions[0].symbol == "ES"
@@ -0,0 +1,133 @@
+"""
+Unit tests for compiled rule plans.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime
+from pydantic import ValidationError
+
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot
+from rules_engine.plan import compile_rules, clear_plan_cache, plan_cache_size
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    ConsistencyRule,
+    TradingHoursRule,
+    ProfitTargetRule,
+    RuleStatus,
+)
+
+
+def _topstep_like_rules() -> FirmRules:
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True,
+            max_drawdown_percent=Decimal("4"),
+            include_unrealized_pnl=False,
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True,
+            max_loss_amount=Decimal("1000"),
+            reset_time="16:00",
+        ),
+        trading_hours=TradingHoursRule(
+            enabled=True,
+            forced_close_time="15:10",
+            timezone="America/Chicago",
+        ),
+        profit_target=ProfitTargetRule(enabled=False, target_amount=Decimal("3000")),
+    )
+
+
+def test_engines_with_identical_rules_share_one_plan():
+    """Two engines built from equal (but distinct) FirmRules share a plan."""
+    first = RuleEngine(_topstep_like_rules())
+    second = RuleEngine(_topstep_like_rules())
+
+    assert first.plan is second.plan
+
+
+def test_different_rules_get_different_plans():
+    """A change to any rule constant produces a different plan."""
+    rules = _topstep_like_rules()
+    other = _topstep_like_rules()
+    other.daily_loss_limit.max_loss_amount = Decimal("2000")
+
+    assert compile_rules(rules).key != compile_rules(other).key
+
+
+def test_plan_orders_enabled_rules_and_precomputes_constants():
+    """Only enabled rules are scheduled; constants are converted at compile time."""
+    plan = compile_rules(_topstep_like_rules())
+
+    assert [compiled.name for compiled in plan.rules] == [
+        "trailing_drawdown",
+        "daily_loss_limit",
+        "trading_hours",
+    ]
+    assert plan.get("daily_loss_limit").critical_loss == Decimal("950")
+    assert plan.get("daily_loss_limit").caution_loss == Decimal("800")
+    assert plan.get("trailing_drawdown").max_drawdown_percent == Decimal("4")
+    assert plan.get("trading_hours").close_hour == 15
+    assert plan.get("trading_hours").close_minute == 10
+    # Disabled rules are compiled but not scheduled
+    assert plan.get("profit_target") is not None
+    assert plan.get("profit_target").enabled is False
+
+
+def test_plan_is_immutable_and_isolated_from_rule_mutation():
+    """Mutating the source FirmRules does not change an existing plan."""
+    rules = _topstep_like_rules()
+    engine = RuleEngine(rules)
+    plan = engine.plan
+
+    rules.daily_loss_limit.max_loss_amount = Decimal("5000")
+
+    assert plan.get("daily_loss_limit").max_loss == Decimal("1000")
+    with pytest.raises(ValidationError):
+        plan.key = "changed"
+
+    # Reassigning the rules recompiles the plan
+    engine.rules = rules
+    assert engine.plan.get("daily_loss_limit").max_loss == Decimal("5000")
+
+
+def test_plan_cache_can_be_cleared():
+    """Clearing the cache drops plans; recompiling repopulates it."""
+    compile_rules(_topstep_like_rules())
+    assert plan_cache_size() >= 1
+
+    clear_plan_cache()
+    assert plan_cache_size() == 0
+
+    compile_rules(_topstep_like_rules())
+    assert plan_cache_size() == 1
+
+
+def test_consistency_calculator_reads_snapshot_history():
+    """Calling the consistency calculator directly uses the snapshot's own history."""
+    engine = RuleEngine(
+        FirmRules(
+            consistency_rule=ConsistencyRule(
+                enabled=True, max_single_day_percent=Decimal("50")
+            )
+        )
+    )
+    snapshot = AccountSnapshot(
+        account_id="plan-consistency",
+        timestamp=datetime.now(),
+        equity=Decimal("51000"),
+        balance=Decimal("51000"),
+        high_water_mark=Decimal("51000"),
+        starting_balance=Decimal("50000"),
+        realized_pnl=Decimal("1000"),
+        daily_pnl_history={"2026-01-05": Decimal("800"), "2026-01-06": Decimal("200")},
+    )
+
+    rule_state = engine._calculate_consistency(snapshot)
+
+    assert rule_state.status == RuleStatus.VIOLATED
+    assert rule_state.current_value == Decimal("80")
@@ -0,0 +1,115 @@
+"""
+Unit tests for the trading-session calendar and the trading-hours rule.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+import pytz
+
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import FirmRules, RuleStatus, TradingHoursRule
+from rules_engine.sessions import SessionCalendar, session_calendar, to_epoch_seconds
+
+
+def _epoch(timezone: str, *args) -> int:
+    return to_epoch_seconds(pytz.timezone(timezone).localize(datetime(*args)))
+
+
+def test_forced_close_tracks_dst():
+    """The UTC instant of a 16:59 ET close shifts by an hour across DST."""
+    calendar = SessionCalendar("America/New_York", "16:59")
+
+    winter = calendar.forced_close(to_epoch_seconds(datetime(2026, 1, 5, 15, 0)))
+    summer = calendar.forced_close(to_epoch_seconds(datetime(2026, 7, 6, 15, 0)))
+
+    assert winter == to_epoch_seconds(datetime(2026, 1, 5, 21, 59))
+    assert summer == to_epoch_seconds(datetime(2026, 7, 6, 20, 59))
+
+
+def test_dst_transition_days():
+    """Closes on the spring-forward and fall-back dates are correct local times."""
+    calendar = SessionCalendar("America/Chicago", "15:10")
+
+    spring = _epoch("America/Chicago", 2026, 3, 8, 15, 10)
+    fall = _epoch("America/Chicago", 2026, 11, 1, 15, 10)
+
+    assert calendar.forced_close(spring - 3600) == spring
+    assert calendar.forced_close(fall - 3600) == fall
+
+
+def test_local_date_boundary():
+    """Just after local midnight belongs to the new local date, not the UTC one."""
+    calendar = SessionCalendar("America/New_York", "16:59")
+    # 2026-01-06 04:30 UTC is 2026-01-05 23:30 ET
+    epoch = to_epoch_seconds(datetime(2026, 1, 6, 4, 30))
+
+    assert calendar.forced_close(epoch) == _epoch("America/New_York", 2026, 1, 5, 16, 59)
+    assert calendar.next_forced_close(epoch) == _epoch("America/New_York", 2026, 1, 6, 16, 59)
+
+
+def test_calendar_spans_years():
+    """Lookups before and after the first computed year extend the table."""
+    calendar = SessionCalendar("America/New_York", "16:59")
+    calendar.forced_close(to_epoch_seconds(datetime(2026, 6, 1)))
+
+    new_year = _epoch("America/New_York", 2026, 12, 31, 17, 0)
+    assert calendar.next_forced_close(new_year) == _epoch(
+        "America/New_York", 2027, 1, 1, 16, 59
+    )
+    assert calendar.forced_close(_epoch("America/New_York", 2025, 12, 31, 9, 0)) == _epoch(
+        "America/New_York", 2025, 12, 31, 16, 59
+    )
+
+
+def test_calendars_are_shared():
+    """Accounts with the same session share one calendar."""
+    assert session_calendar("America/New_York", "16:59") is session_calendar(
+        "America/New_York", "16:59"
+    )
+
+
+def _snapshot(timestamp: datetime, has_position: bool = True) -> AccountSnapshot:
+    return AccountSnapshot(
+        account_id="acct-1",
+        timestamp=timestamp,
+        equity=Decimal("50000"),
+        balance=Decimal("50000"),
+        high_water_mark=Decimal("50000"),
+        daily_pnl=Decimal("0"),
+        starting_balance=Decimal("50000"),
+        open_positions=[
+            PositionSnapshot(
+                symbol="ES",
+                quantity=1,
+                avg_price=Decimal("5000"),
+                current_price=Decimal("5000"),
+                unrealized_pnl=Decimal("0"),
+                opened_at=timestamp,
+            )
+        ] if has_position else [],
+    )
+
+
+@pytest.mark.parametrize(
+    "timestamp,has_position,expected",
+    [
+        (datetime(2026, 1, 5, 21, 0), True, RuleStatus.SAFE),
+        (datetime(2026, 1, 5, 21, 40), True, RuleStatus.CAUTION),
+        (datetime(2026, 1, 5, 21, 50), True, RuleStatus.CRITICAL),
+        (datetime(2026, 1, 5, 21, 59), True, RuleStatus.VIOLATED),
+        (datetime(2026, 1, 5, 21, 59), False, RuleStatus.SAFE),
+        (pytz.utc.localize(datetime(2026, 7, 6, 20, 50)), True, RuleStatus.CRITICAL),
+    ],
+)
+def test_trading_hours_uses_snapshot_timestamp(timestamp, has_position, expected):
+    """Status is determined by the snapshot timestamp (naive = UTC)."""
+    engine = RuleEngine(
+        FirmRules(trading_hours=TradingHoursRule(enabled=True, forced_close_time="16:59"))
+    )
+
+    state = engine.evaluate(_snapshot(timestamp, has_position)).rule_states["trading_hours"]
+
+    assert state.status == expected
@@ -0,0 +1,140 @@
+"""
+Unit tests for Monte Carlo risk of ruin.
+"""
+
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from datetime import datetime
+
+np = pytest.importorskip("numpy")
+
+from rules_engine.engine import RuleEngine
+from rules_engine.interface import AccountSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    MAERule,
+    ProfitTargetRule,
+)
+from rules_engine.simulation import (
+    PnlDistribution,
+    simulate_accounts,
+    simulate_risk_of_ruin,
+)
+
+
+def _engine() -> RuleEngine:
+    return RuleEngine(
+        FirmRules(
+            trailing_drawdown=TrailingDrawdownRule(
+                enabled=True, max_drawdown_percent=Decimal("4")
+            ),
+            daily_loss_limit=DailyLossLimitRule(
+                enabled=True, max_loss_amount=Decimal("1500"), reset_time="16:00"
+            ),
+            mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("2")),
+            profit_target=ProfitTargetRule(enabled=True, target_amount=Decimal("3000")),
+        )
+    )
+
+
+def _snapshot(**update) -> AccountSnapshot:
+    snapshot = AccountSnapshot(
+        account_id="acct-1",
+        timestamp=datetime(2026, 1, 5, 14, 0, 0),
+        equity=Decimal("50000"),
+        balance=Decimal("50000"),
+        high_water_mark=Decimal("50000"),
+        daily_pnl=Decimal("0"),
+        starting_balance=Decimal("50000"),
+    )
+    return snapshot.model_copy(update=update)
+
+
+def test_constant_winning_days_reach_target():
+    """$500 every day reaches the $3000 target on day 6."""
+    result = simulate_risk_of_ruin(
+        _engine(), _snapshot(), PnlDistribution(mean=500), paths=100, seed=1
+    )
+
+    assert result.target_probability == 1.0
+    assert result.ruin_probability == 0.0
+    assert result.mean_days_to_target == 6
+
+
+def test_constant_losing_days_breach_trailing_drawdown():
+    """-$600 a day stays inside the daily limit and breaches trailing ($2000) on day 4."""
+    result = simulate_risk_of_ruin(
+        _engine(), _snapshot(), PnlDistribution(mean=-600), paths=100, seed=1
+    )
+
+    assert result.ruin_probability == 1.0
+    assert result.breach_probabilities["trailing_drawdown"] == 1.0
+    assert result.mean_days_to_ruin == 4
+
+
+def test_per_trade_losses_breach_daily_limit_and_mae():
+    """Trades accumulate into the daily limit; one large loss is an MAE breach."""
+    engine = _engine()
+
+    daily = simulate_risk_of_ruin(
+        engine,
+        _snapshot(daily_pnl=Decimal("-700")),
+        PnlDistribution(per="trade", mean=-300, trades_per_day=3),
+        paths=50,
+    )
+    assert daily.breach_probabilities["daily_loss_limit"] == 1.0
+    assert daily.mean_days_to_ruin == 1
+
+    mae = simulate_risk_of_ruin(
+        engine, _snapshot(), PnlDistribution(samples=[-1000.0]), paths=50
+    )
+    assert mae.breach_probabilities["mae"] == 1.0
+
+
+def test_empirical_history_and_unresolved_paths():
+    """Resampled history that never moves far leaves paths unresolved."""
+    distribution = PnlDistribution.from_history(
+        {"2026-01-02": Decimal("10"), "2026-01-03": Decimal("-10")}
+    )
+    result = simulate_risk_of_ruin(
+        _engine(), _snapshot(), distribution, paths=200, horizon_days=10, seed=3
+    )
+
+    assert result.unresolved_probability == 1.0
+    assert result.mean_days_to_ruin is None
+
+
+def test_already_violated_account_is_ruined():
+    """An account already past a limit needs no simulation."""
+    result = simulate_risk_of_ruin(
+        _engine(),
+        _snapshot(daily_pnl=Decimal("-1500")),
+        PnlDistribution(mean=1000),
+        paths=10,
+    )
+
+    assert result.ruin_probability == 1.0
+    assert result.breach_probabilities["daily_loss_limit"] == 1.0
+
+
+def test_process_pool_matches_in_process():
+    """Results depend on seed and chunks only, not on where chunks run."""
+    jobs = [
+        (_engine(), _snapshot(account_id=f"acct-{i}"), PnlDistribution(mean=50, std=700))
+        for i in range(3)
+    ]
+
+    local = simulate_accounts(jobs, paths=4000, seed=42, chunks=4)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        pooled = simulate_accounts(jobs, paths=4000, seed=42, executor=executor, chunks=4)
+
+    assert pooled == local
+    for result in local:
+        total = result.ruin_probability + result.target_probability + result.unresolved_probability
+        assert total == pytest.approx(1.0)
+        assert 0 < result.ruin_probability < 1
+    # Accounts get independent streams
+    assert local[0].ruin_probability != local[1].ruin_probability
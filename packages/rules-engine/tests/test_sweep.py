@@ -0,0 +1,257 @@
+"""
+Unit tests for vectorized what-if price sweeps.
+
+Each grid point must produce the same statuses as evaluating the moved
+snapshot with FixedPointRuleEngine.
+"""
+
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+np = pytest.importorskip("numpy")
+
+from rules_engine.engine import RuleEngine
+from rules_engine.fixed_point import FixedPointRuleEngine
+from rules_engine.interface import AccountSnapshot, PositionSnapshot
+from rules_engine.models import (
+    FirmRules,
+    TrailingDrawdownRule,
+    DailyLossLimitRule,
+    OverallMaxLossRule,
+    MAERule,
+    ProfitTargetRule,
+    RuleStatus,
+)
+from rules_engine.sweep import STATUS_CODES, price_sweep, with_tick_distances
+from tests.test_evaluate_many import _rules as _all_rules, _snapshot as _account
+
+
+def _rules() -> FirmRules:
+    return FirmRules(
+        trailing_drawdown=TrailingDrawdownRule(
+            enabled=True, max_drawdown_percent=Decimal("4"), include_unrealized_pnl=True
+        ),
+        daily_loss_limit=DailyLossLimitRule(
+            enabled=True, max_loss_amount=Decimal("1000"), reset_time="16:00"
+        ),
+        overall_max_loss=OverallMaxLossRule(
+            enabled=True, max_loss_amount=Decimal("2000"), from_starting_balance=True
+        ),
+        mae_rule=MAERule(enabled=True, max_adverse_excursion_percent=Decimal("2")),
+        profit_target=ProfitTargetRule(enabled=True, target_amount=Decimal("3000")),
+    )
+
+
+POSITIONS = [
+    # (symbol, quantity, tick_size, point_value)
+    ("ES", 2, Decimal("0.25"), Decimal("50")),
+    ("NQ", -1, Decimal("0.25"), Decimal("20")),
+]
+
+
+def _snapshot() -> AccountSnapshot:
+    return AccountSnapshot(
+        account_id="acct-1",
+        timestamp=datetime(2026, 1, 5, 14, 0, 0),
+        equity=Decimal("50150"),
+        balance=Decimal("50300"),
+        realized_pnl=Decimal("300"),
+        unrealized_pnl=Decimal("-150"),
+        high_water_mark=Decimal("50600"),
+        daily_pnl=Decimal("-150"),
+        starting_balance=Decimal("50000"),
+        open_positions=[
+            PositionSnapshot(
+                symbol=symbol,
+                quantity=quantity,
+                avg_price=Decimal("5000"),
+                current_price=Decimal("5000"),
+                unrealized_pnl=Decimal("-75"),
+                opened_at=datetime(2026, 1, 5, 13, 0, 0),
+                peak_unrealized_loss=Decimal("-200"),
+            )
+            for symbol, quantity, _, _ in POSITIONS
+        ],
+    )
+
+
+def _moved(snapshot: AccountSnapshot, ticks, daily_pnl_moves: bool = False) -> AccountSnapshot:
+    """The snapshot after moving each position's price by ticks[i]."""
+    positions = []
+    delta = Decimal("0")
+    for position, move, (_, _, tick_size, point_value) in zip(
+        snapshot.open_positions, ticks, POSITIONS
+    ):
+        change = Decimal(int(move)) * tick_size * point_value * position.quantity
+        delta += change
+        unrealized = position.unrealized_pnl + change
+        positions.append(
+            position.model_copy(
+                update={
+                    "unrealized_pnl": unrealized,
+                    "peak_unrealized_loss": min(position.peak_unrealized_loss, unrealized),
+                }
+            )
+        )
+    return snapshot.model_copy(
+        update={
+            "equity": snapshot.equity + delta,
+            "unrealized_pnl": snapshot.unrealized_pnl + delta,
+            "daily_pnl": snapshot.daily_pnl + (delta if daily_pnl_moves else 0),
+            "open_positions": positions,
+        }
+    )
+
+
+def _sweep(engine, snapshot, moves, daily_pnl_moves: bool = False):
+    return price_sweep(
+        engine,
+        snapshot,
+        moves,
+        tick_size=[tick_size for _, _, tick_size, _ in POSITIONS],
+        point_value=[point_value for _, _, _, point_value in POSITIONS],
+        daily_pnl_includes_unrealized=daily_pnl_moves,
+    )
+
+
+@pytest.mark.parametrize("daily_pnl_moves", [False, True])
+def test_sweep_matches_per_point_evaluation(daily_pnl_moves):
+    """Every grid point has the statuses of evaluating the moved snapshot."""
+    engine = FixedPointRuleEngine(_rules())
+    snapshot = _snapshot()
+    grid = np.array([(es, nq) for es in range(-60, 61, 4) for nq in range(-80, 81, 20)])
+
+    sweep = _sweep(engine, snapshot, grid, daily_pnl_moves)
+
+    assert len(sweep) == len(grid)
+    if not daily_pnl_moves:
+        # Realized-only daily loss does not move with price
+        assert len(set(sweep.status["daily_loss_limit"])) == 1
+    for index, ticks in enumerate(grid):
+        result = engine.evaluate(_moved(snapshot, ticks, daily_pnl_moves))
+        for rule_name, codes in sweep.status.items():
+            assert STATUS_CODES[codes[index]] == result.rule_states[rule_name].status, (
+                rule_name,
+                ticks,
+            )
+            assert sweep.remaining_buffer[rule_name][index] == pytest.approx(
+                float(result.rule_states[rule_name].remaining_buffer), abs=0.01
+            )
+
+
+def test_engines_and_sweep_agree_on_statuses():
+    """Decimal, fixed-point and zero-move sweep statuses agree, including on band edges."""
+    decimal_engine = RuleEngine(_all_rules())
+    fixed_engine = FixedPointRuleEngine(_all_rules())
+    snapshots = [_account(index) for index in range(24)]
+    # Exactly on and one cent past the cuts: daily loss 80/95/100% of $1000,
+    # trailing drawdown buffer 5%/20% of $2525, profit 70/90% of $3000
+    edges = [
+        {"daily_pnl": Decimal(loss)}
+        for loss in ("-800", "-799.99", "-950", "-950.01", "-1000", "-999.99")
+    ] + [
+        {"equity": Decimal(equity)}
+        for equity in ("48101.25", "48101.26", "48480", "48480.01", "47975")
+    ] + [
+        {"realized_pnl": Decimal(pnl)}
+        for pnl in ("2125", "2124.99", "2725", "2725.01")
+    ]
+    snapshots += [_account(3).model_copy(update=update) for update in edges]
+
+    for snapshot in snapshots:
+        expected = {
+            name: state.status
+            for name, state in decimal_engine.evaluate(snapshot).rule_states.items()
+        }
+        fixed = {
+            name: state.status
+            for name, state in fixed_engine.evaluate(snapshot).rule_states.items()
+        }
+        assert fixed == expected, snapshot.account_id
+
+        sweep = price_sweep(fixed_engine, snapshot, [0])
+        assert sweep.status
+        for name in sweep.status:
+            assert sweep.statuses(name)[0] == expected[name], (snapshot.account_id, name)
+
+
+def test_one_dimensional_grid_moves_all_positions():
+    """A 1-D grid applies the same tick move to every position."""
+    engine = FixedPointRuleEngine(_rules())
+    sweep = _sweep(engine, _snapshot(), np.arange(-10, 11))
+
+    assert sweep.moves.shape == (21, 2)
+    # +1 tick: ES long 2 * $12.50, NQ short 1 * $5.00
+    assert sweep.pnl_delta[11] - sweep.pnl_delta[10] == 2000
+
+
+def test_ticks_to_violation_and_distance_fill():
+    """The nearest violating grid move is reported and filled into DistanceMetric.ticks."""
+    engine = FixedPointRuleEngine(_rules())
+    snapshot = _snapshot()
+    sweep = _sweep(engine, snapshot, np.arange(-200, 201))
+
+    # Trailing drawdown: $50150 - $48576 buffer = $1574, losing $20 per tick
+    assert sweep.ticks_to_violation("trailing_drawdown") == 79
+    assert sweep.ticks_to_violation("profit_target") is None
+
+    result = with_tick_distances(engine.evaluate(snapshot), sweep)
+    assert result.rule_states["trailing_drawdown"].distance_to_violation.ticks == Decimal(79)
+    # Realized-only daily loss: no price move violates it
+    assert sweep.ticks_to_violation("daily_loss_limit") is None
+    assert result.rule_states["daily_loss_limit"].distance_to_violation.ticks is None
+    assert result.rule_states["profit_target"].distance_to_violation.ticks is None
+
+    opt_in = _sweep(engine, snapshot, np.arange(-200, 201), daily_pnl_moves=True)
+    result = with_tick_distances(engine.evaluate(snapshot), opt_in)
+    assert result.rule_states["daily_loss_limit"].distance_to_violation.ticks == Decimal(
+        opt_in.ticks_to_violation("daily_loss_limit")
+    )
+
+
+def test_distance_fill_populates_contracts():
+    """contracts: largest tick value ($12.50 ES) over the ticks to violation."""
+    engine = FixedPointRuleEngine(_rules())
+    snapshot = _snapshot()
+    sweep = _sweep(engine, snapshot, np.arange(-200, 201))
+
+    result = with_tick_distances(engine.evaluate(snapshot), sweep)
+
+    trailing = result.rule_states["trailing_drawdown"]
+    dollars = trailing.distance_to_violation.dollars or trailing.remaining_buffer
+    assert trailing.distance_to_violation.contracts == int(dollars * 100) // (79 * 1250)
+    assert trailing.distance_to_violation.contracts >= 1
+    assert result.rule_states["profit_target"].distance_to_violation.contracts is None
+    assert sweep.contracts_for(Decimal("100"), 0) is None
+
+
+def test_flat_account_sweep_is_constant():
+    """Without open positions every grid point has the current state."""
+    engine = FixedPointRuleEngine(_rules())
+    snapshot = _snapshot().model_copy(update={"open_positions": []})
+
+    sweep = price_sweep(engine, snapshot, np.arange(-5, 6), Decimal("0.25"), Decimal("50"))
+
+    result = engine.evaluate(snapshot)
+    for rule_name in sweep.status:
+        assert set(sweep.statuses(rule_name)) == {result.rule_states[rule_name].status}
+
+
+def test_mismatched_grid_shape_is_rejected():
+    """A 2-D grid must have one column per open position."""
+    engine = FixedPointRuleEngine(_rules())
+
+    with pytest.raises(ValueError):
+        price_sweep(engine, _snapshot(), np.zeros((5, 3)), Decimal("0.25"), Decimal("50"))
+
+
+def test_instrument_specs_default_from_registry():
+    """Without tick_size/point_value the instrument registry is used."""
+    engine = FixedPointRuleEngine(_rules())
+    moves = np.arange(-20, 21)
+
+    assert np.array_equal(
+        price_sweep(engine, _snapshot(), moves).pnl_delta,
+        _sweep(engine, _snapshot(), moves).pnl_delta,
+    )
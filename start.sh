@@ -55,7 +55,7 @@ if [ ! -f ".deps_installed" ]; then
     
     # Install rules engine
     cd ../../packages/rules-engine
-    pip install -e .
+    pip install -e ".[numpy]"
     cd ../../apps/backend
     
     touch .deps_installed